@@ -29,6 +29,7 @@ from config import (
     ensure_data_directory,
     LOGGING_CONFIG
 )
+from data_persistence import iter_interest_records, load_google_trends_data
 
 # Set up logging
 logging.basicConfig(
@@ -202,7 +203,7 @@ class DataCleaner:
         interest_data = google_data.get('interest_over_time', {})
         for batch_key, batch_data in interest_data.items():
             if isinstance(batch_data, dict) and 'data' in batch_data:
-                for data_point in batch_data['data']:
+                for data_point in iter_interest_records(batch_data['data']):
                     # Clean and standardize each data point
                     cleaned_point = {
                         'date': data_point.get('date'),
@@ -693,8 +694,7 @@ def load_raw_data() -> tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]],
     
     # Load Google Trends data
     try:
-        with open(DATA_PATHS['raw_google_data'], 'r', encoding='utf-8') as f:
-            google_data = json.load(f)
+        google_data = load_google_trends_data()
         logger.info(f"✅ Loaded Google Trends data from {DATA_PATHS['raw_google_data']}")
     except FileNotFoundError:
         logger.warning(f"⚠️  Google Trends data not found: {DATA_PATHS['raw_google_data']}")
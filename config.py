@@ -43,6 +43,17 @@ REDDIT_SETTINGS = {
     'sort': 'hot',          # Options: 'hot', 'new', 'top', 'rising'
     'limit': MAX_REDDIT_POSTS
 }
+REDDIT_MAX_WORKERS = 8            # Parallel keyword searches sharing one Reddit client
+REDDIT_REQUESTS_PER_MINUTE = 100  # Reddit's OAuth request budget per client
+REDDIT_REQUEST_BURST = 60         # Requests allowed back-to-back before pacing kicks in
+REDDIT_MAX_RETRIES = 3            # Retries per request after a 429 (waits 1s, 2s, 4s... up to 60s)
+REDDIT_POST_CACHE_TTL = 23 * 3600  # Seconds to reuse an extracted post from the local cache
+# Search through Reddit's JSON API directly (app-only OAuth) instead of
+# building PRAW objects for every result; PRAW is still used as a fallback
+REDDIT_DIRECT_SEARCH = os.getenv('REDDIT_DIRECT_SEARCH', 'true').lower() == 'true'
+# Optional Pushshift-compatible search API (e.g. a PullPush mirror) used to find
+# post IDs in bulk; leave empty to search through Reddit's own search
+REDDIT_PUSHSHIFT_URL = os.getenv('REDDIT_PUSHSHIFT_URL', '')
 
 # ===== YOUTUBE API SETTINGS =====
 # YouTube Data API v3 credentials (get from Google Cloud Console)
@@ -79,6 +90,15 @@ TWITTER_SETTINGS = {
     'user_fields': ['username', 'name', 'verified', 'public_metrics'],
     'max_results': MAX_TWITTER_TWEETS
 }
+# Search the Twitter API before Nitter (spends API quota); off by default, so
+# collection goes straight to Nitter and the mock fallback
+TWITTER_USE_API = os.getenv('TWITTER_USE_API', 'false').lower() == 'true'
+TWITTER_MAX_WORKERS = 4  # Parallel keyword searches sharing one API client
+TWITTER_MAX_RETRIES = 3  # Retries per request after a 429
+TWITTER_AUTHOR_CACHE_SIZE = 50000  # Authors kept per collector before the cache is reset
+NITTER_MAX_WORKERS = 4  # Parallel keyword searches sharing one Nitter session
+# Save each keyword's first Nitter search page as debug_nitter_response_<keyword>.html
+NITTER_DEBUG_HTML = os.getenv('NITTER_DEBUG_HTML', 'false').lower() == 'true'
 
 # ===== TRENDING ANALYSIS SETTINGS =====
 TRENDING_CONFIG = {
@@ -98,13 +118,20 @@ TRENDING_CONFIG = {
 # ===== FILE PATHS =====
 # Paths for saving raw data (JSON files)
 DATA_PATHS = {
-    'raw_google_data': 'data/raw_google_trends.json',
+    'raw_google_data': 'data/raw_google_trends.jsonl.zst',
+    'legacy_google_data': 'data/raw_google_trends.json',
     'raw_reddit_data': 'data/raw_reddit_data.json',
+    'reddit_posts_stream': 'data/raw_reddit_posts.jsonl',
+    'reddit_collection_info': 'data/raw_reddit_collection_info.json',
     'raw_youtube_data': 'data/raw_youtube_data.json',
     'raw_twitter_data': 'data/raw_twitter_data.json',
+    'twitter_tweets_stream': 'data/raw_twitter_tweets.jsonl.zst',
     'raw_upwork_data': 'data/raw_upwork_data.json',
     'cleaned_data': 'data/cleaned_data.json',
     'trending_analysis': 'data/trending_analysis.json',
+    'google_trends_cache': 'data/google_trends_cache.sqlite',
+    'reddit_cache': 'data/reddit_post_cache.sqlite',
+    'upwork_cache': 'data/upwork_search_cache.sqlite',
     'data_directory': 'data/'
 }
 
@@ -115,6 +142,8 @@ API_DELAYS = {
     'reddit': 2,          # Delay between Reddit requests
     'youtube': 1,         # Delay between YouTube API requests
     'twitter': 1,         # Delay between Twitter API requests
+    'nitter': 2,          # Delay between requests to the same Nitter instance
+    'upwork': 2,          # Delay between direct Upwork search page requests
 }
 
 # ===== GOOGLE TRENDS COLLECTION MODES =====
@@ -122,6 +151,15 @@ API_DELAYS = {
 GOOGLE_TRENDS_COLLECT_RELATED_QUERIES = False  # Disable related queries (causes timeouts)
 GOOGLE_TRENDS_COLLECT_REGIONAL_DATA = False    # Disable regional data (causes timeouts)
 GOOGLE_TRENDS_COLLECT_INTEREST_ONLY = True     # Only collect interest over time data
+GOOGLE_TRENDS_MAX_WORKERS = 4                  # Parallel per-keyword requests (keep low to stay under Google's rate limit)
+GOOGLE_TRENDS_CACHE_TTL = 3600                 # Seconds to reuse cached Google Trends responses
+GOOGLE_TRENDS_MAX_RETRIES = 5                  # Attempts per request on 429/5xx/timeouts
+GOOGLE_TRENDS_MAX_BACKOFF = 30                 # Upper bound in seconds for a single retry wait
+
+# ===== UPWORK COLLECTION =====
+UPWORK_MAX_WORKERS = 4                         # Parallel search page fetches (one Upwork host, keep low)
+UPWORK_CACHE_MAX_AGE = 2 * 24 * 3600           # Seconds to reuse cached Upwork search pages (0 always refetches)
+UPWORK_PARSE_PROCESS_MIN_PAGES = 8             # Fetched pages from which parsing uses worker processes (fewer: startup costs more than it saves)
 
 # ===== STREAMLIT DASHBOARD SETTINGS =====
 DASHBOARD_CONFIG = {
@@ -190,7 +228,6 @@ def ensure_data_directory():
     """
     Create data directory if it doesn't exist
     """
-    import os
     data_dir = DATA_PATHS['data_directory']
     if not os.path.exists(data_dir):
         os.makedirs(data_dir)
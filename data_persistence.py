@@ -5,24 +5,105 @@ Data Persistence Module
 Handles data storage with append functionality instead of overwriting.
 Maintains historical data while adding new collections.
 
+All functions take and return plain dicts with concrete annotations so the
+module can be compiled ahead of time with mypyc (`mypyc data_persistence.py`).
+The compiled extension is a drop-in replacement; this file stays the source.
+
 Author: Web Scraping Project
 """
 
+import io
 import json
 import os
 import logging
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Set, Any, Optional, Union
+
+import fastjsonschema
+import orjson
+import zstandard
+
 from config import DATA_PATHS, ensure_data_directory
 
 logger = logging.getLogger(__name__)
 
-def append_data_to_file(new_data: Dict[str, Any], file_path: str, data_key: str = 'data') -> bool:
+# Number of collection history entries kept per file
+MAX_COLLECTION_HISTORY = 50
+
+# Level 3 compresses faster than the disk writes, so .zst output costs no
+# wall-clock time while shrinking the JSON several times over
+ZSTD_LEVEL = 3
+
+# JSON Schemas for incoming collections, keyed by data_key.
+# Container defaults are filled in during validation, so the merge
+# functions can use direct key access on new_data.
+SCHEMAS = {
+    'jobs': {
+        'type': 'object',
+        'properties': {
+            'jobs': {
+                'type': 'array',
+                'items': {'type': 'object', 'required': ['id']},
+                'default': []
+            },
+            'metadata': {'type': 'object', 'default': {}}
+        }
+    },
+    'posts': {
+        'type': 'object',
+        'properties': {
+            'keyword_posts': {
+                'type': 'object',
+                'additionalProperties': {'type': 'array', 'items': {'type': 'object'}}
+            },
+            'posts': {'type': 'array', 'items': {'type': 'object'}, 'default': []},
+            'collection_info': {'type': 'object', 'default': {}}
+        }
+    },
+    'videos': {
+        'type': 'object',
+        'properties': {
+            'videos': {
+                'type': 'array',
+                'items': {'type': 'object', 'required': ['video_id']},
+                'default': []
+            },
+            'comments': {'type': 'array', 'default': []},
+            'collection_info': {'type': 'object', 'default': {}}
+        }
+    },
+    'tweets': {
+        'type': 'object',
+        'properties': {
+            'tweets': {'type': 'array', 'items': {'type': 'object'}, 'default': []}
+        }
+    },
+    'interest_over_time': {
+        'type': 'object',
+        'properties': {
+            'interest_over_time': {'type': 'object', 'default': {}},
+            'related_queries': {'type': 'object', 'default': {}},
+            'collection_info': {'type': 'object', 'default': {}}
+        }
+    }
+}
+
+VALIDATORS = {data_key: fastjsonschema.compile(schema) for data_key, schema in SCHEMAS.items()}
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the bounded history deque as a list, anything else as a string"""
+    if isinstance(obj, deque):
+        return list(obj)
+    return str(obj)
+
+def append_data_to_file(new_data: Union[Dict[str, Any], List[Any]], file_path: str, data_key: str = 'data') -> bool:
     """
     Append new data to existing file instead of overwriting
     
     Args:
-        new_data: New data to append
+        new_data: New data to append (a bare list of items, e.g. tweets, is
+            stored under data_key)
         file_path: Path to the data file
         data_key: Key under which the main data is stored
         
@@ -30,14 +111,28 @@ def append_data_to_file(new_data: Dict[str, Any], file_path: str, data_key: str
         bool: True if successful, False otherwise
     """
     try:
+        # Twitter collectors may hand over a bare list of tweets; any bare
+        # list is stored under its own data key, never relabelled
+        if isinstance(new_data, list):
+            new_data = {data_key: new_data, 'collection_timestamp': datetime.now().isoformat()}
+        
+        # Validate once up front; fills in missing containers
+        validator = VALIDATORS.get(data_key)
+        if validator:
+            validator(new_data)
+        
         ensure_data_directory()
         
         # Load existing data
-        existing_data = {}
+        existing_data: Dict[str, Any] = {}
         if os.path.exists(file_path):
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
+                    loaded_data = json.load(f)
+                # Older Twitter files may store a bare list of tweets
+                if isinstance(loaded_data, list):
+                    loaded_data = {data_key: loaded_data}
+                existing_data = loaded_data
                 logger.info(f"Loaded existing data from {file_path}")
             except json.JSONDecodeError:
                 logger.warning(f"Invalid JSON in {file_path}, starting fresh")
@@ -50,11 +145,14 @@ def append_data_to_file(new_data: Dict[str, Any], file_path: str, data_key: str
         
         # Save merged data
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(merged_data, f, indent=2, ensure_ascii=False, default=str)
+            json.dump(merged_data, f, indent=2, ensure_ascii=False, default=_json_default)
         
         logger.info(f"Successfully appended data to {file_path}")
         return True
         
+    except fastjsonschema.JsonSchemaException as e:
+        logger.error(f"Invalid data for {file_path}: {e.message}")
+        return False
     except Exception as e:
         logger.error(f"Error appending data to {file_path}: {e}")
         return False
@@ -74,16 +172,17 @@ def merge_data_by_type(existing_data: Dict[str, Any], new_data: Dict[str, Any],
     if not existing_data:
         # First time data - add collection history
         merged_data = new_data.copy()
-        merged_data['collection_history'] = [{
+        merged_data['collection_history'] = deque([{
             'timestamp': datetime.now().isoformat(),
             'items_added': get_data_count(new_data, data_key),
             'total_items': get_data_count(new_data, data_key)
-        }]
+        }], maxlen=MAX_COLLECTION_HISTORY)
         return merged_data
     
-    # Initialize collection history if not exists
-    if 'collection_history' not in existing_data:
-        existing_data['collection_history'] = []
+    # Load collection history into a bounded deque; appends evict the oldest entry
+    existing_data['collection_history'] = deque(
+        existing_data.get('collection_history', []), maxlen=MAX_COLLECTION_HISTORY
+    )
     
     # Merge based on data structure
     if data_key == 'jobs':  # Upwork jobs
@@ -111,28 +210,24 @@ def merge_data_by_type(existing_data: Dict[str, Any], new_data: Dict[str, Any],
         'keywords': new_data.get('metadata', {}).get('keywords_analyzed', [])
     })
     
-    # Keep only last 50 collection history entries
-    if len(merged_data['collection_history']) > 50:
-        merged_data['collection_history'] = merged_data['collection_history'][-50:]
-    
     return merged_data
 
 def merge_upwork_data(existing_data: Dict[str, Any], new_data: Dict[str, Any]) -> Dict[str, Any]:
     """Merge Upwork jobs data"""
     existing_jobs = existing_data.get('jobs', [])
-    new_jobs = new_data.get('jobs', [])
+    new_jobs = new_data['jobs']
     
     # Create set of existing job IDs to avoid duplicates
     existing_ids = {job.get('id', '') for job in existing_jobs}
     
     # Add only new jobs
-    unique_new_jobs = [job for job in new_jobs if job.get('id', '') not in existing_ids]
+    unique_new_jobs = [job for job in new_jobs if job['id'] not in existing_ids]
     
     merged_data = existing_data.copy()
     merged_data['jobs'] = existing_jobs + unique_new_jobs
     
     # Update metadata
-    merged_data['metadata'] = new_data.get('metadata', {})
+    merged_data['metadata'] = new_data['metadata']
     merged_data['metadata']['total_jobs'] = len(merged_data['jobs'])
     merged_data['metadata']['last_updated'] = datetime.now().isoformat()
     
@@ -148,7 +243,7 @@ def merge_reddit_data(existing_data: Dict[str, Any], new_data: Dict[str, Any]) -
         for keyword, posts in new_data['keyword_posts'].items():
             new_posts.extend(posts)
     else:
-        new_posts = new_data.get('posts', [])
+        new_posts = new_data['posts']
     
     if 'keyword_posts' in existing_data:
         existing_posts = []
@@ -157,11 +252,15 @@ def merge_reddit_data(existing_data: Dict[str, Any], new_data: Dict[str, Any]) -
     else:
         existing_posts = existing_data.get('posts', [])
     
-    # Create set of existing post IDs
-    existing_ids = {post.get('id', '') for post in existing_posts}
+    # Create set of existing (post ID, keyword) pairs; the same post may
+    # legitimately appear once per keyword that matched it
+    existing_ids = {(post.get('post_id', ''), post.get('search_keyword', '')) for post in existing_posts}
     
     # Add only new posts
-    unique_new_posts = [post for post in new_posts if post.get('id', '') not in existing_ids]
+    unique_new_posts = [
+        post for post in new_posts
+        if (post.get('post_id', ''), post.get('search_keyword', '')) not in existing_ids
+    ]
     
     merged_data = existing_data.copy()
     all_posts = existing_posts + unique_new_posts
@@ -170,7 +269,7 @@ def merge_reddit_data(existing_data: Dict[str, Any], new_data: Dict[str, Any]) -
     merged_data['posts'] = all_posts
     
     # Update collection info
-    merged_data['collection_info'] = new_data.get('collection_info', {})
+    merged_data['collection_info'] = new_data['collection_info']
     merged_data['collection_info']['total_posts'] = len(all_posts)
     merged_data['collection_info']['last_updated'] = datetime.now().isoformat()
     
@@ -180,24 +279,24 @@ def merge_reddit_data(existing_data: Dict[str, Any], new_data: Dict[str, Any]) -
 def merge_youtube_data(existing_data: Dict[str, Any], new_data: Dict[str, Any]) -> Dict[str, Any]:
     """Merge YouTube videos data"""
     existing_videos = existing_data.get('videos', [])
-    new_videos = new_data.get('videos', [])
+    new_videos = new_data['videos']
     
     # Create set of existing video IDs
     existing_ids = {video.get('video_id', '') for video in existing_videos}
     
     # Add only new videos
-    unique_new_videos = [video for video in new_videos if video.get('video_id', '') not in existing_ids]
+    unique_new_videos = [video for video in new_videos if video['video_id'] not in existing_ids]
     
     merged_data = existing_data.copy()
     merged_data['videos'] = existing_videos + unique_new_videos
     
     # Merge comments
     existing_comments = existing_data.get('comments', [])
-    new_comments = new_data.get('comments', [])
+    new_comments = new_data['comments']
     merged_data['comments'] = existing_comments + new_comments
     
     # Update collection info
-    merged_data['collection_info'] = new_data.get('collection_info', {})
+    merged_data['collection_info'] = new_data['collection_info']
     merged_data['collection_info']['total_videos'] = len(merged_data['videos'])
     merged_data['collection_info']['last_updated'] = datetime.now().isoformat()
     
@@ -211,39 +310,26 @@ def merge_youtube_data(existing_data: Dict[str, Any], new_data: Dict[str, Any])
     logger.info(f"Merged YouTube data: {len(existing_videos)} existing + {len(unique_new_videos)} new = {len(merged_data['videos'])} total")
     return merged_data
 
+def _tweet_key(tweet: Dict[str, Any]) -> str:
+    """Dedup key of a tweet: collectors write tweet_id, older files may carry id ('' if neither)"""
+    return str(tweet.get('tweet_id') or tweet.get('id') or '')
+
 def merge_twitter_data(existing_data: Dict[str, Any], new_data: Dict[str, Any]) -> Dict[str, Any]:
     """Merge Twitter data"""
-    # Handle both list and dict formats
-    if isinstance(new_data, list):
-        new_tweets = new_data
-        new_data = {'tweets': new_tweets, 'collection_timestamp': datetime.now().isoformat()}
-    else:
-        new_tweets = new_data.get('tweets', [])
-    
-    if isinstance(existing_data, list):
-        existing_tweets = existing_data
-        existing_data = {'tweets': existing_tweets}
-    else:
-        existing_tweets = existing_data.get('tweets', [])
+    new_tweets = new_data['tweets']
+    existing_tweets = existing_data.get('tweets', [])
     
     # Create set of existing tweet IDs (handle both dict and string formats)
-    existing_ids = set()
+    existing_ids: Set[str] = set()
     for tweet in existing_tweets:
         if isinstance(tweet, dict):
-            existing_ids.add(tweet.get('id', ''))
+            existing_ids.add(_tweet_key(tweet))
         elif isinstance(tweet, str):
             existing_ids.add(tweet)  # Use the string itself as ID
+    existing_ids.discard('')
     
-    # Add only new tweets (handle both dict and string formats)
-    unique_new_tweets = []
-    for tweet in new_tweets:
-        if isinstance(tweet, dict):
-            tweet_id = tweet.get('id', '')
-            if tweet_id not in existing_ids:
-                unique_new_tweets.append(tweet)
-        elif isinstance(tweet, str):
-            if tweet not in existing_ids:
-                unique_new_tweets.append(tweet)
+    # Add only new tweets (tweets without any ID can't be matched, keep them)
+    unique_new_tweets = [tweet for tweet in new_tweets if _tweet_key(tweet) not in existing_ids]
     
     merged_data = existing_data.copy()
     merged_data['tweets'] = existing_tweets + unique_new_tweets
@@ -259,7 +345,7 @@ def merge_google_trends_data(existing_data: Dict[str, Any], new_data: Dict[str,
     
     # Merge interest over time data
     existing_interest = existing_data.get('interest_over_time', {})
-    new_interest = new_data.get('interest_over_time', {})
+    new_interest = new_data['interest_over_time']
     
     merged_interest = existing_interest.copy()
     merged_interest.update(new_interest)
@@ -267,14 +353,14 @@ def merge_google_trends_data(existing_data: Dict[str, Any], new_data: Dict[str,
     
     # Merge related queries
     existing_queries = existing_data.get('related_queries', {})
-    new_queries = new_data.get('related_queries', {})
+    new_queries = new_data['related_queries']
     
     merged_queries = existing_queries.copy()
     merged_queries.update(new_queries)
     merged_data['related_queries'] = merged_queries
     
     # Update collection info
-    merged_data['collection_info'] = new_data.get('collection_info', {})
+    merged_data['collection_info'] = new_data['collection_info']
     merged_data['collection_info']['last_updated'] = datetime.now().isoformat()
     
     logger.info(f"Merged Google Trends data: {len(merged_interest)} interest batches, {len(merged_queries)} query sets")
@@ -298,14 +384,88 @@ def get_data_count(data: Dict[str, Any], data_key: str) -> int:
     elif data_key == 'videos':
         return len(data.get('videos', []))
     elif data_key == 'tweets':
-        if isinstance(data, list):
-            return len(data)
         return len(data.get('tweets', []))
     elif data_key == 'interest_over_time':
         return len(data.get('interest_over_time', {}))
     else:
         return 1
 
+def iter_interest_records(interest_data: Union[Dict[str, Any], List[Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield Google Trends interest data as one record per date
+    
+    Interest data is stored column-wise as {'index': [dates], 'columns':
+    {keyword: [values]}}; older files hold a list of row records, which
+    are passed through unchanged.
+    """
+    if isinstance(interest_data, list):
+        yield from interest_data
+        return
+    
+    columns = interest_data.get('columns', {})
+    keywords = list(columns)
+    for date, *values in zip(interest_data.get('index', []), *columns.values()):
+        record: Dict[str, Any] = {'date': date}
+        record.update(zip(keywords, values))
+        yield record
+
+def append_jsonl_record(record: Dict[str, Any], file_path: str) -> None:
+    """
+    Append a record to a JSON Lines file without rewriting earlier lines
+    
+    For a .zst path each record is written as its own Zstandard frame;
+    concatenated frames form a valid stream, so appends stay cheap.
+    """
+    ensure_data_directory()
+    line = orjson.dumps(
+        record,
+        default=_json_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ) + b'\n'
+    if file_path.endswith('.zst'):
+        line = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(line)
+    with open(file_path, 'ab') as f:
+        f.write(line)
+
+def iter_jsonl_records(file_path: str) -> Iterator[Dict[str, Any]]:
+    """Yield each record of a (optionally .zst compressed) JSON Lines file"""
+    with open(file_path, 'rb') as f:
+        lines: Any = f
+        if file_path.endswith('.zst'):
+            reader = zstandard.ZstdDecompressor().stream_reader(f, read_across_frames=True)
+            lines = io.BufferedReader(reader)
+        for line in lines:
+            if line.strip():
+                yield orjson.loads(line)
+
+def load_google_trends_data(file_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load Google Trends data folded from the JSONL collection log
+    
+    Later collections override earlier ones per batch/keyword, matching the
+    old merge-on-write behaviour. Falls back to the legacy JSON file when no
+    log exists yet; raises FileNotFoundError if neither is present.
+    """
+    if file_path is None:
+        file_path = DATA_PATHS['raw_google_data']
+    
+    if not os.path.exists(file_path):
+        with open(DATA_PATHS['legacy_google_data'], 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    folded: Dict[str, Any] = {
+        'interest_over_time': {},
+        'related_queries': {},
+        'regional_interest': {},
+        'collection_info': {}
+    }
+    for record in iter_jsonl_records(file_path):
+        for key in ('interest_over_time', 'related_queries', 'regional_interest'):
+            folded[key].update(record.get(key, {}))
+        if record.get('collection_info'):
+            folded['collection_info'] = record['collection_info']
+    return folded
+
 # Convenience functions for each data type
 def append_upwork_data(new_data: Dict[str, Any]) -> bool:
     """Append Upwork data"""
@@ -324,8 +484,32 @@ def append_twitter_data(new_data: Dict[str, Any]) -> bool:
     return append_data_to_file(new_data, DATA_PATHS['raw_twitter_data'], 'tweets')
 
 def append_google_trends_data(new_data: Dict[str, Any]) -> bool:
-    """Append Google Trends data"""
-    return append_data_to_file(new_data, DATA_PATHS['raw_google_data'], 'interest_over_time')
+    """
+    Append Google Trends data as one line of the JSONL log
+    
+    The first append migrates an existing legacy JSON file into the log so
+    no history is lost; after that each collection is a single append.
+    """
+    file_path = DATA_PATHS['raw_google_data']
+    try:
+        VALIDATORS['interest_over_time'](new_data)
+        
+        legacy_path = DATA_PATHS['legacy_google_data']
+        if not os.path.exists(file_path) and os.path.exists(legacy_path):
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                append_jsonl_record(json.load(f), file_path)
+            logger.info(f"Migrated legacy Google Trends data from {legacy_path}")
+        
+        append_jsonl_record(new_data, file_path)
+        logger.info(f"Appended Google Trends collection to {file_path}")
+        return True
+        
+    except fastjsonschema.JsonSchemaException as e:
+        logger.error(f"Rejected Google Trends data for {file_path}: {e.message}")
+        return False
+    except Exception as e:
+        logger.error(f"Error appending Google Trends data to {file_path}: {e}")
+        return False
 
 def get_collection_history(file_path: str) -> List[Dict[str, Any]]:
     """Get collection history for a data file"""
@@ -14,15 +14,33 @@ Author: Web Scraping Project
 
 import json
 import time
+import queue
+import atexit
+import random
 import logging
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import argparse
+from logging.handlers import QueueHandler, QueueListener
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Callable, List, Dict, Any, Optional
 
 # Third-party imports
-import pandas as pd
-from pytrends.request import TrendReq
+import orjson
+import requests
+import zstandard
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+
+# pandas and pytrends are imported where they are used; see get_trend_req_class
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Local imports
+from rate_limiter import RateLimiter
 from config import (
     DEFAULT_KEYWORDS, 
     GOOGLE_TRENDS_TIMEFRAME, 
@@ -33,21 +51,302 @@ from config import (
     LOGGING_CONFIG,
     GOOGLE_TRENDS_COLLECT_RELATED_QUERIES,
     GOOGLE_TRENDS_COLLECT_REGIONAL_DATA,
-    GOOGLE_TRENDS_COLLECT_INTEREST_ONLY
+    GOOGLE_TRENDS_COLLECT_INTEREST_ONLY,
+    GOOGLE_TRENDS_MAX_WORKERS,
+    GOOGLE_TRENDS_CACHE_TTL,
+    GOOGLE_TRENDS_MAX_RETRIES,
+    GOOGLE_TRENDS_MAX_BACKOFF
 )
 
 # Set up logging
+# Records are only queued on the calling thread; a listener thread does the
+# file and console writes, so per-keyword logging stays off the hot path
+_log_queue = queue.SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
 logging.basicConfig(
     level=getattr(logging, LOGGING_CONFIG['level']),
     format=LOGGING_CONFIG['format'],
-    handlers=[
+    handlers=[_queue_handler]
+)
+if _queue_handler in logging.getLogger().handlers:
+    _log_listener = QueueListener(
+        _log_queue,
         logging.FileHandler(LOGGING_CONFIG['log_file']),
         logging.StreamHandler()
-    ]
-)
+    )
+    _log_listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 
+# Shared by every collector so parallel workers respect one global budget
+TRENDS_RATE_LIMITER = RateLimiter(rate_per_sec=1 / API_DELAYS['google_trends'], name='Google Trends')
+
+_trends_session = None
+_trends_session_lock = threading.Lock()
+
+# Status codes worth retrying: rate limited or a transient server error
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Seconds to wait before retry number `attempt` (starting at 1)
+    
+    A Retry-After header (seconds or an HTTP date) is honoured as given;
+    otherwise the wait is capped exponential backoff with full jitter.
+    
+    Args:
+        attempt (int): Retry number
+        retry_after (str, optional): Retry-After header from the response
+        
+    Returns:
+        float: Delay in seconds
+    """
+    if retry_after:
+        try:
+            return min(GOOGLE_TRENDS_MAX_BACKOFF, max(0.0, float(retry_after)))
+        except ValueError:
+            try:
+                wait = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                return min(GOOGLE_TRENDS_MAX_BACKOFF, max(0.0, wait))
+            except (TypeError, ValueError):
+                pass
+    
+    return random.uniform(0, min(GOOGLE_TRENDS_MAX_BACKOFF, 2 ** attempt))
+
+
+def get_trends_session() -> CachedSession:
+    """
+    Get the shared HTTP session for Google Trends requests
+    
+    Responses are cached on disk for GOOGLE_TRENDS_CACHE_TTL seconds, so
+    repeated (keyword, timeframe, region) lookups skip the network.
+    The explore endpoint is a POST, so POST responses are cached too.
+    Connections are pooled and kept alive, sized so every worker thread
+    can hold one, so the TLS handshake is paid once per connection rather
+    than once per request.
+    
+    Returns:
+        CachedSession: Session shared by all collectors
+    """
+    global _trends_session
+    with _trends_session_lock:
+        if _trends_session is None:
+            ensure_data_directory()
+            _trends_session = CachedSession(
+                DATA_PATHS['google_trends_cache'],
+                backend='sqlite',
+                expire_after=GOOGLE_TRENDS_CACHE_TTL,
+                allowable_methods=('GET', 'POST')
+            )
+            adapter = HTTPAdapter(
+                pool_connections=GOOGLE_TRENDS_MAX_WORKERS,
+                pool_maxsize=GOOGLE_TRENDS_MAX_WORKERS
+            )
+            _trends_session.mount('https://', adapter)
+            _trends_session.headers['Connection'] = 'keep-alive'
+        return _trends_session
+
+
+def list_cached_responses() -> List[Dict[str, Any]]:
+    """
+    Describe the Google Trends responses currently in the on-disk cache
+    
+    Returns:
+        List[Dict[str, Any]]: One entry per cached response with its URL,
+        method, creation time and whether it has expired
+    """
+    session = get_trends_session()
+    return [
+        {
+            'url': response.url,
+            'method': response.request.method,
+            'created_at': response.created_at.isoformat(),
+            'expired': response.is_expired
+        }
+        for response in session.cache.filter(expired=True)
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def get_trend_req_class() -> type:
+    """
+    Build the CachedTrendReq class on first use
+    
+    pytrends pulls in pandas, which dominates import time; defining the
+    subclass lazily keeps `--help`, `--list-cache` and other code that never
+    talks to Google from paying for it.
+    
+    Returns:
+        type: CachedTrendReq, a TrendReq subclass
+    """
+    from pytrends import exceptions as pytrends_exceptions
+    from pytrends.request import TrendReq
+    
+    class CachedTrendReq(TrendReq):
+        """
+        TrendReq that sends its API requests through a shared session
+        
+        pytrends opens a new requests session for every call; routing them
+        through get_trends_session() lets the on-disk cache answer repeats.
+        pytrends is still used for the cookie and the /explore widget tokens,
+        but widget data is parsed straight from the JSON where that avoids a
+        pandas round-trip.
+        """
+        
+        def __init__(self, session: CachedSession, **kwargs):
+            self.session = session
+            super().__init__(**kwargs)
+        
+        def _get_data(self, url, method=TrendReq.GET_METHOD, trim_chars=0, **kwargs):
+            send = self.session.post if method == TrendReq.POST_METHOD else self.session.get
+            
+            # Retry transient failures instead of losing the keyword's data
+            for attempt in range(1, GOOGLE_TRENDS_MAX_RETRIES + 1):
+                try:
+                    response = send(url, timeout=self.timeout, cookies=self.cookies,
+                                    headers=self.headers, **kwargs, **self.requests_args)
+                except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                    if attempt == GOOGLE_TRENDS_MAX_RETRIES:
+                        raise
+                    delay = retry_delay(attempt)
+                    logger.warning(f"⏳ {type(e).__name__} from Google Trends, retrying in {delay:.1f}s")
+                    time.sleep(delay)
+                    continue
+                
+                # Feed live responses (not cache hits) back into the shared rate
+                if not getattr(response, 'from_cache', False):
+                    if response.status_code in (429, 503):
+                        TRENDS_RATE_LIMITER.on_throttle()
+                    elif response.status_code == 200:
+                        TRENDS_RATE_LIMITER.on_success()
+                
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt == GOOGLE_TRENDS_MAX_RETRIES:
+                    break
+                delay = retry_delay(attempt, response.headers.get('Retry-After'))
+                logger.warning(f"⏳ Google Trends returned {response.status_code}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+            
+            # Google answers with JSON or JavaScript, prefixed with a few junk characters
+            content_type = response.headers.get('Content-Type', '')
+            if response.status_code == 200 and any(
+                kind in content_type for kind in ('application/json', 'application/javascript', 'text/javascript')
+            ):
+                return orjson.loads(response.text[trim_chars:])
+            
+            if response.status_code == 429:
+                raise pytrends_exceptions.TooManyRequestsError.from_response(response)
+            raise pytrends_exceptions.ResponseError.from_response(response)
+        
+        def interest_over_time_columns(self) -> Dict[str, Any]:
+            """
+            Request the multiline widget for the current payload, column-wise
+            
+            Same request as TrendReq.interest_over_time, but the timeline is
+            read directly into {'index': [dates], 'columns': {keyword: [values]}}
+            instead of being split through several DataFrames.
+            
+            Returns:
+                Dict[str, Any]: Column-wise interest data (empty lists if none)
+            """
+            response = self._get_data(
+                url=TrendReq.INTEREST_OVER_TIME_URL,
+                method=TrendReq.GET_METHOD,
+                trim_chars=5,
+                params={
+                    'req': json.dumps(self.interest_over_time_widget['request']),
+                    'token': self.interest_over_time_widget['token'],
+                    'tz': self.tz
+                }
+            )
+            
+            timeline = sorted(response['default']['timelineData'], key=lambda point: int(point['time']))
+            dates = [datetime.fromtimestamp(int(point['time']), tz=timezone.utc) for point in timeline]
+            
+            # Match pandas' DatetimeIndex.astype(str): drop the time for daily data
+            date_format = '%Y-%m-%d' if all(d.hour == d.minute == d.second == 0 for d in dates) else '%Y-%m-%d %H:%M:%S'
+            
+            # Values come back in the order of the payload's keywords
+            return {
+                'index': [d.strftime(date_format) for d in dates],
+                'columns': {
+                    keyword: [int(point['value'][i]) for point in timeline]
+                    for i, keyword in enumerate(self.kw_list)
+                }
+            }
+        
+        def interest_by_region_values(self, resolution: str = 'COUNTRY') -> Dict[str, int]:
+            """
+            Request the comparedgeo widget for the current (single keyword) payload
+            
+            Same request as TrendReq.interest_by_region, but the geo map is
+            projected straight into {region: interest} instead of a DataFrame.
+            
+            Args:
+                resolution (str): Geographic resolution, e.g. 'COUNTRY' or 'REGION'
+                
+            Returns:
+                Dict[str, int]: Interest of the first keyword per region name
+            """
+            widget_request = self.interest_by_region_widget['request']
+            if self.geo == '' or (self.geo == 'US' and resolution in ('DMA', 'CITY', 'REGION')):
+                widget_request['resolution'] = resolution
+            widget_request['includeLowSearchVolumeGeos'] = False
+            
+            response = self._get_data(
+                url=TrendReq.INTEREST_BY_REGION_URL,
+                method=TrendReq.GET_METHOD,
+                trim_chars=5,
+                params={
+                    'req': json.dumps(widget_request),
+                    'token': self.interest_by_region_widget['token'],
+                    'tz': self.tz
+                }
+            )
+            
+            geo_map = sorted(response['default']['geoMapData'], key=lambda entry: entry['geoName'])
+            return {entry['geoName']: int(entry['value'][0]) for entry in geo_map}
+    
+    return CachedTrendReq
+
+
+def dataframe_records(df: 'pd.DataFrame') -> List[Dict[str, Any]]:
+    """
+    Convert a DataFrame to a list of row dicts
+    
+    Equivalent to df.to_dict('records'), but converts the whole NumPy block
+    with a single .tolist() instead of boxing each cell through pandas.
+    
+    Args:
+        df (pd.DataFrame): Frame to convert
+        
+    Returns:
+        List[Dict[str, Any]]: One dict per row, keyed by column name
+    """
+    columns = df.columns.tolist()
+    return [dict(zip(columns, row)) for row in df.values.tolist()]
+
+
+@dataclass
+class InterestResult:
+    """
+    Interest-over-time result for one keyword batch
+    
+    Slotted, so each result skips a per-instance dict; orjson serializes
+    dataclasses natively, so it is written to disk like the dict it replaces.
+    """
+    __slots__ = ('keywords', 'timeframe', 'region', 'data', 'timestamp', 'error')
+    
+    keywords: List[str]
+    timeframe: str
+    region: str
+    data: Dict[str, Any]
+    timestamp: str
+    error: Optional[str]
+
+
 class GoogleTrendsCollector:
     """
     A class to collect data from Google Trends
@@ -70,11 +369,14 @@ class GoogleTrendsCollector:
         self.region = region
         self.language = language
         self.timeframe = GOOGLE_TRENDS_TIMEFRAME
+        self._limiter = TRENDS_RATE_LIMITER
+        self._current_payload_key = None
         
         # Initialize pytrends object
         # This creates a connection to Google Trends
         try:
-            self.pytrends = TrendReq(
+            self.pytrends = get_trend_req_class()(
+                get_trends_session(),
                 hl=language,  # Language
                 tz=360,       # Timezone offset
                 timeout=(10, 25)  # Connection timeout
@@ -84,82 +386,86 @@ class GoogleTrendsCollector:
             logger.error(f"❌ Error initializing Google Trends: {e}")
             raise
     
-    def fetch_interest_over_time(self, keywords: List[str]) -> Dict[str, Any]:
+    def _ensure_payload(self, kw_list: List[str]) -> None:
+        """
+        Build the pytrends payload unless it is already set for these keywords
+        
+        Every build_payload call hits the /explore endpoint, so consecutive
+        fetches for the same keywords share one payload.
+        
+        Args:
+            kw_list (List[str]): Keywords the next request is for
+        """
+        payload_key = (tuple(kw_list), self.timeframe, self.region)
+        if payload_key == self._current_payload_key:
+            return
+        
+        # This tells Google Trends what we want to search for
+        self.pytrends.build_payload(
+            kw_list=kw_list,           # Keywords to search
+            cat=0,                     # Category (0 = all categories)
+            timeframe=self.timeframe,  # Time period
+            geo=self.region,           # Geographic region
+            gprop=''                   # Google property ('' = web search)
+        )
+        self._current_payload_key = payload_key
+    
+    def fetch_interest_over_time(self, keywords: List[str], run_timestamp: Optional[str] = None) -> InterestResult:
         """
         Fetch interest over time for given keywords
         
         Args:
             keywords (List[str]): List of keywords to search
+            run_timestamp (str, optional): Timestamp shared by the whole run. Uses now if None.
             
         Returns:
-            Dict[str, Any]: Dictionary containing interest data
+            InterestResult: Interest data, or the error if the request failed
         """
         logger.info(f"🔍 Fetching interest over time for: {keywords}")
+        timestamp = run_timestamp or datetime.now().isoformat()
         
         try:
             # Build the payload for pytrends
-            # This tells Google Trends what we want to search for
-            self.pytrends.build_payload(
-                kw_list=keywords,          # Keywords to search
-                cat=0,                     # Category (0 = all categories)
-                timeframe=self.timeframe,  # Time period
-                geo=self.region,           # Geographic region
-                gprop=''                   # Google property ('' = web search)
-            )
+            self._ensure_payload(keywords)
             
-            # Add a small delay to be respectful to the API
-            time.sleep(API_DELAYS['google_trends'])
+            # Wait for a rate limit slot to be respectful to the API
+            self._limiter.acquire()
             
-            # Get the interest over time data
-            interest_df = self.pytrends.interest_over_time()
+            # Get the interest over time data, already column-wise:
+            # one list per keyword instead of one dict per date
+            interest = self.pytrends.interest_over_time_columns()
             
-            if interest_df.empty:
+            if not interest['index']:
                 logger.warning(f"⚠️  No interest data found for keywords: {keywords}")
-                return {'keywords': keywords, 'data': [], 'timestamp': datetime.now().isoformat()}
-            
-            # Convert DataFrame to dictionary for JSON storage
-            # Remove the 'isPartial' column if it exists
-            if 'isPartial' in interest_df.columns:
-                interest_df = interest_df.drop(columns=['isPartial'])
-            
-            # Convert to dictionary with proper formatting
-            data_dict = {
-                'keywords': keywords,
-                'timeframe': self.timeframe,
-                'region': self.region,
-                'data': interest_df.reset_index().to_dict('records'),
-                'timestamp': datetime.now().isoformat()
-            }
+            else:
+                logger.info(f"✅ Successfully fetched interest data for {len(keywords)} keywords")
             
-            logger.info(f"✅ Successfully fetched interest data for {len(keywords)} keywords")
-            return data_dict
+            return InterestResult(keywords, self.timeframe, self.region, interest, timestamp, None)
             
         except Exception as e:
             logger.error(f"❌ Error fetching interest over time: {e}")
-            return {'keywords': keywords, 'error': str(e), 'timestamp': datetime.now().isoformat()}
+            return InterestResult(keywords, self.timeframe, self.region, {'index': [], 'columns': {}}, timestamp, str(e))
     
-    def fetch_related_queries(self, keyword: str) -> Dict[str, Any]:
+    def fetch_related_queries(self, keyword: str, run_timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         Fetch related queries for a single keyword
         
         Args:
             keyword (str): Single keyword to search
+            run_timestamp (str, optional): Timestamp shared by the whole run. Uses now if None.
             
         Returns:
             Dict[str, Any]: Dictionary containing related queries
         """
         logger.info(f"🔗 Fetching related queries for: {keyword}")
+        timestamp = run_timestamp or datetime.now().isoformat()
         
         try:
             # Build payload for single keyword
-            self.pytrends.build_payload(
-                kw_list=[keyword],
-                timeframe=self.timeframe,
-                geo=self.region
-            )
+            self._ensure_payload([keyword])
             
-            # Add delay for rate limiting
-            time.sleep(API_DELAYS['google_trends'])
+            # Wait for a rate limit slot
+            self._limiter.acquire()
             
             # Get related queries
             related_queries = self.pytrends.related_queries()
@@ -171,7 +477,7 @@ class GoogleTrendsCollector:
                 'keyword': keyword,
                 'timeframe': self.timeframe,
                 'region': self.region,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'top_queries': [],
                 'rising_queries': []
             }
@@ -181,7 +487,7 @@ class GoogleTrendsCollector:
                 if 'top' in keyword_data and keyword_data['top'] is not None:
                     top_df = keyword_data['top']
                     if hasattr(top_df, 'empty') and not top_df.empty and len(top_df.columns) > 0:
-                        result['top_queries'] = top_df.to_dict('records')
+                        result['top_queries'] = dataframe_records(top_df)
                     else:
                         logger.info(f"No top queries available for '{keyword}'")
             except Exception as e:
@@ -192,7 +498,7 @@ class GoogleTrendsCollector:
                 if 'rising' in keyword_data and keyword_data['rising'] is not None:
                     rising_df = keyword_data['rising']
                     if hasattr(rising_df, 'empty') and not rising_df.empty and len(rising_df.columns) > 0:
-                        result['rising_queries'] = rising_df.to_dict('records')
+                        result['rising_queries'] = dataframe_records(rising_df)
                     else:
                         logger.info(f"No rising queries available for '{keyword}'")
             except Exception as e:
@@ -206,40 +512,36 @@ class GoogleTrendsCollector:
             return {
                 'keyword': keyword,
                 'error': str(e),
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'top_queries': [],
                 'rising_queries': []
             }
     
-    def fetch_regional_interest(self, keyword: str) -> Dict[str, Any]:
+    def fetch_regional_interest(self, keyword: str, run_timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         Fetch regional interest data for a keyword
         
         Args:
             keyword (str): Keyword to search
+            run_timestamp (str, optional): Timestamp shared by the whole run. Uses now if None.
             
         Returns:
             Dict[str, Any]: Regional interest data
         """
         logger.info(f"🌍 Fetching regional interest for: {keyword}")
+        timestamp = run_timestamp or datetime.now().isoformat()
         
         try:
-            # Build payload
-            self.pytrends.build_payload(
-                kw_list=[keyword],
-                timeframe=self.timeframe,
-                geo=self.region
-            )
-            
-            time.sleep(API_DELAYS['google_trends'])
+            # Build payload (reused if related queries just set it)
+            self._ensure_payload([keyword])
             
-            # Get regional interest
-            regional_df = self.pytrends.interest_by_region(resolution='COUNTRY')
+            self._limiter.acquire()
             
+            # Get regional interest as {country: interest}
             result = {
                 'keyword': keyword,
-                'regional_data': regional_df.to_dict() if not regional_df.empty else {},
-                'timestamp': datetime.now().isoformat()
+                'regional_data': self.pytrends.interest_by_region_values(resolution='COUNTRY'),
+                'timestamp': timestamp
             }
             
             logger.info(f"✅ Fetched regional data for {len(result['regional_data'])} regions")
@@ -250,16 +552,89 @@ class GoogleTrendsCollector:
             return {
                 'keyword': keyword,
                 'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': timestamp
             }
+    
+    def fetch_keyword_details(self, keyword: str, related: bool = True, regional: bool = True,
+                              run_timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Fetch related queries and regional interest for one keyword
+        
+        Both requests share a single payload, so the keyword costs one
+        /explore call instead of two.
+        
+        Args:
+            keyword (str): Keyword to search
+            related (bool): Whether to fetch related queries
+            regional (bool): Whether to fetch regional interest
+            run_timestamp (str, optional): Timestamp shared by the whole run. Uses now if None.
+            
+        Returns:
+            Dict[str, Any]: Results keyed by 'related_queries' / 'regional_interest'
+        """
+        details = {}
+        if related:
+            details['related_queries'] = self.fetch_related_queries(keyword, run_timestamp)
+        if regional:
+            details['regional_interest'] = self.fetch_regional_interest(keyword, run_timestamp)
+        return details
 
 
-def collect_all_google_data(keywords: Optional[List[str]] = None) -> Dict[str, Any]:
+def fetch_for_keywords(method_name: str, keywords: List[str],
+                       on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                       **kwargs) -> Dict[str, Dict[str, Any]]:
+    """
+    Run a per-keyword fetch method for many keywords on a bounded thread pool
+    
+    pytrends keeps the current payload on the TrendReq object, so each worker
+    thread builds its own collector instead of sharing one.
+    
+    Args:
+        method_name (str): Name of the GoogleTrendsCollector method to call
+        keywords (List[str]): Keywords to fetch
+        on_result (Callable, optional): Called with (keyword, result) as each
+            keyword completes, on the calling thread. Results handed to it
+            are not kept in the returned dict.
+        **kwargs: Extra keyword arguments passed to the method
+        
+    Returns:
+        Dict[str, Dict[str, Any]]: Results keyed by keyword, in input order
+    """
+    thread_state = threading.local()
+    
+    def fetch(keyword: str) -> Dict[str, Any]:
+        if not hasattr(thread_state, 'collector'):
+            thread_state.collector = GoogleTrendsCollector()
+        return getattr(thread_state.collector, method_name)(keyword, **kwargs)
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=GOOGLE_TRENDS_MAX_WORKERS) as executor:
+        futures = {executor.submit(fetch, keyword): keyword for keyword in keywords}
+        for future in as_completed(futures):
+            keyword = futures[future]
+            try:
+                if on_result is not None:
+                    on_result(keyword, future.result())
+                else:
+                    results[keyword] = future.result()
+            except Exception as e:
+                logger.error(f"❌ Error in {method_name} for '{keyword}': {e}")
+    
+    return {keyword: results[keyword] for keyword in keywords if keyword in results}
+
+
+def collect_all_google_data(keywords: Optional[List[str]] = None, stream: bool = False) -> Dict[str, Any]:
     """
     Collect all Google Trends data for given keywords
     
+    With stream=True each batch/keyword result is appended to the Google
+    Trends log as soon as it arrives instead of being held in memory, so a
+    crash mid-run keeps everything collected so far. The returned dict then
+    only carries collection_info (with a 'streamed_records' count).
+    
     Args:
         keywords (List[str], optional): Keywords to search. Uses DEFAULT_KEYWORDS if None.
+        stream (bool): Whether to write results incrementally
         
     Returns:
         Dict[str, Any]: Complete Google Trends data
@@ -272,6 +647,9 @@ def collect_all_google_data(keywords: Optional[List[str]] = None) -> Dict[str, A
     # Initialize collector
     collector = GoogleTrendsCollector()
     
+    # One timestamp for every record in this run, so results group by run
+    run_timestamp = datetime.now().isoformat()
+    
     # Data structure to store all results
     all_data = {
         'collection_info': {
@@ -279,13 +657,23 @@ def collect_all_google_data(keywords: Optional[List[str]] = None) -> Dict[str, A
             'total_keywords': len(keywords),
             'region': GOOGLE_TRENDS_REGION,
             'timeframe': GOOGLE_TRENDS_TIMEFRAME,
-            'collection_timestamp': datetime.now().isoformat()
+            'collection_timestamp': run_timestamp
         },
         'interest_over_time': {},
         'related_queries': {},
         'regional_interest': {}
     }
     
+    if stream:
+        from data_persistence import append_google_trends_data
+        all_data['collection_info']['streamed_records'] = 0
+    
+    def store(section: str, key: str, result: Dict[str, Any]) -> None:
+        if not stream:
+            all_data[section][key] = result
+        elif append_google_trends_data({section: {key: result}}):
+            all_data['collection_info']['streamed_records'] += 1
+    
     # 1. Fetch interest over time (can handle multiple keywords at once)
     try:
         # Google Trends allows up to 5 keywords at once
@@ -293,14 +681,11 @@ def collect_all_google_data(keywords: Optional[List[str]] = None) -> Dict[str, A
         
         for batch in keyword_batches:
             logger.info(f"📊 Processing keyword batch: {batch}")
-            interest_data = collector.fetch_interest_over_time(batch)
+            interest_data = collector.fetch_interest_over_time(batch, run_timestamp)
             
             # Store data for each keyword in the batch
             batch_key = "_".join(batch)
-            all_data['interest_over_time'][batch_key] = interest_data
-            
-            # Small delay between batches
-            time.sleep(API_DELAYS['google_trends'] * 2)
+            store('interest_over_time', batch_key, interest_data)
             
     except Exception as e:
         logger.error(f"❌ Error in interest over time collection: {e}")
@@ -308,47 +693,79 @@ def collect_all_google_data(keywords: Optional[List[str]] = None) -> Dict[str, A
     # 2. Fetch related queries for each keyword individually (if enabled)
     if GOOGLE_TRENDS_COLLECT_RELATED_QUERIES:
         logger.info("🔗 Related queries collection is enabled")
-        for keyword in keywords:
-            try:
-                logger.info(f"🔗 Processing related queries for: {keyword}")
-                related_data = collector.fetch_related_queries(keyword)
-                all_data['related_queries'][keyword] = related_data
-                
-                # Delay between keywords
-                time.sleep(API_DELAYS['google_trends'])
-                
-            except Exception as e:
-                logger.error(f"❌ Error fetching related queries for '{keyword}': {e}")
-                continue
     else:
         logger.info("⏭️  Skipping related queries collection (disabled in config)")
     
     # 3. Fetch regional interest for each keyword (if enabled)
     if GOOGLE_TRENDS_COLLECT_REGIONAL_DATA:
         logger.info("🌍 Regional data collection is enabled")
-        for keyword in keywords:
-            try:
-                logger.info(f"🌍 Processing regional interest for: {keyword}")
-                regional_data = collector.fetch_regional_interest(keyword)
-                all_data['regional_interest'][keyword] = regional_data
-                
-                # Delay between keywords
-                time.sleep(API_DELAYS['google_trends'])
-                
-            except Exception as e:
-                logger.error(f"❌ Error fetching regional interest for '{keyword}': {e}")
-                continue
     else:
         logger.info("⏭️  Skipping regional data collection (disabled in config)")
     
+    # One task per keyword fetches both, sharing a single payload
+    if GOOGLE_TRENDS_COLLECT_RELATED_QUERIES or GOOGLE_TRENDS_COLLECT_REGIONAL_DATA:
+        def store_details(keyword: str, keyword_details: Dict[str, Any]) -> None:
+            for section, result in keyword_details.items():
+                store(section, keyword, result)
+        
+        fetch_for_keywords(
+            'fetch_keyword_details',
+            keywords,
+            on_result=store_details,
+            related=GOOGLE_TRENDS_COLLECT_RELATED_QUERIES,
+            regional=GOOGLE_TRENDS_COLLECT_REGIONAL_DATA,
+            run_timestamp=run_timestamp
+        )
+    
+    if stream:
+        # Closing record so the log's latest collection_info is this run's
+        append_google_trends_data({'collection_info': all_data['collection_info']})
+    
     logger.info(f"✅ Google Trends data collection completed!")
     return all_data
 
 
+def interest_to_dataframe(data: Dict[str, Any]) -> 'pd.DataFrame':
+    """
+    Flatten all interest-over-time batches into one long-format table
+    
+    Args:
+        data (Dict[str, Any]): Google Trends data from collect_all_google_data
+        
+    Returns:
+        pd.DataFrame: One row per (date, keyword) with its interest value
+    """
+    import pandas as pd
+    
+    frames = []
+    for batch_data in data.get('interest_over_time', {}).values():
+        if isinstance(batch_data, InterestResult):
+            interest = batch_data.data
+        else:
+            interest = batch_data.get('data')
+        if not isinstance(interest, dict) or not interest.get('columns'):
+            continue
+        
+        frame = pd.DataFrame(interest['columns'], index=pd.to_datetime(interest['index']))
+        frame.index.name = 'date'
+        frames.append(frame.reset_index().melt(id_vars='date', var_name='keyword', value_name='interest'))
+    
+    if not frames:
+        return pd.DataFrame(columns=['date', 'keyword', 'interest'])
+    return pd.concat(frames, ignore_index=True)
+
+
 def save_google_data(data: Dict[str, Any], filepath: Optional[str] = None, use_persistence: bool = True) -> bool:
     """
     Save Google Trends data to JSON file with persistence option
     
+    The default path is a zstd-compressed JSON Lines log: each collection
+    is appended as one line rather than rewriting the whole file. Other
+    paths ending in .zst are compressed the same way. A filepath ending in
+    .parquet writes the interest-over-time table as Snappy-compressed
+    Parquet instead (related and regional data are not tabular and are
+    left out).
+    
     Args:
         data (Dict[str, Any]): Data to save
         filepath (str, optional): File path. Uses default if None.
@@ -361,6 +778,12 @@ def save_google_data(data: Dict[str, Any], filepath: Optional[str] = None, use_p
         filepath = DATA_PATHS['raw_google_data']
     
     try:
+        if filepath.endswith('.parquet'):
+            ensure_data_directory()
+            interest_to_dataframe(data).to_parquet(filepath, compression='snappy', index=False)
+            logger.info(f"✅ Google Trends interest data saved to: {filepath}")
+            return True
+        
         if use_persistence:
             # Use new persistence system to append data
             from data_persistence import append_google_trends_data
@@ -371,11 +794,29 @@ def save_google_data(data: Dict[str, Any], filepath: Optional[str] = None, use_p
             else:
                 logger.warning("⚠️ Failed to append, falling back to overwrite")
         
-        # Fallback to overwrite or if persistence is disabled
+        # Fallback if persistence is disabled: .jsonl paths get the record
+        # appended as a single line, anything else is overwritten
+        if filepath.endswith(('.jsonl', '.jsonl.zst')):
+            from data_persistence import append_jsonl_record
+            append_jsonl_record(data, filepath)
+            logger.info(f"✅ Google Trends data appended to: {filepath}")
+            return True
+        
         ensure_data_directory()
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        # orjson writes UTF-8 bytes and handles numpy scalars natively;
+        # default=str still covers pandas Timestamps and other stragglers
+        payload = orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+        with open(filepath, 'wb') as f:
+            if filepath.endswith('.zst'):
+                with zstandard.ZstdCompressor(level=3).stream_writer(f, closefd=False) as writer:
+                    writer.write(payload)
+            else:
+                f.write(payload)
         
         logger.info(f"✅ Google Trends data saved to: {filepath}")
         return True
@@ -389,9 +830,30 @@ def main():
     """
     Main function to run Google Trends data collection
     """
+    parser = argparse.ArgumentParser(description="Collect Google Trends data for the default keywords")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Ignore cached responses and always query Google Trends")
+    parser.add_argument('--stream', action='store_true',
+                        help="Append each result to the data log as soon as it is fetched")
+    parser.add_argument('--list-cache', action='store_true',
+                        help="List cached Google Trends responses and exit without collecting")
+    args = parser.parse_args()
+    
+    if args.list_cache:
+        entries = list_cached_responses()
+        print(f"🗄️  {len(entries)} cached responses in {DATA_PATHS['google_trends_cache']}")
+        for entry in entries:
+            status = "expired" if entry['expired'] else "fresh"
+            print(f"   [{status}] {entry['method']} {entry['created_at']} {entry['url']}")
+        return
+    
     print("🔥 Google Trends Data Collector")
     print("=" * 40)
     
+    if args.no_cache:
+        get_trends_session().settings.disabled = True
+        print("🚫 Response cache disabled")
+    
     try:
         # Use default keywords or get from user input
         keywords = DEFAULT_KEYWORDS
@@ -402,7 +864,13 @@ def main():
         
         # Collect all data
         print("🚀 Starting data collection...")
-        all_data = collect_all_google_data(keywords)
+        all_data = collect_all_google_data(keywords, stream=args.stream)
+        
+        if args.stream:
+            # Results were already written as they arrived
+            print(f"✅ Data collection completed successfully!")
+            print(f"📁 {all_data['collection_info']['streamed_records']} records appended to: {DATA_PATHS['raw_google_data']}")
+            return
         
         # Save data
         print("💾 Saving data...")
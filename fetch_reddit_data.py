@@ -12,25 +12,43 @@ It collects:
 Author: Web Scraping Project
 """
 
-import json
+import gzip
 import time
+import sqlite3
 import logging
+import argparse
+import operator
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Callable, Iterator, List, Dict, Any, Optional, Union
 
 # Third-party imports
+import orjson
 import praw
+import prawcore
+import requests
+from requests.adapters import HTTPAdapter
 from praw.exceptions import RedditAPIException, ClientException
+from praw.models import Submission
 
 # Local imports
+from rate_limiter import RateLimiter
 from config import (
     DEFAULT_KEYWORDS,
     REDDIT_CONFIG,
     REDDIT_SETTINGS,
     DATA_PATHS,
-    API_DELAYS,
     ensure_data_directory,
     LOGGING_CONFIG,
+    REDDIT_MAX_WORKERS,
+    REDDIT_REQUESTS_PER_MINUTE,
+    REDDIT_REQUEST_BURST,
+    REDDIT_MAX_RETRIES,
+    REDDIT_PUSHSHIFT_URL,
+    REDDIT_DIRECT_SEARCH,
+    REDDIT_POST_CACHE_TTL,
     validate_reddit_config
 )
 
@@ -45,6 +63,177 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared by every thread using a collector, so parallel keyword searches
+# stay inside Reddit's per-client request budget together. Starts at the
+# documented budget and is then re-paced from each response's headers.
+# Reddit averages the budget over a 10 minute window, so a short burst
+# (e.g. the first pages of every keyword) goes out without waiting.
+REDDIT_RATE_LIMITER = RateLimiter(
+    rate_per_sec=REDDIT_REQUESTS_PER_MINUTE / 60,
+    burst=REDDIT_REQUEST_BURST,
+    name='Reddit'
+)
+
+# Endpoints for the direct JSON search path
+REDDIT_TOKEN_URL = 'https://www.reddit.com/api/v1/access_token'
+REDDIT_OAUTH_URL = 'https://oauth.reddit.com'
+
+# Bound once; called for every extracted post. created_date is kept next to
+# created_utc because clean_data and the analytics page read the ISO string.
+# Everything else time-related is taken once per run (see run_timestamp).
+_fromtimestamp = datetime.fromtimestamp
+
+# Plain submission fields read by _extract_post_data, fetched in one call
+_get_post_fields = operator.attrgetter(
+    'id', 'title', 'selftext', 'score', 'upvote_ratio', 'num_comments', 'created_utc',
+    'url', 'permalink', 'is_self', 'over_18', 'spoiler', 'stickied', 'locked',
+    'archived', 'gilded', 'link_flair_text', 'domain'
+)
+
+# REDDIT_SETTINGS bound once at import, so hot paths skip the dict lookups;
+# the settings are not changed at runtime
+_SORT = REDDIT_SETTINGS['sort']
+_TIME_FILTER = REDDIT_SETTINGS['time_filter']
+_LIMIT = REDDIT_SETTINGS['limit']
+_SUBREDDITS = tuple(REDDIT_SETTINGS['subreddits'])
+_SEARCH_ALL = 'all' in _SUBREDDITS
+# Subreddit path every keyword search runs against ("all", or a multireddit like "a+b+c")
+_SUBREDDIT_QUERY = 'all' if _SEARCH_ALL else '+'.join(sorted(_SUBREDDITS))
+
+# Seconds covered by each REDDIT_SETTINGS['time_filter'] value ('all' has no bound)
+TIME_FILTER_SECONDS = {
+    'hour': 3600,
+    'day': 86400,
+    'week': 7 * 86400,
+    'month': 30 * 86400,
+    'year': 365 * 86400
+}
+
+
+def send_with_rate_limit(send: Callable[[], requests.Response]) -> requests.Response:
+    """
+    Send a Reddit request through REDDIT_RATE_LIMITER
+    
+    After every response the limiter is re-paced from Reddit's
+    X-Ratelimit-Remaining / X-Ratelimit-Reset headers, so requests only wait
+    as long as the remaining budget requires. A 429 is retried up to
+    REDDIT_MAX_RETRIES times with exponential backoff (1s, 2s, 4s..., max 60s).
+    
+    Args:
+        send (Callable): Function that performs the HTTP request
+        
+    Returns:
+        requests.Response: The last response received
+    """
+    for attempt in range(REDDIT_MAX_RETRIES + 1):
+        REDDIT_RATE_LIMITER.acquire()
+        response = send()
+        
+        remaining = response.headers.get('X-Ratelimit-Remaining')
+        reset = response.headers.get('X-Ratelimit-Reset')
+        if remaining is not None and reset is not None:
+            try:
+                REDDIT_RATE_LIMITER.pace(float(remaining), float(reset))
+            except ValueError:
+                pass
+        
+        if response.status_code != 429 or attempt == REDDIT_MAX_RETRIES:
+            return response
+        
+        wait = min(60, 2 ** attempt)
+        logger.warning(f"⚠️  Reddit returned 429, retrying in {wait}s (attempt {attempt + 1}/{REDDIT_MAX_RETRIES})")
+        time.sleep(wait)
+    
+    return response
+
+
+class ThrottledRequestor(prawcore.Requestor):
+    """
+    prawcore Requestor that sends every HTTP request, including each page
+    of a listing, through send_with_rate_limit
+    """
+    
+    def request(self, *args, **kwargs):
+        return send_with_rate_limit(lambda: super(ThrottledRequestor, self).request(*args, **kwargs))
+
+
+@dataclass
+class RedditPost:
+    """
+    One extracted Reddit post
+    
+    Slotted, so each post skips a per-instance dict; converted to a plain
+    dict only when saved (see to_dict).
+    """
+    __slots__ = (
+        'search_keyword', 'post_id', 'title', 'selftext', 'score', 'upvote_ratio',
+        'num_comments', 'created_utc', 'created_date', 'subreddit', 'author', 'url',
+        'permalink', 'is_self', 'over_18', 'spoiler', 'stickied', 'locked', 'archived',
+        'gilded', 'collection_timestamp', 'link_flair', 'domain'
+    )
+    
+    search_keyword: str
+    post_id: str
+    title: str
+    selftext: str
+    score: int
+    upvote_ratio: float
+    num_comments: int
+    created_utc: float
+    created_date: str
+    subreddit: str
+    author: str
+    url: str
+    permalink: str
+    is_self: bool
+    over_18: bool
+    spoiler: bool
+    stickied: bool
+    locked: bool
+    archived: bool
+    gilded: int
+    collection_timestamp: str
+    link_flair: Optional[str]
+    domain: Optional[str]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for saving; link_flair/domain only when present"""
+        post_data = {name: getattr(self, name) for name in self.__slots__}
+        if self.link_flair is None:
+            del post_data['link_flair']
+        if self.domain is None:
+            del post_data['domain']
+        return post_data
+    
+    @classmethod
+    def from_dict(cls, post_data: Dict[str, Any]) -> 'RedditPost':
+        """Rebuild a post from to_dict() output"""
+        return cls(**{name: post_data.get(name) for name in cls.__slots__})
+
+
+# What _extract_post_data returns: a post, or an error dict if extraction failed
+PostRecord = Union[RedditPost, Dict[str, Any]]
+
+
+def posts_to_dicts(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a copy of collected Reddit data with every RedditPost as a dict
+    
+    Args:
+        data (Dict[str, Any]): Data from collect_all_reddit_data
+        
+    Returns:
+        Dict[str, Any]: Same structure, ready for JSON/persistence
+    """
+    converted = dict(data)
+    if isinstance(data.get('keyword_posts'), dict):
+        converted['keyword_posts'] = {
+            keyword: [post.to_dict() if isinstance(post, RedditPost) else post for post in posts]
+            if isinstance(posts, list) else posts
+            for keyword, posts in data['keyword_posts'].items()
+        }
+    return converted
+
 
 class RedditDataCollector:
     """
@@ -68,17 +257,52 @@ class RedditDataCollector:
             raise ValueError("Reddit API configuration is invalid. Please check your credentials.")
         
         try:
+            # One keep-alive session for PRAW and the direct JSON search,
+            # pooled so every keyword thread can hold its own connection and
+            # the TLS handshake is paid once per connection, not per request
+            self._http = requests.Session()
+            adapter = HTTPAdapter(pool_connections=REDDIT_MAX_WORKERS, pool_maxsize=REDDIT_MAX_WORKERS)
+            self._http.mount('https://', adapter)
+            self._http.headers['Connection'] = 'keep-alive'
+            
             # Initialize PRAW Reddit instance
             # This creates an authenticated connection to Reddit's API
+            # (PRAW also sets the session's User-Agent)
             self.reddit = praw.Reddit(
                 client_id=REDDIT_CONFIG['client_id'],
                 client_secret=REDDIT_CONFIG['client_secret'],
-                user_agent=REDDIT_CONFIG['user_agent']
+                user_agent=REDDIT_CONFIG['user_agent'],
+                requestor_class=ThrottledRequestor,
+                requestor_kwargs={'session': self._http}
             )
             
             # Set to read-only mode for public data access
             self.reddit.read_only = True
             
+            # Subreddit/author names keyed by the IDs that come with every
+            # listing item, shared by all keywords searched with this collector
+            self._subreddit_cache = {}
+            self._author_cache = {}
+            
+            # Posts already extracted in this run, keyed by post_id, so a
+            # post matching several keywords is only extracted once
+            self._seen_posts = {}
+            
+            # Extracted posts from earlier runs, keyed by post_id
+            # Shared by the keyword threads, so access is serialized
+            ensure_data_directory()
+            self._post_cache = sqlite3.connect(DATA_PATHS['reddit_cache'], check_same_thread=False)
+            self._post_cache.execute(
+                "CREATE TABLE IF NOT EXISTS posts (id TEXT PRIMARY KEY, json BLOB, ts INTEGER)"
+            )
+            self._post_cache_lock = threading.Lock()
+            
+            # App-only OAuth token for the direct JSON search path,
+            # refreshed shortly before it expires
+            self._access_token = None
+            self._access_token_expires = 0.0
+            self._access_token_lock = threading.Lock()
+            
             # Test the connection
             logger.info(f"Reddit API connection established")
             logger.info(f"   User Agent: {REDDIT_CONFIG['user_agent']}")
@@ -105,59 +329,109 @@ class RedditDataCollector:
             logger.error(f"Reddit API connection test failed: {e}")
             return False
     
-    def search_posts_by_keyword(self, keyword: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def search_posts_by_keyword(self, keyword: str, limit: Optional[int] = None,
+                                collection_timestamp: Optional[str] = None) -> List[PostRecord]:
         """
         Search Reddit posts by keyword
         
         Args:
             keyword (str): Keyword to search for
             limit (int, optional): Maximum number of posts to fetch
+            collection_timestamp (str, optional): ISO timestamp stamped on every post. Uses now if None.
             
         Returns:
-            List[Dict[str, Any]]: List of post data dictionaries
+            List[PostRecord]: List of extracted posts
         """
         if limit is None:
-            limit = REDDIT_SETTINGS['limit']
+            limit = _LIMIT
+        if collection_timestamp is None:
+            collection_timestamp = datetime.now().isoformat()
         
         logger.info(f"Searching Reddit for keyword: '{keyword}' (limit: {limit})")
         
         posts_data = []
+        new_posts = []
         
         try:
-            # Search across all subreddits or specific ones
-            if 'all' in REDDIT_SETTINGS['subreddits']:
-                # Search across all of Reddit
-                subreddit = self.reddit.subreddit('all')
-            else:
-                # Search specific subreddits
-                subreddit_names = '+'.join(REDDIT_SETTINGS['subreddits'])
-                subreddit = self.reddit.subreddit(subreddit_names)
-            
-            # Perform the search
-            # sort: 'hot', 'new', 'top', 'rising'
-            # time_filter: 'hour', 'day', 'week', 'month', 'year', 'all'
-            search_results = subreddit.search(
-                query=keyword,
-                sort=REDDIT_SETTINGS['sort'],
-                time_filter=REDDIT_SETTINGS['time_filter'],
-                limit=limit
-            )
+            search_results = None
+            
+            # With a Pushshift-style API configured, find the IDs in one bulk
+            # query and load the posts through info(), which PRAW fetches
+            # 100 per request instead of paging through search results.
+            # Posts already seen this run or still fresh in the local cache
+            # are not fetched again.
+            if REDDIT_PUSHSHIFT_URL:
+                try:
+                    post_ids = self._pushshift_ids(keyword, limit)
+                    known_posts = {
+                        post_id: self._seen_posts[post_id] for post_id in post_ids if post_id in self._seen_posts
+                    }
+                    known_posts.update(self._load_cached_posts([
+                        post_id for post_id in post_ids if post_id not in known_posts
+                    ]))
+                    posts_data.extend(replace(post, search_keyword=keyword) for post in known_posts.values())
+                    search_results = self.reddit.info(
+                        fullnames=[f"t3_{post_id}" for post_id in post_ids if post_id not in known_posts]
+                    )
+                except (requests.RequestException, ValueError, KeyError) as e:
+                    logger.warning(f"⚠️  Pushshift search failed for '{keyword}', using Reddit search: {e}")
+            
+            # Otherwise read the search listing as raw JSON, which skips
+            # PRAW's lazy objects entirely; PRAW search is the fallback
+            extract = self._extract_post_data
+            if search_results is None and REDDIT_DIRECT_SEARCH:
+                try:
+                    search_results = self._search_raw(keyword, limit)
+                    extract = self._extract_json_post
+                except (requests.RequestException, ValueError, KeyError) as e:
+                    logger.warning(f"⚠️  Direct search failed for '{keyword}', using PRAW search: {e}")
+            
+            if search_results is None:
+                # Search across all subreddits or specific ones
+                subreddit = self.reddit.subreddit(_SUBREDDIT_QUERY)
+                
+                # Perform the search
+                # sort: 'hot', 'new', 'top', 'rising'
+                # time_filter: 'hour', 'day', 'week', 'month', 'year', 'all'
+                search_results = subreddit.search(
+                    query=keyword,
+                    sort=_SORT,
+                    time_filter=_TIME_FILTER,
+                    limit=limit
+                )
             
             # Process each post
+            # No per-post sleep: the listing arrives in pages of up to 100
+            # posts, and each page request is paced by send_with_rate_limit
             for post in search_results:
+                post_id = post['id'] if isinstance(post, dict) else post.id
                 try:
+                    # Another keyword already extracted this post
+                    seen_post = self._seen_posts.get(post_id)
+                    if seen_post is not None:
+                        posts_data.append(replace(seen_post, search_keyword=keyword))
+                        continue
+                    
+                    # Reuse a fresh extraction from an earlier run if there is one
+                    cached_post = self._load_cached_posts([post_id]).get(post_id)
+                    if cached_post is not None:
+                        self._seen_posts[post_id] = cached_post
+                        posts_data.append(replace(cached_post, search_keyword=keyword))
+                        continue
+                    
                     # Extract post data
-                    post_data = self._extract_post_data(post, keyword)
+                    post_data = extract(post, keyword, collection_timestamp)
                     posts_data.append(post_data)
-                    
-                    # Small delay to be respectful to the API
-                    time.sleep(0.1)
+                    new_posts.append(post_data)
+                    if isinstance(post_data, RedditPost):
+                        self._seen_posts[post_id] = post_data
                     
                 except Exception as e:
-                    logger.warning(f"⚠️  Error processing post {post.id}: {e}")
+                    logger.warning("⚠️  Error processing post %s: %s", post_id, e)
                     continue
             
-            logger.info(f"Found {len(posts_data)} posts for keyword '{keyword}'")
+            self._store_cached_posts(new_posts)
+            logger.info(f"Found {len(posts_data)} posts for keyword '{keyword}' ({len(new_posts)} newly extracted)")
             
         except (RedditAPIException, ClientException) as e:
             logger.error(f"Reddit API error for keyword '{keyword}': {e}")
@@ -166,75 +440,316 @@ class RedditDataCollector:
         
         return posts_data
     
-    def _extract_post_data(self, post, keyword: str) -> Dict[str, Any]:
+    def _pushshift_ids(self, keyword: str, limit: int) -> List[str]:
+        """
+        Find submission IDs for a keyword with one Pushshift-style bulk query
+        
+        Args:
+            keyword (str): Keyword to search for
+            limit (int): Maximum number of IDs to return
+            
+        Returns:
+            List[str]: Submission IDs (without the t3_ prefix)
+        """
+        params = {
+            'q': keyword,
+            'size': limit,
+            'sort': 'desc',
+            'sort_type': 'score' if _SORT == 'top' else 'created_utc'
+        }
+        
+        time_filter_seconds = TIME_FILTER_SECONDS.get(_TIME_FILTER)
+        if time_filter_seconds:
+            params['after'] = int(time.time()) - time_filter_seconds
+        if not _SEARCH_ALL:
+            params['subreddit'] = ','.join(_SUBREDDITS)
+        
+        response = requests.get(REDDIT_PUSHSHIFT_URL, params=params, timeout=30)
+        response.raise_for_status()
+        return [item['id'] for item in orjson.loads(response.content)['data']]
+    
+    def _get_access_token(self) -> str:
+        """
+        Get an app-only OAuth token, requesting a new one when it is about to expire
+        
+        Returns:
+            str: Bearer token for oauth.reddit.com
+        """
+        with self._access_token_lock:
+            if self._access_token is None or time.time() >= self._access_token_expires:
+                response = self._http.post(
+                    REDDIT_TOKEN_URL,
+                    auth=(REDDIT_CONFIG['client_id'], REDDIT_CONFIG['client_secret']),
+                    data={'grant_type': 'client_credentials'},
+                    timeout=30
+                )
+                response.raise_for_status()
+                token = orjson.loads(response.content)
+                self._access_token = token['access_token']
+                # Refresh a minute early so a token never expires mid-search
+                self._access_token_expires = time.time() + token.get('expires_in', 3600) - 60
+            return self._access_token
+    
+    def _search_raw(self, keyword: str, limit: int) -> Iterator[Dict[str, Any]]:
+        """
+        Search Reddit through the JSON API, without PRAW objects
+        
+        Pages through the listing 100 posts at a time, sharing
+        REDDIT_RATE_LIMITER with the PRAW requests. The first page is
+        fetched before returning, so request errors surface here; each
+        following page is requested in the background while the caller
+        is still working through the current one.
+        
+        Args:
+            keyword (str): Keyword to search for
+            limit (int): Maximum number of posts to return
+            
+        Returns:
+            Iterator[Dict[str, Any]]: Raw post data from the listing
+        """
+        url = f"{REDDIT_OAUTH_URL}/r/{_SUBREDDIT_QUERY}/search"
+        
+        params = {
+            'q': keyword,
+            'sort': _SORT,
+            't': _TIME_FILTER,
+            'restrict_sr': 'on',
+            'raw_json': 1
+        }
+        
+        def fetch_page(after: Optional[str], page_limit: int) -> Dict[str, Any]:
+            page_params = dict(params, limit=min(100, page_limit), after=after)
+            response = send_with_rate_limit(lambda: self._http.get(
+                url,
+                params=page_params,
+                headers={'Authorization': f"bearer {self._get_access_token()}"},
+                timeout=30
+            ))
+            response.raise_for_status()
+            return orjson.loads(response.content)['data']
+        
+        def iter_posts(listing: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+            fetched = len(listing['children'])
+            with ThreadPoolExecutor(max_workers=1) as prefetcher:
+                while True:
+                    after = listing.get('after')
+                    next_page = None
+                    if listing['children'] and after is not None and fetched < limit:
+                        next_page = prefetcher.submit(fetch_page, after, limit - fetched)
+                    
+                    for child in listing['children']:
+                        yield child['data']
+                    
+                    if next_page is None:
+                        return
+                    listing = next_page.result()
+                    fetched += len(listing['children'])
+        
+        return iter_posts(fetch_page(None, limit))
+    
+    def _load_cached_posts(self, post_ids: List[str]) -> Dict[str, RedditPost]:
+        """
+        Get posts extracted within the last REDDIT_POST_CACHE_TTL seconds
+        
+        Args:
+            post_ids (List[str]): Post IDs to look up
+            
+        Returns:
+            Dict[str, RedditPost]: Cached posts keyed by post_id (fresh ones only)
+        """
+        cutoff = int(time.time()) - REDDIT_POST_CACHE_TTL
+        cached = {}
+        
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(post_ids), 500):
+            chunk = post_ids[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            with self._post_cache_lock:
+                rows = self._post_cache.execute(
+                    f"SELECT id, json FROM posts WHERE ts >= ? AND id IN ({placeholders})",
+                    (cutoff, *chunk)
+                ).fetchall()
+            for post_id, blob in rows:
+                cached[post_id] = RedditPost.from_dict(orjson.loads(blob))
+        
+        return cached
+    
+    def _store_cached_posts(self, posts: List[PostRecord]) -> None:
+        """
+        Save newly extracted posts to the cache in one transaction
+        
+        Args:
+            posts (List[PostRecord]): Posts to store (error dicts are skipped)
+        """
+        now = int(time.time())
+        rows = [
+            (post.post_id, orjson.dumps(post.to_dict()), now)
+            for post in posts if isinstance(post, RedditPost)
+        ]
+        if not rows:
+            return
+        
+        with self._post_cache_lock, self._post_cache:
+            self._post_cache.executemany("INSERT OR REPLACE INTO posts VALUES (?, ?, ?)", rows)
+    
+    def _subreddit_name(self, post: Submission) -> str:
+        """
+        Get a post's subreddit name, memoized by subreddit_id
+        
+        Args:
+            post (Submission): PRAW submission object
+            
+        Returns:
+            str: Subreddit display name
+        """
+        name = self._subreddit_cache.get(post.subreddit_id)
+        if name is None:
+            name = self._subreddit_cache[post.subreddit_id] = post.subreddit.display_name
+        return name
+    
+    def _author_name(self, post: Submission) -> str:
+        """
+        Get a post's author name, memoized by author_fullname
+        
+        Keyed on the listing's author_fullname field rather than
+        post.author.fullname, which would make PRAW fetch the user's profile.
+        
+        Args:
+            post (Submission): PRAW submission object
+            
+        Returns:
+            str: Author name, or '[deleted]'
+        """
+        author_id = getattr(post, 'author_fullname', None)
+        if author_id is None:
+            return str(post.author) if post.author else '[deleted]'
+        
+        name = self._author_cache.get(author_id)
+        if name is None:
+            name = self._author_cache[author_id] = str(post.author) if post.author else '[deleted]'
+        return name
+    
+    def _extract_post_data(self, post: Submission, keyword: str,
+                           collection_timestamp: Optional[str] = None) -> PostRecord:
         """
         Extract relevant data from a Reddit post
         
         Args:
-            post: PRAW submission object
+            post (Submission): PRAW submission object
             keyword (str): The keyword that was searched
+            collection_timestamp (str, optional): ISO timestamp for the post. Uses now if None.
             
         Returns:
-            Dict[str, Any]: Post data dictionary
+            PostRecord: Post data, or an error dict
         """
         try:
-            # Basic post information
-            post_data = {
-                'search_keyword': keyword,
-                'post_id': post.id,
-                'title': post.title,
-                'selftext': post.selftext[:500] if post.selftext else '',  # Limit text length
-                'score': post.score,
-                'upvote_ratio': post.upvote_ratio,
-                'num_comments': post.num_comments,
-                'created_utc': post.created_utc,
-                'created_date': datetime.fromtimestamp(post.created_utc).isoformat(),
-                'subreddit': post.subreddit.display_name,
-                'author': str(post.author) if post.author else '[deleted]',
-                'url': post.url,
-                'permalink': f"https://reddit.com{post.permalink}",
-                'is_self': post.is_self,
-                'over_18': post.over_18,
-                'spoiler': post.spoiler,
-                'stickied': post.stickied,
-                'locked': post.locked,
-                'archived': post.archived,
-                'gilded': post.gilded,
-                'collection_timestamp': datetime.now().isoformat()
-            }
+            (post_id, title, selftext, score, upvote_ratio, num_comments, created_utc,
+             url, permalink, is_self, over_18, spoiler, stickied, locked,
+             archived, gilded, link_flair_text, domain) = _get_post_fields(post)
             
-            # Add flair information if available
-            if post.link_flair_text:
-                post_data['link_flair'] = post.link_flair_text
+            return RedditPost(
+                search_keyword=keyword,
+                post_id=post_id,
+                title=title,
+                selftext=selftext[:500] if selftext else '',  # Limit text length
+                score=score,
+                upvote_ratio=upvote_ratio,
+                num_comments=num_comments,
+                created_utc=created_utc,
+                created_date=_fromtimestamp(created_utc).isoformat(),
+                subreddit=self._subreddit_name(post),
+                author=self._author_name(post),
+                url=url,
+                permalink=f"https://reddit.com{permalink}",
+                is_self=is_self,
+                over_18=over_18,
+                spoiler=spoiler,
+                stickied=stickied,
+                locked=locked,
+                archived=archived,
+                gilded=gilded,
+                collection_timestamp=collection_timestamp or datetime.now().isoformat(),
+                # Flair if available, domain for external links
+                link_flair=link_flair_text or None,
+                domain=None if is_self else domain
+            )
             
-            # Add domain for external links
-            if not post.is_self:
-                post_data['domain'] = post.domain
+        except Exception as e:
+            logger.error("Error extracting data from post: %s", e)
+            return {
+                'search_keyword': keyword,
+                'post_id': getattr(post, 'id', 'unknown'),
+                'error': str(e),
+                'collection_timestamp': collection_timestamp or datetime.now().isoformat()
+            }
+    
+    def _extract_json_post(self, post: Dict[str, Any], keyword: str,
+                           collection_timestamp: Optional[str] = None) -> PostRecord:
+        """
+        Extract relevant data from a raw JSON post (see _search_raw)
+        
+        Args:
+            post (Dict[str, Any]): Post data from a search listing
+            keyword (str): The keyword that was searched
+            collection_timestamp (str, optional): ISO timestamp for the post. Uses now if None.
             
-            return post_data
+        Returns:
+            PostRecord: Post data, or an error dict
+        """
+        try:
+            return RedditPost(
+                search_keyword=keyword,
+                post_id=post['id'],
+                title=post['title'],
+                selftext=post['selftext'][:500] if post.get('selftext') else '',  # Limit text length
+                score=post['score'],
+                upvote_ratio=post['upvote_ratio'],
+                num_comments=post['num_comments'],
+                created_utc=post['created_utc'],
+                created_date=_fromtimestamp(post['created_utc']).isoformat(),
+                subreddit=post['subreddit'],
+                author=post.get('author') or '[deleted]',
+                url=post['url'],
+                permalink=f"https://reddit.com{post['permalink']}",
+                is_self=post['is_self'],
+                over_18=post['over_18'],
+                spoiler=post['spoiler'],
+                stickied=post['stickied'],
+                locked=post['locked'],
+                archived=post['archived'],
+                gilded=post.get('gilded', 0),
+                collection_timestamp=collection_timestamp or datetime.now().isoformat(),
+                # Flair if available, domain for external links
+                link_flair=post.get('link_flair_text') or None,
+                domain=None if post['is_self'] else post.get('domain')
+            )
             
         except Exception as e:
-            logger.error(f"Error extracting data from post: {e}")
+            logger.error("Error extracting data from post: %s", e)
             return {
                 'search_keyword': keyword,
-                'post_id': getattr(post, 'id', 'unknown'),
+                'post_id': post.get('id', 'unknown'),
                 'error': str(e),
-                'collection_timestamp': datetime.now().isoformat()
+                'collection_timestamp': collection_timestamp or datetime.now().isoformat()
             }
     
-    def get_top_posts_from_subreddit(self, subreddit_name: str, limit: int = 25) -> List[Dict[str, Any]]:
+    def get_top_posts_from_subreddit(self, subreddit_name: str, limit: int = 25,
+                                     collection_timestamp: Optional[str] = None) -> List[PostRecord]:
         """
         Get top posts from a specific subreddit
         
         Args:
             subreddit_name (str): Name of the subreddit
             limit (int): Number of posts to fetch
+            collection_timestamp (str, optional): ISO timestamp stamped on every post. Uses now if None.
             
         Returns:
-            List[Dict[str, Any]]: List of post data
+            List[PostRecord]: List of extracted posts
         """
         logger.info(f"Fetching top posts from r/{subreddit_name}")
         
+        if collection_timestamp is None:
+            collection_timestamp = datetime.now().isoformat()
         posts_data = []
         
         try:
@@ -242,18 +757,17 @@ class RedditDataCollector:
             
             # Get top posts from the subreddit
             top_posts = subreddit.top(
-                time_filter=REDDIT_SETTINGS['time_filter'],
+                time_filter=_TIME_FILTER,
                 limit=limit
             )
             
             for post in top_posts:
                 try:
-                    post_data = self._extract_post_data(post, f"top_from_{subreddit_name}")
+                    post_data = self._extract_post_data(post, f"top_from_{subreddit_name}", collection_timestamp)
                     posts_data.append(post_data)
-                    time.sleep(0.1)
                     
                 except Exception as e:
-                    logger.warning(f"⚠️  Error processing post from r/{subreddit_name}: {e}")
+                    logger.warning("⚠️  Error processing post from r/%s: %s", subreddit_name, e)
                     continue
             
             logger.info(f"Collected {len(posts_data)} posts from r/{subreddit_name}")
@@ -294,7 +808,6 @@ class RedditDataCollector:
                         'collection_timestamp': datetime.now().isoformat()
                     }
                     trending_data.append(subreddit_data)
-                    time.sleep(0.1)
                     
                 except Exception as e:
                     logger.warning(f"Error processing subreddit: {e}")
@@ -308,12 +821,19 @@ class RedditDataCollector:
         return trending_data
 
 
-def collect_all_reddit_data(keywords: Optional[List[str]] = None) -> Dict[str, Any]:
+def collect_all_reddit_data(keywords: Optional[List[str]] = None, stream: bool = False) -> Dict[str, Any]:
     """
     Collect all Reddit data for given keywords
     
+    With stream=True each keyword's posts are appended to the NDJSON posts
+    file (one post per line) as soon as its search finishes, instead of
+    being held until the end. The returned dict then only carries
+    collection_info (with a 'streamed_records' count), trending subreddits
+    and any per-keyword errors; save_reddit_data writes those to the sidecar.
+    
     Args:
         keywords (List[str], optional): Keywords to search. Uses DEFAULT_KEYWORDS if None.
+        stream (bool): Whether to write posts incrementally
         
     Returns:
         Dict[str, Any]: Complete Reddit data
@@ -333,6 +853,9 @@ def collect_all_reddit_data(keywords: Optional[List[str]] = None) -> Dict[str, A
             'collection_timestamp': datetime.now().isoformat()
         }
     
+    # One timestamp for every post in this run, so posts group by run
+    run_timestamp = datetime.now().isoformat()
+    
     # Data structure to store all results
     all_data = {
         'collection_info': {
@@ -342,30 +865,60 @@ def collect_all_reddit_data(keywords: Optional[List[str]] = None) -> Dict[str, A
             'sort_method': REDDIT_SETTINGS['sort'],
             'time_filter': REDDIT_SETTINGS['time_filter'],
             'max_posts_per_keyword': REDDIT_SETTINGS['limit'],
-            'collection_timestamp': datetime.now().isoformat()
+            'collection_timestamp': run_timestamp
         },
         'keyword_posts': {},
         'trending_subreddits': []
     }
     
+    if stream:
+        ensure_data_directory()
+        all_data['collection_info']['streamed_records'] = 0
+    
+    def store(key: str, posts_data: Union[List[PostRecord], Dict[str, Any]]) -> None:
+        if not stream or not isinstance(posts_data, list):
+            all_data['keyword_posts'][key] = posts_data
+            return
+        # One write per keyword: the whole batch goes out in a single call
+        lines = b''.join(
+            orjson.dumps(post.to_dict() if isinstance(post, RedditPost) else post, default=str) + b'\n'
+            for post in posts_data
+        )
+        with open(DATA_PATHS['reddit_posts_stream'], 'ab') as f:
+            f.write(lines)
+        all_data['collection_info']['streamed_records'] += len(posts_data)
+    
     # 1. Search posts for each keyword
-    for keyword in keywords:
-        try:
-            logger.info(f"Processing keyword: {keyword}")
-            posts_data = collector.search_posts_by_keyword(keyword)
-            all_data['keyword_posts'][keyword] = posts_data
-            
-            # Delay between keywords to respect rate limits
-            time.sleep(API_DELAYS['reddit'])
+    # Keywords run in parallel on one shared client; every request still
+    # goes through REDDIT_RATE_LIMITER, so no delay between keywords
+    keyword_results = {}
+    with ThreadPoolExecutor(max_workers=REDDIT_MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(collector.search_posts_by_keyword, keyword, collection_timestamp=run_timestamp): keyword
+            for keyword in keywords
+        }
+        for future in as_completed(futures):
+            keyword = futures[future]
+            try:
+                posts_data = future.result()
+            except Exception as e:
+                logger.error(f"Error collecting data for keyword '{keyword}': {e}")
+                posts_data = {
+                    'error': str(e),
+                    'keyword': keyword,
+                    'timestamp': datetime.now().isoformat()
+                }
             
-        except Exception as e:
-            logger.error(f"Error collecting data for keyword '{keyword}': {e}")
-            all_data['keyword_posts'][keyword] = {
-                'error': str(e),
-                'keyword': keyword,
-                'timestamp': datetime.now().isoformat()
-            }
-            continue
+            # Streamed posts are written as each keyword completes
+            if stream:
+                store(keyword, posts_data)
+            else:
+                keyword_results[keyword] = posts_data
+    
+    # Keep keywords in input order
+    for keyword in keywords:
+        if keyword in keyword_results:
+            store(keyword, keyword_results[keyword])
     
     # 2. Get trending subreddits (optional)
     try:
@@ -384,7 +937,7 @@ def collect_all_reddit_data(keywords: Optional[List[str]] = None) -> Dict[str, A
     total_posts = sum(
         len(posts) if isinstance(posts, list) else 0 
         for posts in all_data['keyword_posts'].values()
-    )
+    ) + all_data['collection_info'].get('streamed_records', 0)
     
     all_data['collection_info']['total_posts_collected'] = total_posts
     all_data['collection_info']['trending_subreddits_count'] = len(all_data['trending_subreddits'])
@@ -397,6 +950,11 @@ def save_reddit_data(data: Dict[str, Any], filepath: Optional[str] = None, use_p
     """
     Save Reddit data to JSON file with persistence option
     
+    Data collected with stream=True has its posts on disk already, so only
+    the rest (collection_info, trending subreddits, errors) is written, to
+    the reddit_collection_info sidecar next to the NDJSON posts file.
+    A filepath ending in .gz is written gzip-compressed.
+    
     Args:
         data (Dict[str, Any]): Data to save
         filepath (str, optional): File path. Uses default if None.
@@ -409,6 +967,15 @@ def save_reddit_data(data: Dict[str, Any], filepath: Optional[str] = None, use_p
         filepath = DATA_PATHS['raw_reddit_data']
     
     try:
+        if 'streamed_records' in data.get('collection_info', {}):
+            ensure_data_directory()
+            with open(DATA_PATHS['reddit_collection_info'], 'wb') as f:
+                f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+            logger.info(f"✅ Reddit collection info saved to: {DATA_PATHS['reddit_collection_info']}")
+            return True
+        
+        data = posts_to_dicts(data)
+        
         if use_persistence:
             # Use new persistence system to append data
             from data_persistence import append_reddit_data
@@ -422,8 +989,13 @@ def save_reddit_data(data: Dict[str, Any], filepath: Optional[str] = None, use_p
         # Fallback to overwrite or if persistence is disabled
         ensure_data_directory()
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        payload = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+        if filepath.endswith('.gz'):
+            with gzip.open(filepath, 'wb', compresslevel=3) as f:
+                f.write(payload)
+        else:
+            with open(filepath, 'wb') as f:
+                f.write(payload)
         
         logger.info(f"Reddit data saved to: {filepath}")
         return True
@@ -437,6 +1009,11 @@ def main():
     """
     Main function to run Reddit data collection
     """
+    parser = argparse.ArgumentParser(description="Collect Reddit posts for the default keywords")
+    parser.add_argument('--stream', action='store_true',
+                        help="Append each keyword's posts to the NDJSON posts file as soon as they are fetched")
+    args = parser.parse_args()
+    
     print("Reddit Data Collector")
     print("=" * 40)
     
@@ -459,7 +1036,7 @@ def main():
         
         # Collect all data
         print("Starting data collection...")
-        all_data = collect_all_reddit_data(keywords)
+        all_data = collect_all_reddit_data(keywords, stream=args.stream)
         
         # Check if collection was successful
         if 'error' in all_data:
@@ -472,7 +1049,10 @@ def main():
         
         if success:
             print(f"Data collection completed successfully!")
-            print(f"Data saved to: {DATA_PATHS['raw_reddit_data']}")
+            if args.stream:
+                print(f"Posts appended to: {DATA_PATHS['reddit_posts_stream']}")
+            else:
+                print(f"Data saved to: {DATA_PATHS['raw_reddit_data']}")
             
             # Print summary statistics
             info = all_data['collection_info']
@@ -12,16 +12,27 @@ It collects:
 Author: Web Scraping Project
 """
 
-import json
+import re
 import time
+import operator
 import logging
+import argparse
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 import os
+import orjson
 import tweepy
+import zstandard
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import *
 from fetch_twitter_nitter import collect_twitter_data_via_nitter
+from rate_limiter import RateLimiter
 
 # Fix Unicode logging issues for Windows
 logging.basicConfig(
@@ -33,15 +44,183 @@ logging.basicConfig(
     ]
 )
 
-# Override the StreamHandler to avoid Unicode issues in Windows CMD
-for handler in logging.getLogger().handlers:
-    if isinstance(handler, logging.StreamHandler):
-        handler.setFormatter(logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        ))
-
 logger = logging.getLogger(__name__)
 
+# Hashtags and mentions, found in one pass: group 1 is the sign, group 2 the word
+TAG_PATTERN = re.compile(r'([#@])(\w+)')
+
+# Tweet fields read by _extract_tweet_data, fetched in one call. tweepy's
+# Tweet always sets these (None when the field was not returned)
+_get_tweet_fields = operator.attrgetter(
+    'id', 'text', 'created_at', 'author_id', 'lang', 'public_metrics', 'context_annotations'
+)
+
+# Tweet links are the status id appended to these
+TWEET_URL_PREFIX = 'https://twitter.com/user/status/'
+MOCK_TWEET_URL_PREFIX = 'https://twitter.com/mock_user/status/'
+# Most tweets search_recent_tweets returns in one page
+TWEETS_PER_REQUEST = 100
+
+# One limiter per API route, since Twitter budgets each endpoint separately;
+# shared by every thread using a client
+TWITTER_RATE_LIMITERS: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(route: str) -> RateLimiter:
+    """
+    Get the shared rate limiter for a Twitter API route
+    
+    Args:
+        route (str): API route, e.g. '/2/tweets/search/recent'
+        
+    Returns:
+        RateLimiter: Limiter for that route
+    """
+    with _rate_limiters_lock:
+        limiter = TWITTER_RATE_LIMITERS.get(route)
+        if limiter is None:
+            limiter = TWITTER_RATE_LIMITERS[route] = RateLimiter(
+                rate_per_sec=1 / API_DELAYS['twitter'],
+                burst=TWITTER_MAX_WORKERS,
+                max_delay=15 * 60,  # Twitter's rate limit window
+                name=f"Twitter {route}"
+            )
+        return limiter
+
+
+class ThrottledClient(tweepy.Client):
+    """
+    tweepy Client whose requests are paced per route from Twitter's
+    x-rate-limit-remaining / x-rate-limit-reset headers
+    
+    Callers only wait when the route's remaining budget requires it, instead
+    of sending until a 429 and then sleeping. A 429 is still retried up to
+    TWITTER_MAX_RETRIES times, waiting until the window resets. Response
+    bodies are decoded with orjson rather than requests' json module.
+    """
+    
+    def request(self, method, route, params=None, json=None, user_auth=False):
+        limiter = get_rate_limiter(route)
+        
+        for attempt in range(TWITTER_MAX_RETRIES + 1):
+            limiter.acquire()
+            try:
+                response = super().request(method, route, params=params, json=json, user_auth=user_auth)
+            except tweepy.TooManyRequests as e:
+                if attempt == TWITTER_MAX_RETRIES:
+                    raise
+                # Wait for the window to reset, or back off exponentially
+                # when Twitter did not say when that is
+                if e.reset_time:
+                    wait = max(1, e.reset_time - time.time())
+                else:
+                    wait = min(60, 2 ** attempt)
+                logger.warning(f"⚠️  Twitter rate limit hit on {route}, retrying in {wait:.0f}s")
+                time.sleep(wait)
+                continue
+            
+            remaining = response.headers.get('x-rate-limit-remaining')
+            reset = response.headers.get('x-rate-limit-reset')
+            if remaining is not None and reset is not None:
+                try:
+                    # reset is an epoch timestamp, not a duration
+                    limiter.pace(float(remaining), max(0.0, float(reset) - time.time()))
+                except ValueError:
+                    pass
+            
+            # tweepy decodes every body through response.json()
+            content = response.content
+            response.json = lambda **kwargs: orjson.loads(content)
+            return response
+
+
+@dataclass
+class TweetRecord:
+    """
+    One extracted tweet
+    
+    Slotted, so each tweet skips a per-instance dict; converted to a plain
+    dict only when handed out of the API collector (see to_dict).
+    """
+    __slots__ = (
+        'search_keyword', 'tweet_id', 'text', 'created_at', 'author_id',
+        'author_username', 'author_name', 'author_verified', 'lang', 'url',
+        'collection_timestamp', 'retweet_count', 'like_count', 'reply_count',
+        'quote_count', 'author_followers_count', 'author_following_count',
+        'author_tweet_count', 'author_listed_count', 'hashtags', 'mentions',
+        'hashtag_count', 'mention_count', 'context_annotations'
+    )
+    
+    search_keyword: str
+    tweet_id: int
+    text: str
+    created_at: str
+    author_id: int
+    author_username: str
+    author_name: str
+    author_verified: bool
+    lang: str
+    url: str
+    collection_timestamp: str
+    retweet_count: Optional[int]
+    like_count: Optional[int]
+    reply_count: Optional[int]
+    quote_count: Optional[int]
+    author_followers_count: Optional[int]
+    author_following_count: Optional[int]
+    author_tweet_count: Optional[int]
+    author_listed_count: Optional[int]
+    hashtags: List[str]
+    mentions: List[str]
+    hashtag_count: int
+    mention_count: int
+    context_annotations: Optional[List[Dict[str, str]]]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for saving; metrics and contexts only when present"""
+        return {
+            name: value for name in self.__slots__
+            if (value := getattr(self, name)) is not None
+        }
+
+
+@dataclass
+class AuthorRecord:
+    """
+    The author fields copied onto every tweet, extracted once per user
+    
+    Popular accounts show up under many keywords; the collector caches one
+    record per author_id instead of re-reading the tweepy user each time.
+    """
+    __slots__ = (
+        'username', 'name', 'verified', 'followers_count', 'following_count',
+        'tweet_count', 'listed_count'
+    )
+    
+    username: str
+    name: str
+    verified: bool
+    followers_count: Optional[int]
+    following_count: Optional[int]
+    tweet_count: Optional[int]
+    listed_count: Optional[int]
+    
+    @classmethod
+    def from_user(cls, user) -> 'AuthorRecord':
+        """Build a record from a tweepy User (or {} when the author is unknown)"""
+        user_metrics = getattr(user, 'public_metrics', None) or {}
+        return cls(
+            username=user.username if user else '',
+            name=user.name if user else '',
+            verified=getattr(user, 'verified', False),
+            followers_count=user_metrics.get('followers_count', 0) if user_metrics else None,
+            following_count=user_metrics.get('following_count', 0) if user_metrics else None,
+            tweet_count=user_metrics.get('tweet_count', 0) if user_metrics else None,
+            listed_count=user_metrics.get('listed_count', 0) if user_metrics else None
+        )
+
+
 
 class TwitterDataCollector:
     """
@@ -66,18 +245,33 @@ class TwitterDataCollector:
         
         try:
             # Initialize Twitter API client using Bearer Token (for API v2)
-            self.client = tweepy.Client(
+            # Rate limits are handled by ThrottledClient, not tweepy's sleep
+            self.client = ThrottledClient(
                 bearer_token=TWITTER_CONFIG['bearer_token'],
                 consumer_key=TWITTER_CONFIG['api_key'],
                 consumer_secret=TWITTER_CONFIG['api_secret'],
                 access_token=TWITTER_CONFIG['access_token'],
                 access_token_secret=TWITTER_CONFIG['access_token_secret'],
-                wait_on_rate_limit=True  # Automatically handle rate limiting
+                wait_on_rate_limit=False
             )
             
+            # Pool connections so every keyword thread keeps a warm one, and
+            # retry transient server errors at the adapter (429s are left to
+            # ThrottledClient, which knows when the window resets)
+            adapter = HTTPAdapter(
+                pool_connections=TWITTER_MAX_WORKERS,
+                pool_maxsize=TWITTER_MAX_WORKERS,
+                max_retries=Retry(total=3, backoff_factor=1.0, status_forcelist=[500, 502, 503, 504])
+            )
+            self.client.session.mount('https://', adapter)
+            self.client.session.headers['Connection'] = 'keep-alive'
+            
+            # Authors seen so far, shared by every keyword batch of the run
+            self._author_cache: Dict[Any, AuthorRecord] = {}
+            
             logger.info("Twitter API connection established")
             logger.info(f"   API Version: v2")
-            logger.info(f"   Rate limiting: Enabled")
+            logger.info(f"   Rate limiting: Paced from rate limit headers")
             
         except ImportError:
             logger.error("tweepy not installed. Install with: pip install tweepy")
@@ -106,7 +300,7 @@ class TwitterDataCollector:
             logger.error(f"Twitter API connection test failed: {e}")
             return False
     
-    def search_tweets_by_keyword(self, keyword: str, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+    def search_tweets_by_keyword(self, keyword: str, max_results: Optional[int] = None) -> List[TweetRecord]:
         """
         Search Twitter for tweets containing the keyword
         
@@ -115,12 +309,33 @@ class TwitterDataCollector:
             max_results (int, optional): Maximum number of tweets to fetch
             
         Returns:
-            List[Dict[str, Any]]: List of tweet data dictionaries
+            List[TweetRecord]: Extracted tweets; malformed tweets are skipped
+        """
+        return self.search_tweets_by_keywords([keyword], max_results)
+    
+    def search_tweets_by_keywords(self, keywords: List[str], max_results: Optional[int] = None) -> List[TweetRecord]:
+        """
+        Search Twitter for several keywords with one OR-joined query
+        
+        Each tweet is recorded once for every keyword of the batch whose
+        words all appear in its text; tweets matching none are skipped.
+        A single keyword matches every tweet returned. The batch shares one
+        page of max_results tweets per keyword (at most 100, see
+        batch_keyword_queries), so a keyword can get fewer than
+        max_results when the others match more of the page.
+        
+        Args:
+            keywords (List[str]): Keywords to search for (see batch_keyword_queries)
+            max_results (int, optional): Maximum number of tweets to keep per keyword
+            
+        Returns:
+            List[TweetRecord]: Extracted tweets; malformed tweets are skipped
         """
         if max_results is None:
             max_results = TWITTER_SETTINGS['max_results']
         
-        logger.info(f"🐦 Searching Twitter for keyword: '{keyword}' (limit: {max_results})")
+        label = ', '.join(keywords)
+        logger.info(f"🐦 Searching Twitter for keywords: '{label}' (limit: {max_results} each)")
         
         tweets_data = []
         
@@ -128,10 +343,16 @@ class TwitterDataCollector:
             # Calculate start_time for recent tweets (last 7 days max for basic API)
             start_time = datetime.now() - timedelta(days=7)
             
+            if len(keywords) == 1:
+                query = keywords[0]
+            else:
+                query = ' OR '.join(f"({keyword})" for keyword in keywords)
+            
             # Search for tweets
+            # API accepts 10-100 results per request
             tweets = self.client.search_recent_tweets(
-                query=f"{keyword} -is:retweet lang:{TWITTER_SETTINGS['lang']}",  # Exclude retweets
-                max_results=min(max_results or 10, 100),  # API limit per request, handle None
+                query=f"{query} -is:retweet lang:{TWITTER_SETTINGS['lang']}",  # Exclude retweets
+                max_results=max(10, min((max_results or 10) * len(keywords), TWEETS_PER_REQUEST)),
                 tweet_fields=TWITTER_SETTINGS['tweet_fields'],
                 user_fields=TWITTER_SETTINGS['user_fields'],
                 expansions=['author_id'],
@@ -140,7 +361,7 @@ class TwitterDataCollector:
             
             tweets_data_list = getattr(tweets, 'data', None) if tweets else None
             if not tweets_data_list:
-                logger.warning(f"No tweets found for keyword: {keyword}")
+                logger.warning(f"No tweets found for keywords: {label}")
                 return []
             
             # Create a lookup dictionary for user information
@@ -149,25 +370,48 @@ class TwitterDataCollector:
             if tweets_includes and 'users' in tweets_includes:
                 users_dict = {user.id: user for user in tweets_includes['users']}
             
+            # One timestamp for the whole response
+            collection_timestamp = datetime.now().isoformat()
+            
+            # Words of each keyword, to tell which ones a tweet matched
+            keyword_words = [(keyword, keyword.lower().split()) for keyword in keywords]
+            keyword_counts = Counter()
+            
             # Process each tweet
+            # No delay needed: the tweets arrived in a single response, and
+            # ThrottledClient paces the requests themselves
+            # A malformed tweet is logged and skipped; it fails the same way
+            # for every keyword, so it is handled once per tweet
             for tweet in tweets_data_list:
-                tweet_data = self._extract_tweet_data(tweet, users_dict, keyword)
-                tweets_data.append(tweet_data)
-                
-                time.sleep(0.1)  # Small delay between processing
-            
-            logger.info(f"✅ Found {len(tweets_data)} tweets for keyword '{keyword}'")
+                try:
+                    if len(keywords) == 1:
+                        matched = keywords
+                    else:
+                        text = tweet.text.lower()
+                        matched = [keyword for keyword, words in keyword_words if all(word in text for word in words)]
+                    
+                    for keyword in matched:
+                        if keyword_counts[keyword] >= max_results:
+                            continue
+                        keyword_counts[keyword] += 1
+                        tweet_data = self._extract_tweet_data(tweet, users_dict, keyword, collection_timestamp)
+                        tweets_data.append(tweet_data)
+                except Exception as e:
+                    logger.error(f"Error extracting data from tweet {getattr(tweet, 'id', 'unknown')}: {e}")
+            
+            logger.info(f"✅ Found {len(tweets_data)} tweets for keywords '{label}'")
             
         except tweepy.TooManyRequests:
-            logger.error(f"Rate limit exceeded for keyword '{keyword}'. Try again later.")
+            logger.error(f"Rate limit exceeded for keywords '{label}'. Try again later.")
         except tweepy.Unauthorized:
-            logger.error(f"Unauthorized access for keyword '{keyword}'. Check API credentials.")
+            logger.error(f"Unauthorized access for keywords '{label}'. Check API credentials.")
         except Exception as e:
-            logger.error(f"Error searching Twitter for '{keyword}': {e}")
+            logger.error(f"Error searching Twitter for '{label}': {e}")
         
         return tweets_data
     
-    def _extract_tweet_data(self, tweet, users_dict: Dict, keyword: str) -> Dict[str, Any]:
+    def _extract_tweet_data(self, tweet, users_dict: Dict, keyword: str,
+                            collection_timestamp: Optional[str] = None) -> TweetRecord:
         """
         Extract relevant data from a Twitter tweet object
         
@@ -175,110 +419,104 @@ class TwitterDataCollector:
             tweet: Tweet object from Twitter API
             users_dict (Dict): Dictionary of user objects
             keyword (str): The keyword that was searched
+            collection_timestamp (str, optional): ISO timestamp for the tweet. Uses now if None.
             
         Returns:
-            Dict[str, Any]: Tweet data dictionary
-        """
-        try:
-            # Get user information
-            user = users_dict.get(tweet.author_id, {})
-            
-            # Basic tweet information
-            tweet_data = {
-                'search_keyword': keyword,
-                'tweet_id': tweet.id,
-                'text': tweet.text,
-                'created_at': tweet.created_at.isoformat() if tweet.created_at else '',
-                'author_id': tweet.author_id,
-                'author_username': user.username if user else '',
-                'author_name': user.name if user else '',
-                'author_verified': getattr(user, 'verified', False),
-                'lang': getattr(tweet, 'lang', ''),
-                'url': f"https://twitter.com/user/status/{tweet.id}",
-                'collection_timestamp': datetime.now().isoformat()
-            }
+            TweetRecord: The extracted tweet
             
-            # Add public metrics if available
-            if hasattr(tweet, 'public_metrics') and tweet.public_metrics:
-                metrics = tweet.public_metrics
-                tweet_data.update({
-                    'retweet_count': metrics.get('retweet_count', 0),
-                    'like_count': metrics.get('like_count', 0),
-                    'reply_count': metrics.get('reply_count', 0),
-                    'quote_count': metrics.get('quote_count', 0)
-                })
-            
-            # Add user metrics if available
-            if hasattr(user, 'public_metrics') and user.public_metrics:
-                user_metrics = user.public_metrics
-                tweet_data.update({
-                    'author_followers_count': user_metrics.get('followers_count', 0),
-                    'author_following_count': user_metrics.get('following_count', 0),
-                    'author_tweet_count': user_metrics.get('tweet_count', 0),
-                    'author_listed_count': user_metrics.get('listed_count', 0)
-                })
-            
-            # Extract hashtags and mentions
-            hashtags = self._extract_hashtags(tweet.text)
-            mentions = self._extract_mentions(tweet.text)
-            
-            tweet_data.update({
-                'hashtags': hashtags,
-                'mentions': mentions,
-                'hashtag_count': len(hashtags),
-                'mention_count': len(mentions)
-            })
-            
-            # Add context annotations if available
-            if hasattr(tweet, 'context_annotations') and tweet.context_annotations:
-                contexts = []
-                for context in tweet.context_annotations:
-                    contexts.append({
-                        'domain': context.get('domain', {}).get('name', ''),
-                        'entity': context.get('entity', {}).get('name', '')
-                    })
-                tweet_data['context_annotations'] = contexts
-            
-            return tweet_data
-            
-        except Exception as e:
-            logger.error(f"Error extracting data from tweet: {e}")
-            return {
-                'search_keyword': keyword,
-                'tweet_id': getattr(tweet, 'id', 'unknown'),
-                'error': str(e),
-                'collection_timestamp': datetime.now().isoformat()
-            }
+        Raises:
+            AttributeError: If the tweet is missing a required field
+        """
+        (tweet_id, text, created_at, author_id, lang, metrics,
+         context_annotations) = _get_tweet_fields(tweet)
+        
+        # Get user information
+        author = self._get_author(author_id, users_dict)
+        
+        # Public metrics, if available
+        metrics = metrics or {}
+        
+        # Extract hashtags and mentions
+        hashtags, mentions = self._extract_tags(text)
+        
+        # Add context annotations if available
+        contexts = None
+        if context_annotations:
+            contexts = [
+                {
+                    'domain': (context.get('domain') or {}).get('name', ''),
+                    'entity': (context.get('entity') or {}).get('name', '')
+                }
+                for context in context_annotations
+            ]
+        
+        return TweetRecord(
+            search_keyword=keyword,
+            tweet_id=tweet_id,
+            text=text,
+            created_at=created_at.isoformat() if created_at else '',
+            author_id=author_id,
+            author_username=author.username,
+            author_name=author.name,
+            author_verified=author.verified,
+            lang=lang,
+            url=TWEET_URL_PREFIX + str(tweet_id),
+            collection_timestamp=collection_timestamp or datetime.now().isoformat(),
+            retweet_count=metrics.get('retweet_count', 0) if metrics else None,
+            like_count=metrics.get('like_count', 0) if metrics else None,
+            reply_count=metrics.get('reply_count', 0) if metrics else None,
+            quote_count=metrics.get('quote_count', 0) if metrics else None,
+            author_followers_count=author.followers_count,
+            author_following_count=author.following_count,
+            author_tweet_count=author.tweet_count,
+            author_listed_count=author.listed_count,
+            hashtags=hashtags,
+            mentions=mentions,
+            hashtag_count=len(hashtags),
+            mention_count=len(mentions),
+            context_annotations=contexts
+        )
     
-    def _extract_hashtags(self, text: str) -> List[str]:
+    def _get_author(self, author_id, users_dict: Dict) -> AuthorRecord:
         """
-        Extract hashtags from tweet text
+        Get the cached author record for a tweet, extracting it on first sight
         
         Args:
-            text (str): Tweet text
+            author_id: The tweet's author_id
+            users_dict (Dict): Dictionary of user objects from the response
             
         Returns:
-            List[str]: List of hashtags (without #)
+            AuthorRecord: The author's fields (empty if the user is unknown)
         """
-        import re
-        hashtag_pattern = r'#(\w+)'
-        hashtags = re.findall(hashtag_pattern, text.lower())
-        return list(set(hashtags))  # Remove duplicates
+        author = self._author_cache.get(author_id)
+        if author is not None:
+            return author
+        
+        user = users_dict.get(author_id)
+        if user is None:
+            # Not in this response; don't cache, a later one may include it
+            return AuthorRecord.from_user({})
+        
+        if len(self._author_cache) >= TWITTER_AUTHOR_CACHE_SIZE:
+            self._author_cache.clear()
+        return self._author_cache.setdefault(author_id, AuthorRecord.from_user(user))
     
-    def _extract_mentions(self, text: str) -> List[str]:
+    def _extract_tags(self, text: str) -> Tuple[List[str], List[str]]:
         """
-        Extract mentions from tweet text
+        Extract hashtags and mentions from tweet text in a single scan
         
         Args:
             text (str): Tweet text
             
         Returns:
-            List[str]: List of mentions (without @)
+            Tuple[List[str], List[str]]: Hashtags (without #) and mentions
+            (without @), duplicates removed, in order of appearance
         """
-        import re
-        mention_pattern = r'@(\w+)'
-        mentions = re.findall(mention_pattern, text.lower())
-        return list(set(mentions))  # Remove duplicates
+        hashtags = []
+        mentions = []
+        for sign, word in TAG_PATTERN.findall(text.lower()):
+            (hashtags if sign == '#' else mentions).append(word)
+        return list(dict.fromkeys(hashtags)), list(dict.fromkeys(mentions))
     
     def get_trending_topics(self, location_id: int = 1) -> List[Dict[str, Any]]:
         """
@@ -308,11 +546,39 @@ class TwitterDataCollector:
             return []
 
 
-def generate_mock_twitter_data(keywords, tweets_per_keyword=10):
-    """Generate mock Twitter data for testing when APIs fail"""
+# Built on first use and then shared, so the client and its connection pool
+# are set up once per process rather than once per collection
+_collector: Optional[TwitterDataCollector] = None
+_collector_lock = threading.Lock()
+
+
+def get_collector() -> TwitterDataCollector:
+    """
+    Get the process-wide Twitter collector, creating it on first use
+    
+    Returns:
+        TwitterDataCollector: The shared collector
+        
+    Raises:
+        ValueError: If the Twitter API configuration is invalid
+    """
+    global _collector
+    with _collector_lock:
+        if _collector is None:
+            _collector = TwitterDataCollector()
+        return _collector
+
+
+def generate_mock_twitter_data(keywords, tweets_per_keyword=10) -> Iterator[Dict[str, Any]]:
+    """
+    Generate mock Twitter data for testing when APIs fail
+    
+    Tweets are yielded one at a time, so a large mock run can be streamed
+    to disk without holding it; wrap in list() where a list is needed.
+    """
     logger.info("📊 Generating mock Twitter data for testing...")
     
-    mock_tweets = []
+    mock_count = 0
     base_date = datetime.now()
     
     sample_tweets = [
@@ -328,98 +594,188 @@ def generate_mock_twitter_data(keywords, tweets_per_keyword=10):
         "Community discussion: Share your {keyword} success stories!"
     ]
     
+    # The numeric columns depend only on the tweet index, so compute them
+    # once instead of once per keyword
+    numeric_columns = [
+        (max(1, (j * 3) % 50), max(0, (j * 2) % 25), max(0, j % 15),
+         j % 3 == 0, 1000 + (j * 100), round(0.1 + (j % 9) * 0.1, 1))
+        for j in range(tweets_per_keyword)
+    ]
+    tweet_offsets = [timedelta(hours=j * 0.5) for j in range(tweets_per_keyword)]
+    sample_count = len(sample_tweets)
+    
     for i, keyword in enumerate(keywords):
         logger.info(f"📝 Generating mock data for: {keyword}")
         
-        for j in range(tweets_per_keyword):
+        # Everything that depends only on the keyword
+        texts = [sample.format(keyword=keyword) for sample in sample_tweets]
+        keyword_slug = keyword.replace(' ', '').lower()
+        user_base = f'user_{keyword.lower().replace(" ", "")}'
+        keyword_date = base_date - timedelta(hours=i * 2)
+        
+        for j, (likes, retweets, replies, verified, followers, sentiment) in enumerate(numeric_columns):
             # Create realistic mock tweet
-            text = sample_tweets[j % len(sample_tweets)].format(keyword=keyword)
-            created_at = base_date - timedelta(hours=i*2 + j*0.5)
+            mock_id = f'mock_{i}_{j}'
+            created_at = keyword_date - tweet_offsets[j]
             
             mock_tweet = {
-                'id': f'mock_{i}_{j}',
-                'text': text,
-                'author_username': f'user_{keyword.lower().replace(" ", "")}_{j}',
+                'id': mock_id,
+                'text': texts[j % sample_count],
+                'author_username': f'{user_base}_{j}',
                 'author_name': f'Expert User {j+1}',
                 'created_at': created_at.isoformat(),
-                'like_count': max(1, (j * 3) % 50),
-                'retweet_count': max(0, (j * 2) % 25),
-                'reply_count': max(0, j % 15),
+                'like_count': likes,
+                'retweet_count': retweets,
+                'reply_count': replies,
                 'source': 'twitter_mock',
                 'keyword': keyword,
-                'url': f'https://twitter.com/mock_user/status/mock_{i}_{j}',
-                'hashtags': [f"#{keyword.replace(' ', '').lower()}", "#tech"],
+                'url': MOCK_TWEET_URL_PREFIX + mock_id,
+                'hashtags': [f"#{keyword_slug}", "#tech"],
                 'mentions': [],
-                'is_verified': j % 3 == 0,  # Some verified users
-                'follower_count': 1000 + (j * 100),
-                'sentiment_score': round(0.1 + (j % 9) * 0.1, 1)  # 0.1 to 0.9
+                'is_verified': verified,  # Some verified users
+                'follower_count': followers,
+                'sentiment_score': sentiment  # 0.1 to 0.9
             }
             
-            mock_tweets.append(mock_tweet)
+            mock_count += 1
+            yield mock_tweet
+    
+    logger.info(f"📊 Generated {mock_count} mock tweets")
+
+
+def batch_keyword_queries(keywords: List[str], budget: int = 450,
+                          max_results: Optional[int] = None) -> List[List[str]]:
+    """
+    Pack keywords into batches whose OR-joined query fits the budget
+    
+    search_recent_tweets accepts queries of up to 512 characters; the
+    default budget leaves room for the retweet/language filters. A batch
+    is searched with one page of at most 100 tweets, so it also holds no
+    more keywords than fit max_results tweets each into that page.
+    
+    Args:
+        keywords (List[str]): Keywords to search
+        budget (int): Maximum length of "(kw1) OR (kw2) ..." per batch
+        max_results (int, optional): Tweets wanted per keyword. Uses TWITTER_SETTINGS if None.
+        
+    Returns:
+        List[List[str]]: Keyword batches, in input order
+    """
+    if max_results is None:
+        max_results = TWITTER_SETTINGS['max_results']
+    max_keywords = max(1, TWEETS_PER_REQUEST // max(1, max_results))
     
-    logger.info(f"📊 Generated {len(mock_tweets)} mock tweets")
-    return mock_tweets
+    batches = []
+    batch = []
+    length = 0
+    for keyword in keywords:
+        # "(keyword)", plus " OR " when joined to a previous one
+        added = len(keyword) + 2 + (4 if batch else 0)
+        if batch and (length + added > budget or len(batch) >= max_keywords):
+            batches.append(batch)
+            batch = []
+            added = len(keyword) + 2
+            length = 0
+        batch.append(keyword)
+        length += added
+    if batch:
+        batches.append(batch)
+    return batches
 
 
 def collect_twitter_data_api(keywords):
-    """Try to collect data via Twitter API"""
-    try:
-        # This function would contain the Twitter API logic
-        # For now, return empty list to trigger fallback
-        logger.info("Twitter API collection attempted")
+    """
+    Try to collect data via Twitter API
+    
+    Keywords are packed into OR-joined queries (see batch_keyword_queries),
+    so N keywords cost a handful of requests instead of N. Batches run in
+    parallel on one shared client; ThrottledClient paces the requests.
+    Returns an empty list (triggering the fallbacks) when the API is
+    disabled (TWITTER_USE_API), not configured, or nothing was found.
+    """
+    if not TWITTER_USE_API:
+        logger.info("Twitter API collection disabled (set TWITTER_USE_API=true to enable)")
         return []
+    
+    try:
+        collector = get_collector()
+        # Author metrics change between runs; only reuse them within one
+        collector._author_cache.clear()
+        
+        with ThreadPoolExecutor(max_workers=TWITTER_MAX_WORKERS) as executor:
+            results = executor.map(collector.search_tweets_by_keywords, batch_keyword_queries(keywords))
+            api_tweets = [tweet.to_dict() for tweets in results for tweet in tweets]
+        
+        # Group by keyword in input order, like per-keyword searches would
+        keyword_order = {keyword: index for index, keyword in enumerate(keywords)}
+        api_tweets.sort(key=lambda tweet: keyword_order.get(tweet['search_keyword'], len(keywords)))
+        
+        logger.info(f"Twitter API collection attempted: {len(api_tweets)} tweets")
+        return api_tweets
     except Exception as e:
         logger.error(f"Twitter API error: {e}")
         return []
 
 
+def iter_twitter_data(keywords: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield Twitter data from the first source that returns any
+    
+    Tries the Twitter API, then Nitter scraping, then falls back to mock
+    data. Mock tweets are yielded as they are generated, so streaming
+    callers never hold the whole run in memory.
+    """
+    if keywords is None:
+        keywords = DEFAULT_KEYWORDS
+    
+    logger.info(f"Starting Twitter data collection for {len(keywords)} keywords")
+    
+    # Try Twitter API first
+    logger.info("🐦 Attempting Twitter API collection...")
+    try:
+        api_tweets = collect_twitter_data_api(keywords)
+        if api_tweets and len(api_tweets) > 0:
+            logger.info(f"✅ Twitter API succeeded: {len(api_tweets)} tweets")
+            yield from api_tweets
+            return
+        else:
+            logger.warning("⚠️  Twitter API returned no data (likely rate limited)")
+    except Exception as e:
+        logger.error(f"❌ Twitter API failed: {str(e)}")
+    
+    # Fallback to Nitter scraping
+    logger.info("🔄 Falling back to Nitter scraping...")
+    try:
+        # The Nitter collector returns a whole collection; only its tweets
+        # are yielded
+        nitter_data = collect_twitter_data_via_nitter(keywords)
+        nitter_tweets = nitter_data.get('tweets', []) if nitter_data else []
+        if nitter_tweets:
+            logger.info(f"✅ Nitter scraping succeeded: {len(nitter_tweets)} tweets")
+            yield from nitter_tweets
+            return
+        else:
+            logger.warning("⚠️  Nitter scraping returned no data")
+    except Exception as e:
+        logger.error(f"❌ Nitter scraping failed: {str(e)}")
+    
+    # Final fallback: Generate mock data for testing
+    logger.info("🔄 Both methods failed. Generating mock data for testing...")
+    yield from generate_mock_twitter_data(keywords, tweets_per_keyword=5)
+
+
 def collect_all_twitter_data(keywords: Optional[List[str]] = None):
     """Main function to collect Twitter data with multiple fallbacks"""
     if keywords is None:
         keywords = DEFAULT_KEYWORDS
-    all_tweets = []
     
     try:
-        logger.info(f"Starting Twitter data collection for {len(keywords)} keywords")
-        
-        # Try Twitter API first
-        logger.info("🐦 Attempting Twitter API collection...")
-        try:
-            api_tweets = collect_twitter_data_api(keywords)
-            if api_tweets and len(api_tweets) > 0:
-                logger.info(f"✅ Twitter API succeeded: {len(api_tweets)} tweets")
-                all_tweets.extend(api_tweets)
-                return all_tweets
-            else:
-                logger.warning("⚠️  Twitter API returned no data (likely rate limited)")
-        except Exception as e:
-            logger.error(f"❌ Twitter API failed: {str(e)}")
-        
-        # Fallback to Nitter scraping
-        logger.info("🔄 Falling back to Nitter scraping...")
-        try:
-            nitter_tweets = collect_twitter_data_via_nitter()
-            if nitter_tweets and len(nitter_tweets) > 0:
-                logger.info(f"✅ Nitter scraping succeeded: {len(nitter_tweets)} tweets")
-                all_tweets.extend(nitter_tweets)
-                return all_tweets
-            else:
-                logger.warning("⚠️  Nitter scraping returned no data")
-        except Exception as e:
-            logger.error(f"❌ Nitter scraping failed: {str(e)}")
-        
-        # Final fallback: Generate mock data for testing
-        logger.info("🔄 Both methods failed. Generating mock data for testing...")
-        mock_tweets = generate_mock_twitter_data(keywords, tweets_per_keyword=5)
-        all_tweets.extend(mock_tweets)
-        logger.info(f"📊 Using {len(mock_tweets)} mock tweets for development/testing")
-        
-        return all_tweets
+        return list(iter_twitter_data(keywords))
         
     except Exception as e:
         logger.error(f"❌ Complete Twitter data collection failed: {str(e)}")
         # Even if everything fails, return mock data
-        return generate_mock_twitter_data(keywords, tweets_per_keyword=3)
+        return list(generate_mock_twitter_data(keywords, tweets_per_keyword=3))
 
 
 def save_twitter_data(data: Dict[str, Any], filepath: Optional[str] = None, use_persistence: bool = True) -> bool:
@@ -451,8 +807,8 @@ def save_twitter_data(data: Dict[str, Any], filepath: Optional[str] = None, use_
         # Fallback to overwrite or if persistence is disabled
         ensure_data_directory()
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         logger.info(f"📁 Twitter data saved to: {filepath}")
         return True
@@ -462,11 +818,76 @@ def save_twitter_data(data: Dict[str, Any], filepath: Optional[str] = None, use_
         return False
 
 
+def tweet_keyword(tweet: Dict[str, Any]) -> str:
+    """The keyword a tweet was collected for, whichever source it came from"""
+    return tweet.get('keyword') or tweet.get('search_keyword') or 'Unknown'
+
+
+def stream_twitter_data(tweets: Iterable[Dict[str, Any]], filepath: Optional[str] = None) -> Counter:
+    """
+    Append tweets to an NDJSON file, one JSON object per line
+    
+    Each tweet is written as it is read from `tweets`, so a generator is
+    never materialized; items that are not dicts are skipped. A filepath
+    ending in .zst (the default) is zstd-compressed, one frame per call,
+    so later runs simply append.
+    Read it back with data_persistence.iter_jsonl_records.
+    
+    Args:
+        tweets (Iterable[Dict[str, Any]]): Tweets to write
+        filepath (str, optional): File path. Uses DATA_PATHS['twitter_tweets_stream'] if None.
+        
+    Returns:
+        Counter: Number of tweets written per keyword
+    """
+    if filepath is None:
+        filepath = DATA_PATHS['twitter_tweets_stream']
+    
+    ensure_data_directory()
+    
+    keyword_counts = Counter()
+    skipped = 0
+    with open(filepath, 'ab') as f:
+        writer = f
+        if filepath.endswith('.zst'):
+            writer = zstandard.ZstdCompressor(level=3).stream_writer(f, closefd=False)
+        with writer:
+            for tweet in tweets:
+                # Anything but a tweet record would leave junk in the file
+                if not isinstance(tweet, dict):
+                    skipped += 1
+                    continue
+                writer.write(orjson.dumps(tweet, default=str, option=orjson.OPT_NON_STR_KEYS) + b'\n')
+                keyword_counts[tweet_keyword(tweet)] += 1
+    
+    if skipped:
+        logger.warning(f"⚠️ Skipped {skipped} stream items that were not tweet records")
+    logger.info(f"📁 {sum(keyword_counts.values())} tweets appended to: {filepath}")
+    return keyword_counts
+
+
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Collect Twitter data for the default keywords")
+    parser.add_argument('--stream', action='store_true',
+                        help="Append tweets to the NDJSON tweets file instead of rewriting the JSON file")
+    parser.add_argument('--pretty', action='store_true',
+                        help="Indent the JSON file for reading by hand")
+    args = parser.parse_args()
+    
     try:
         logger.info("=== Twitter Data Collection Started ===")
         
+        if args.stream:
+            # Write tweets as each source yields them
+            keyword_counts = stream_twitter_data(iter_twitter_data())
+            if keyword_counts:
+                logger.info(f"📊 Tweets per keyword: {keyword_counts.most_common(20)}")
+            else:
+                logger.error("❌ No Twitter data collected")
+            logger.info("=== Twitter Data Collection Completed ===")
+            return
+        
         # Collect Twitter data with all fallbacks
         twitter_data = collect_all_twitter_data()
         
@@ -477,15 +898,19 @@ def main():
             # Create data directory if it doesn't exist
             os.makedirs('data', exist_ok=True)
             
-            with open(raw_filename, 'w', encoding='utf-8') as f:
-                json.dump(twitter_data, f, indent=2, ensure_ascii=False, default=str)
+            # Compact unless asked otherwise: indenting doubles the file size
+            option = orjson.OPT_NON_STR_KEYS
+            if args.pretty:
+                option |= orjson.OPT_INDENT_2
+            with open(raw_filename, 'wb') as f:
+                f.write(orjson.dumps(twitter_data, default=str, option=option))
             
             logger.info(f"✅ Twitter data saved: {len(twitter_data)} tweets")
             logger.info(f"📁 File: {raw_filename}")
             
             # Print summary
-            keywords_found = set(tweet.get('keyword', 'Unknown') for tweet in twitter_data)
-            logger.info(f"📊 Keywords covered: {', '.join(keywords_found)}")
+            keyword_counts = Counter(map(tweet_keyword, twitter_data))
+            logger.info(f"📊 Tweets per keyword: {keyword_counts.most_common(20)}")
             
             # Print first few tweets as examples
             logger.info("📝 Sample tweets:")
@@ -10,22 +10,37 @@ This is more ethical than direct Twitter scraping but still has limitations.
 Author: Web Scraping Project
 """
 
-import json
+import orjson
 import time
+import hashlib
+import socket
 import logging
+import threading
 import requests
+from collections import Counter
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit, quote, quote_plus
+from typing import List, Dict, Any, Optional, Tuple
 from bs4 import BeautifulSoup
+import soupsieve
 import re
 
 # Local imports
 from config import (
     DEFAULT_KEYWORDS,
     DATA_PATHS,
+    API_DELAYS,
+    NITTER_MAX_WORKERS,
+    NITTER_DEBUG_HTML,
     ensure_data_directory,
     LOGGING_CONFIG
 )
+from rate_limiter import RateLimiter
 
 # Set up logging
 logging.basicConfig(
@@ -38,6 +53,182 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Compiled once; used for every tweet
+HASHTAG_PATTERN = re.compile(r'#(\w+)')
+MENTION_PATTERN = re.compile(r'@(\w+)')
+NUMBER_PATTERN = re.compile(r'\d+')
+# A labeled engagement counter in Nitter's stats markup, e.g.
+# <span class="icon-heart" title=""></span> 1,234
+STAT_PATTERN = re.compile(r'icon-(?P<stat>comment|retweet|heart)\b[^>]*>\s*(?:</span>)?\s*(?P<count>\d[\d,]*)')
+USER_HREF_PATTERN = re.compile(r'^/\w+$')
+
+# Page content that marks a parked domain vs. a real Nitter instance
+PARKING_INDICATORS = (
+    'data-adblockkey',
+    'window.park',
+    'parking',
+    'parked domain',
+    'ads.txt',
+    'adsystem'
+)
+NITTER_INDICATORS = (
+    'search',
+    'timeline',
+    'nitter',
+    'twitter',
+    'tweet'
+)
+
+# The indicators as one case-insensitive pattern each, searched straight
+# over the raw response bytes
+PARKING_PATTERN = re.compile(
+    b'|'.join(re.escape(indicator.encode()) for indicator in PARKING_INDICATORS), re.IGNORECASE
+)
+NITTER_PATTERN = re.compile(
+    b'|'.join(re.escape(indicator.encode()) for indicator in NITTER_INDICATORS), re.IGNORECASE
+)
+
+# Most body bytes read per response: enough to classify an instance when
+# probing, and a guard against oversized pages when searching
+PROBE_READ_LIMIT = 64 * 1024
+PAGE_READ_LIMIT = 2 * 1024 * 1024
+
+# Seconds to wait for any instance to pass its probe
+PROBE_TIMEOUT = 30
+
+# Seconds a working instance is reused before it is probed again
+INSTANCE_CACHE_TTL = 300
+
+# Selectors for tweet containers, tried in order until one matches
+TWEET_SELECTORS = (
+    'div.timeline-item',
+    'article[data-tweet-id]',
+    'div.tweet',
+    'article.tweet',
+    '.timeline .timeline-item',
+    '.tweet-link',
+    '[data-tweet-id]',
+    '.tweet-content'
+)
+# Compiled once, so each search page only pays for the tree walk
+TWEET_SELECTOR_PATTERNS = tuple((selector, soupsieve.compile(selector)) for selector in TWEET_SELECTORS)
+
+# Classes Nitter puts on timeline entries that are not tweets ("Load newest"
+# links, unavailable tweets, end-of-results markers)
+NON_TWEET_CLASSES = frozenset(('show-more', 'unavailable', 'timeline-end', 'timeline-none'))
+
+# Elements to read each tweet field from, best first, as (tag, class,
+# (attribute, value or pattern)); None matches anything
+TWEET_FIELD_CANDIDATES = {
+    'content': (
+        ('div', 'tweet-content', None),
+        ('div', 'tweet-text', None),
+        ('p', 'tweet-content', None),
+        (None, None, ('data-testid', 'tweetText'))
+    ),
+    'username': (
+        ('a', 'username', None),
+        ('span', 'username', None),
+        (None, None, ('data-testid', 'username')),
+        ('a', None, ('href', USER_HREF_PATTERN))
+    ),
+    'fullname': (
+        ('a', 'fullname', None),
+        ('span', 'fullname', None),
+        (None, None, ('data-testid', 'UserName')),
+        ('strong', None, None)
+    ),
+    'time': (
+        ('span', 'tweet-date', None),
+        ('time', None, None),
+        ('a', 'tweet-link', None),
+        (None, None, ('data-testid', 'Time'))
+    ),
+    'stats': (
+        ('div', 'tweet-stats', None),
+    )
+}
+
+
+def _stable_hash(text: str) -> str:
+    """
+    64-bit hex digest of a string that is the same in every run
+    
+    Unlike hash(), which is salted per process, so IDs built from it would
+    change between runs and defeat deduplication of saved tweets.
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _candidate_matches(element, name: Optional[str], css_class: Optional[str], attribute) -> bool:
+    """Check an element against one TWEET_FIELD_CANDIDATES entry"""
+    if name is not None and element.name != name:
+        return False
+    if css_class is not None and css_class not in element.get('class', ()):
+        return False
+    if attribute is not None:
+        key, expected = attribute
+        value = element.get(key)
+        if value is None:
+            return False
+        if isinstance(expected, str):
+            return value == expected
+        return expected.search(value) is not None
+    return True
+
+
+@dataclass
+class NitterTweet:
+    """
+    One scraped tweet
+    
+    Slotted, so each tweet skips a per-instance dict; converted to a plain
+    dict only when the collection is compiled (see to_dict).
+    """
+    __slots__ = (
+        'search_keyword', 'tweet_id', 'text', 'text_original', 'author_username',
+        'author_name', 'created_at', 'like_count', 'retweet_count', 'reply_count',
+        'quote_count', 'hashtags', 'mentions', 'source', 'collection_timestamp', 'url'
+    )
+    
+    search_keyword: str
+    tweet_id: str
+    text: str
+    text_original: str
+    author_username: str
+    author_name: str
+    created_at: str
+    like_count: int
+    retweet_count: int
+    reply_count: int
+    quote_count: int
+    hashtags: List[str]
+    mentions: List[str]
+    source: str
+    collection_timestamp: str
+    url: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for saving, in field order"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose sockets send TCP keep-alive probes
+    
+    The working instance is reused for minutes (INSTANCE_CACHE_TTL), so its
+    pooled connection can sit idle between keyword searches; keep-alive
+    stops middleboxes from silently dropping it. urllib3's default
+    TCP_NODELAY option is kept.
+    """
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
 
 class NitterScraper:
     """
@@ -81,39 +272,105 @@ class NitterScraper:
             'Cache-Control': 'max-age=0'
         })
         
+        # Keep warm connections to every instance, enough for each keyword
+        # thread, and retry throttled or failing responses with backoff
+        adapter = KeepAliveAdapter(
+            pool_connections=len(self.nitter_instances),
+            pool_maxsize=NITTER_MAX_WORKERS,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=['GET'],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Working instance shared by every keyword search; the lock makes
+        # parallel searches wait for one probe instead of each probing
+        self._cached_instance: Optional[str] = None
+        self._cached_at = 0.0
+        self._instance_lock = threading.Lock()
+        
+        # One limiter per instance host, shared by every keyword thread, so
+        # requests are only delayed when the same instance is hit again
+        self._rate_limiters: Dict[str, RateLimiter] = {}
+        self._rate_limiters_lock = threading.Lock()
+        
         logger.info("📱 Nitter scraper initialized with enhanced headers")
     
-    def is_real_nitter_instance(self, instance_url: str, response_content: str) -> bool:
-        """Check if the response is from a real Nitter instance or a parking page"""
+    def fetch(self, url: str, limit: int, **kwargs) -> Tuple[requests.Response, bytes]:
+        """
+        GET a URL, reading at most `limit` bytes of the body
+        
+        A body that fits is read to the end, so the connection goes back to
+        the pool; a longer one is cut off and its connection dropped.
+        
+        Args:
+            url (str): URL to fetch
+            limit (int): Maximum number of body bytes to read
+            **kwargs: Passed on to session.get (headers, timeout, ...)
+            
+        Returns:
+            Tuple[requests.Response, bytes]: The response and the body read
+        """
+        limiter = self._get_rate_limiter(url)
+        limiter.acquire()
+        
+        response = self.session.get(url, stream=True, **kwargs)
+        if response.status_code == 429:
+            limiter.on_throttle()
+        elif response.status_code == 200:
+            limiter.on_success()
+        
+        try:
+            # Collect the decompressed body into one growing buffer, stopping
+            # once `limit` bytes are in (a decoded chunk can overshoot it)
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                body += chunk
+                if len(body) >= limit:
+                    break
+            content = bytes(body[:limit])
+        finally:
+            response.close()
+        return response, content
+    
+    def _get_rate_limiter(self, url: str) -> RateLimiter:
+        """
+        Get the rate limiter for the instance a URL points at
+        
+        Args:
+            url (str): Any URL on the instance
+            
+        Returns:
+            RateLimiter: Limiter for that host
+        """
+        host = urlsplit(url).netloc
+        with self._rate_limiters_lock:
+            limiter = self._rate_limiters.get(host)
+            if limiter is None:
+                limiter = self._rate_limiters[host] = RateLimiter(
+                    rate_per_sec=1 / API_DELAYS['nitter'],
+                    min_delay=API_DELAYS['nitter'],
+                    name=f"Nitter {host}"
+                )
+            return limiter
+    
+    def is_real_nitter_instance(self, instance_url: str, response_content: bytes) -> bool:
+        """Check if the response (raw body bytes) is from a real Nitter instance or a parking page"""
         if not response_content or len(response_content) < 100:
             return False
         
         # Check for parking page indicators
-        parking_indicators = [
-            'data-adblockkey',
-            'window.park',
-            'parking',
-            'parked domain',
-            'ads.txt',
-            'adsystem'
-        ]
-        
-        content_lower = response_content.lower()
-        for indicator in parking_indicators:
-            if indicator in content_lower:
-                logger.warning(f"❌ {instance_url} appears to be a parking page")
-                return False
+        if PARKING_PATTERN.search(response_content):
+            logger.warning(f"❌ {instance_url} appears to be a parking page")
+            return False
         
         # Check for real Nitter indicators
-        nitter_indicators = [
-            'search',
-            'timeline',
-            'nitter',
-            'twitter',
-            'tweet'
-        ]
-        
-        has_nitter_indicators = any(indicator in content_lower for indicator in nitter_indicators)
+        has_nitter_indicators = NITTER_PATTERN.search(response_content) is not None
         
         # Must have either a reasonable content length OR nitter indicators
         if len(response_content) > 500 or has_nitter_indicators:
@@ -122,51 +379,98 @@ class NitterScraper:
         return False
     
     def find_working_instance(self) -> Optional[str]:
-        """Find a working Nitter instance with improved detection"""
-        logger.info("🔍 Testing Nitter instances...")
+        """
+        Find a working Nitter instance with improved detection
         
-        for instance in self.nitter_instances:
-            try:
-                logger.info(f"Testing {instance}...")
-                
-                # First try the main page
-                response = self.session.get(instance, timeout=10)
-                if response.status_code == 200:
-                    content = response.text
-                    
-                    if self.is_real_nitter_instance(instance, content):
-                        # Test search functionality
-                        search_test_url = f"{instance}/search?q=test"
-                        search_response = self.session.get(search_test_url, timeout=10)
-                        
-                        if search_response.status_code == 200 and len(search_response.content) > 0:
-                            logger.info(f"✅ Using Nitter instance: {instance}")
-                            return instance
-                        else:
-                            logger.warning(f"⚠️ {instance} search not working")
-                    else:
-                        logger.warning(f"❌ {instance} is not a real Nitter instance")
-                else:
-                    logger.warning(f"❌ {instance} returned status {response.status_code}")
-            except Exception as e:
-                logger.warning(f"❌ {instance} failed: {e}")
-                continue
+        All instances are probed at once; the first to pass is used and the
+        remaining probes are left to finish in the background. The result is
+        reused for INSTANCE_CACHE_TTL seconds (see forget_instance).
+        """
+        with self._instance_lock:
+            if self._cached_instance and time.monotonic() - self._cached_at < INSTANCE_CACHE_TTL:
+                return self._cached_instance
             
-            time.sleep(0.5)  # Small delay between tests
+            instance = self._probe_instances()
+            if instance:
+                self._cached_instance = instance
+                self._cached_at = time.monotonic()
+            return instance
+    
+    def forget_instance(self, instance: str) -> None:
+        """Stop reusing an instance that failed mid-session, so the next search re-probes"""
+        with self._instance_lock:
+            if self._cached_instance == instance:
+                logger.info(f"🔄 Dropping cached Nitter instance: {instance}")
+                self._cached_instance = None
+    
+    def _probe_instances(self) -> Optional[str]:
+        """Probe every instance in parallel and return the first that works"""
+        logger.info("🔍 Testing Nitter instances...")
+        
+        executor = ThreadPoolExecutor(max_workers=len(self.nitter_instances))
+        try:
+            futures = [executor.submit(self._probe, instance) for instance in self.nitter_instances]
+            for future in as_completed(futures, timeout=PROBE_TIMEOUT):
+                instance = future.result()
+                if instance:
+                    logger.info(f"✅ Using Nitter instance: {instance}")
+                    return instance
+        except FuturesTimeoutError:
+            logger.warning(f"⚠️ No Nitter instance answered within {PROBE_TIMEOUT}s")
+        finally:
+            executor.shutdown(wait=False)
         
         logger.error("❌ No working Nitter instances found")
         return None
     
-    def search_tweets_via_nitter(self, keyword: str, max_results: int = 20) -> List[Dict[str, Any]]:
+    def _probe(self, instance: str) -> Optional[str]:
+        """
+        Check one Nitter instance: a real front page and a working search
+        
+        Args:
+            instance (str): Instance base URL
+            
+        Returns:
+            Optional[str]: The instance if it works, otherwise None
+        """
+        try:
+            logger.debug("Testing %s...", instance)
+            
+            # First try the main page
+            response, content = self.fetch(instance, PROBE_READ_LIMIT, timeout=10)
+            if response.status_code != 200:
+                logger.warning(f"❌ {instance} returned status {response.status_code}")
+                return None
+            
+            if not self.is_real_nitter_instance(instance, content):
+                logger.warning(f"❌ {instance} is not a real Nitter instance")
+                return None
+            
+            # Test search functionality
+            search_test_url = f"{instance}/search?q=test"
+            search_response, search_content = self.fetch(search_test_url, PROBE_READ_LIMIT, timeout=10)
+            
+            if search_response.status_code == 200 and len(search_content) > 0:
+                return instance
+            
+            logger.warning(f"⚠️ {instance} search not working")
+        except Exception as e:
+            logger.warning(f"❌ {instance} failed: {e}")
+        
+        return None
+    
+    def search_tweets_via_nitter(self, keyword: str, max_results: int = 20,
+                                 collection_timestamp: Optional[str] = None) -> List[NitterTweet]:
         """
         Search for tweets via Nitter with improved parsing
         
         Args:
             keyword (str): Keyword to search for
             max_results (int): Maximum number of tweets to collect
+            collection_timestamp (str, optional): ISO timestamp for the tweets. Uses now if None.
             
         Returns:
-            List[Dict]: List of tweet data
+            List[NitterTweet]: List of tweet data
         """
         logger.info(f"🔍 Searching Nitter for: '{keyword}'")
         
@@ -176,74 +480,76 @@ class NitterScraper:
             return []
         
         tweets = []
+        if collection_timestamp is None:
+            collection_timestamp = datetime.now().isoformat()
         
         try:
-            # Set referer for this specific instance
-            self.session.headers.update({'Referer': instance})
+            # Referer for this specific instance; passed per request since
+            # the session is shared by parallel keyword searches
+            headers = {'Referer': instance}
             
-            # Try multiple search URL patterns
+            # Try multiple search URL patterns; the keyword is encoded once
+            # so spaces and special characters survive in query and path
+            query = quote_plus(keyword)
+            safe_name = re.sub(r'\W+', '_', keyword)
             search_patterns = [
-                f"{instance}/search?q={keyword}&f=tweets",
-                f"{instance}/search?q={keyword}",
-                f"{instance}/search/{keyword}"
+                f"{instance}/search?q={query}&f=tweets",
+                f"{instance}/search?q={query}",
+                f"{instance}/search/{quote(keyword, safe='')}"
             ]
             
             for search_url in search_patterns:
                 try:
-                    logger.info(f"🔍 Trying search pattern: {search_url}")
+                    logger.debug("🔍 Trying search pattern: %s", search_url)
                     
-                    response = self.session.get(search_url, timeout=15)
+                    response, content = self.fetch(search_url, PAGE_READ_LIMIT, headers=headers, timeout=15)
+                    if response.status_code >= 500:
+                        self.forget_instance(instance)
                     response.raise_for_status()
                     
-                    if not self.is_real_nitter_instance(instance, response.text):
+                    if not self.is_real_nitter_instance(instance, content):
                         logger.warning(f"⚠️ Got parking page response from {instance}")
+                        self.forget_instance(instance)
                         continue
                     
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    soup = BeautifulSoup(content, 'lxml')
                     
-                    # Save response for debugging (first pattern only)
-                    if search_url == search_patterns[0]:
-                        debug_filename = f'debug_nitter_response_{keyword.replace(" ", "_")}.html'
-                        with open(debug_filename, 'w', encoding='utf-8') as f:
-                            f.write(str(soup.prettify()))
+                    # Save response for debugging (first pattern only), as
+                    # received: set NITTER_DEBUG_HTML=true to enable
+                    if NITTER_DEBUG_HTML and search_url == search_patterns[0]:
+                        debug_filename = f'debug_nitter_response_{safe_name}.html'
+                        with open(debug_filename, 'wb') as f:
+                            f.write(content)
                         logger.info(f"📄 Saved response to {debug_filename}")
                     
-                    # Try multiple selectors for finding tweets
-                    tweet_selectors = [
-                        'div.timeline-item',
-                        'article[data-tweet-id]',
-                        'div.tweet',
-                        'article.tweet',
-                        '.timeline .timeline-item',
-                        '.tweet-link',
-                        '[data-tweet-id]',
-                        '.tweet-content'
-                    ]
-                    
+                    # Try multiple selectors for finding tweets, in priority
+                    # order; each walk stops once max_results are found
                     tweet_containers = []
-                    for selector in tweet_selectors:
-                        containers = soup.select(selector)
+                    for selector, pattern in TWEET_SELECTOR_PATTERNS:
+                        containers = pattern.select(soup, limit=max_results)
                         if containers:
-                            logger.info(f"✅ Found {len(containers)} elements with selector: {selector}")
+                            logger.debug("✅ Found %d elements with selector: %s", len(containers), selector)
                             tweet_containers = containers
                             break
                     
                     if not tweet_containers:
                         logger.warning(f"⚠️ No tweet containers found with any selector")
-                        # Try to find any content that might be tweets
-                        all_content = soup.get_text()
-                        if len(all_content) > 100:
-                            logger.info(f"📝 Page has content ({len(all_content)} chars), but no recognizable tweet structure")
+                        # Try to find any content that might be tweets; the page
+                        # text is only built when it will be logged
+                        if logger.isEnabledFor(logging.INFO):
+                            all_content = soup.get_text()
+                            if len(all_content) > 100:
+                                logger.info("📝 Page has content (%d chars), but no recognizable tweet structure", len(all_content))
                         continue
                     
                     # Extract tweets from containers
                     for i, container in enumerate(tweet_containers[:max_results]):
                         try:
-                            tweet_data = self._extract_tweet_from_nitter(container, keyword)
+                            tweet_data = self._extract_tweet_from_nitter(container, keyword, collection_timestamp)
                             if tweet_data:
                                 tweets.append(tweet_data)
                         except Exception as e:
-                            logger.warning(f"Error extracting tweet {i}: {e}")
+                            logger.warning("Error extracting tweet %d: %s", i, e)
                             continue
                     
                     if tweets:
@@ -253,26 +559,46 @@ class NitterScraper:
                 except Exception as e:
                     logger.warning(f"⚠️ Search pattern {search_url} failed: {e}")
                     continue
-                    
-                time.sleep(1)  # Delay between patterns
-            
-            time.sleep(2)  # Be respectful to Nitter instances
             
         except Exception as e:
             logger.error(f"Error scraping Nitter for '{keyword}': {e}")
         
         return tweets
     
-    def _extract_tweet_from_nitter(self, container, keyword: str) -> Optional[Dict[str, Any]]:
+    def _find_tweet_fields(self, container) -> Dict[str, Any]:
+        """
+        Find the element for every tweet field in one walk of the container
+        
+        Args:
+            container: Tweet container element
+            
+        Returns:
+            Dict[str, Any]: Element per field of TWEET_FIELD_CANDIDATES (missing if none
+            matched); the best-ranked candidate wins, first in document order
+        """
+        best = {}
+        for element in container.find_all(True):
+            for field, candidates in TWEET_FIELD_CANDIDATES.items():
+                found = best.get(field)
+                # Only a better-ranked candidate can replace what was found
+                for rank in range(found[0] if found else len(candidates)):
+                    if _candidate_matches(element, *candidates[rank]):
+                        best[field] = (rank, element)
+                        break
+        return {field: element for field, (rank, element) in best.items()}
+    
+    def _extract_tweet_from_nitter(self, container, keyword: str,
+                                   collection_timestamp: Optional[str] = None) -> Optional[NitterTweet]:
         """Extract tweet data from Nitter HTML (supports multiple HTML structures)"""
+        # Cheap class check first, so non-tweet entries skip the field walk
+        if not NON_TWEET_CLASSES.isdisjoint(container.get('class') or ()):
+            return None
+        
         try:
-            # Extract tweet text (try multiple selectors)
-            tweet_content = (
-                container.find('div', class_='tweet-content') or
-                container.find('div', class_='tweet-text') or
-                container.find('p', class_='tweet-content') or
-                container.find('[data-testid="tweetText"]')
-            )
+            fields = self._find_tweet_fields(container)
+            
+            # Extract tweet text
+            tweet_content = fields.get('content')
             
             if not tweet_content:
                 # Try to find any text content in the container
@@ -283,78 +609,137 @@ class NitterScraper:
             else:
                 text = tweet_content.get_text(strip=True)
             
-            # Extract username (try multiple selectors)
-            username_elem = (
-                container.find('a', class_='username') or
-                container.find('span', class_='username') or
-                container.find('[data-testid="username"]') or
-                container.find('a', href=re.compile(r'^/\w+$'))
-            )
+            # Extract username
+            username_elem = fields.get('username')
             username = username_elem.get_text(strip=True) if username_elem else 'unknown'
             
-            # Extract display name (try multiple selectors)
-            fullname_elem = (
-                container.find('a', class_='fullname') or
-                container.find('span', class_='fullname') or
-                container.find('[data-testid="UserName"]') or
-                container.find('strong')
-            )
+            # Extract display name
+            fullname_elem = fields.get('fullname')
             display_name = fullname_elem.get_text(strip=True) if fullname_elem else 'Unknown'
             
-            # Extract timestamp (try multiple selectors)
-            time_elem = (
-                container.find('span', class_='tweet-date') or
-                container.find('time') or
-                container.find('a', class_='tweet-link') or
-                container.find('[data-testid="Time"]')
-            )
+            # Extract timestamp
+            time_elem = fields.get('time')
             tweet_date = time_elem.get_text(strip=True) if time_elem else 'Unknown'
             
             # Extract engagement metrics (if available)
-            stats = container.find('div', class_='tweet-stats')
+            stats = fields.get('stats')
             replies = 0
             retweets = 0
             likes = 0
             
             if stats:
-                # Try to extract numbers (this is fragile and may not work perfectly)
-                stats_text = stats.get_text()
-                numbers = re.findall(r'\d+', stats_text)
-                if len(numbers) >= 3:
-                    replies = int(numbers[0]) if numbers[0] else 0
-                    retweets = int(numbers[1]) if numbers[1] else 0
-                    likes = int(numbers[2]) if numbers[2] else 0
+                # Each counter is read by the icon in front of it, in one
+                # pass over the stats markup; missing counters stay 0
+                counts = {
+                    match.group('stat'): int(match.group('count').replace(',', ''))
+                    for match in STAT_PATTERN.finditer(str(stats))
+                }
+                if counts:
+                    replies = counts.get('comment', 0)
+                    retweets = counts.get('retweet', 0)
+                    likes = counts.get('heart', 0)
+                else:
+                    # No icons: fall back to the numbers in order (fragile)
+                    numbers = NUMBER_PATTERN.findall(stats.get_text())
+                    if len(numbers) >= 3:
+                        replies = int(numbers[0])
+                        retweets = int(numbers[1])
+                        likes = int(numbers[2])
             
             # Extract hashtags and mentions
-            hashtags = re.findall(r'#(\w+)', text)
-            mentions = re.findall(r'@(\w+)', text)
+            hashtags = HASHTAG_PATTERN.findall(text)
+            mentions = MENTION_PATTERN.findall(text)
             
-            tweet_data = {
-                'search_keyword': keyword,
-                'tweet_id': f"nitter_{abs(hash(text))}",  # Generate fake ID
-                'text': text,
-                'text_original': text,
-                'author_username': username.replace('@', ''),
-                'author_name': display_name,
-                'created_at': tweet_date,
-                'like_count': likes,
-                'retweet_count': retweets,
-                'reply_count': replies,
-                'quote_count': 0,  # Not available from Nitter
-                'hashtags': hashtags,
-                'mentions': mentions,
-                'source': 'nitter_scraping',
-                'collection_timestamp': datetime.now().isoformat(),
-                'url': f"https://twitter.com/{username.replace('@', '')}/status/unknown"
-            }
+            tweet_data = NitterTweet(
+                search_keyword=keyword,
+                tweet_id=f"nitter_{_stable_hash(text)}",  # Generate fake ID
+                text=text,
+                text_original=text,
+                author_username=username.replace('@', ''),
+                author_name=display_name,
+                created_at=tweet_date,
+                like_count=likes,
+                retweet_count=retweets,
+                reply_count=replies,
+                quote_count=0,  # Not available from Nitter
+                hashtags=hashtags,
+                mentions=mentions,
+                source='nitter_scraping',
+                collection_timestamp=collection_timestamp or datetime.now().isoformat(),
+                url=f"https://twitter.com/{username.replace('@', '')}/status/unknown"
+            )
             
             return tweet_data
             
         except Exception as e:
-            logger.error(f"Error extracting tweet data: {e}")
+            logger.error("Error extracting tweet data: %s", e)
             return None
 
 
+def _collect_keyword(scraper: NitterScraper, keyword: str,
+                     collection_timestamp: str) -> Tuple[List[NitterTweet], Dict[str, Any], Counter, Counter]:
+    """
+    Search one keyword and summarize it, falling back to a mock tweet
+    
+    Args:
+        scraper (NitterScraper): Shared scraper
+        keyword (str): Keyword to search
+        collection_timestamp (str): ISO timestamp of the collection, shared by all tweets
+        
+    Returns:
+        Tuple[List[NitterTweet], Dict[str, Any], Counter, Counter]: The keyword's tweets,
+        its statistics, and its hashtag and mention counts
+    """
+    logger.info("Processing keyword: %s", keyword)
+    
+    tweets = scraper.search_tweets_via_nitter(keyword, max_results=20,
+                                              collection_timestamp=collection_timestamp)
+    
+    # If no tweets found, add a mock tweet for testing
+    if not tweets:
+        logger.warning(f"⚠️ No tweets found for '{keyword}' via Nitter, adding mock data")
+        mock_tweet = NitterTweet(
+            search_keyword=keyword,
+            tweet_id=f"mock_{_stable_hash(keyword)}_{int(datetime.now().timestamp())}",
+            text=f"Sample tweet about {keyword} - mock data due to Nitter limitations",
+            text_original=f"Sample tweet about {keyword} - mock data due to Nitter limitations",
+            author_username='nitter_mock',
+            author_name='Nitter Mock User',
+            created_at=collection_timestamp,
+            like_count=3,
+            retweet_count=1,
+            reply_count=1,
+            quote_count=0,
+            hashtags=[keyword.replace(' ', '').lower()],
+            mentions=[],
+            source='nitter_mock_fallback',
+            collection_timestamp=collection_timestamp,
+            url=f"https://twitter.com/nitter_mock/status/mock"
+        )
+        tweets = [mock_tweet]
+    
+    # Track statistics, in one pass over the tweets
+    hashtag_counts = Counter()
+    mention_counts = Counter()
+    total_likes = 0
+    total_retweets = 0
+    for tweet in tweets:
+        hashtag_counts.update(tweet.hashtags)
+        mention_counts.update(tweet.mentions)
+        total_likes += tweet.like_count
+        total_retweets += tweet.retweet_count
+    
+    stats = {
+        'tweets_found': len(tweets),
+        'total_likes': total_likes,
+        'total_retweets': total_retweets,
+        'unique_hashtags': len(hashtag_counts),
+        'unique_mentions': len(mention_counts)
+    }
+    
+    return tweets, stats, hashtag_counts, mention_counts
+
+
 def collect_twitter_data_via_nitter(keywords: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Collect Twitter data via Nitter for given keywords
@@ -373,85 +758,46 @@ def collect_twitter_data_via_nitter(keywords: Optional[List[str]] = None) -> Dic
     scraper = NitterScraper()
     all_tweets = []
     keyword_stats = {}
+    # One timestamp for the whole collection, shared by every tweet
+    collection_timestamp = datetime.now().isoformat()
     
-    for keyword in keywords:
-        logger.info(f"Processing keyword: {keyword}")
-        
-        tweets = scraper.search_tweets_via_nitter(keyword, max_results=20)
-        
-        # If no tweets found, add a mock tweet for testing
-        if not tweets:
-            logger.warning(f"⚠️ No tweets found for '{keyword}' via Nitter, adding mock data")
-            mock_tweet = {
-                'search_keyword': keyword,
-                'tweet_id': f"mock_{abs(hash(keyword))}_{int(datetime.now().timestamp())}",
-                'text': f"Sample tweet about {keyword} - mock data due to Nitter limitations",
-                'text_original': f"Sample tweet about {keyword} - mock data due to Nitter limitations",
-                'author_username': 'nitter_mock',
-                'author_name': 'Nitter Mock User',
-                'created_at': datetime.now().isoformat(),
-                'like_count': 3,
-                'retweet_count': 1,
-                'reply_count': 1,
-                'quote_count': 0,
-                'hashtags': [keyword.replace(' ', '').lower()],
-                'mentions': [],
-                'source': 'nitter_mock_fallback',
-                'collection_timestamp': datetime.now().isoformat(),
-                'url': f"https://twitter.com/nitter_mock/status/mock"
-            }
-            tweets = [mock_tweet]
-        
-        all_tweets.extend(tweets)
-        
-        # Track statistics
-        hashtags = []
-        mentions = []
-        for tweet in tweets:
-            hashtags.extend(tweet.get('hashtags', []))
-            mentions.extend(tweet.get('mentions', []))
-        
-        keyword_stats[keyword] = {
-            'tweets_found': len(tweets),
-            'total_likes': sum(tweet.get('like_count', 0) for tweet in tweets),
-            'total_retweets': sum(tweet.get('retweet_count', 0) for tweet in tweets),
-            'unique_hashtags': len(set(hashtags)),
-            'unique_mentions': len(set(mentions))
-        }
-        
-        time.sleep(3)  # Be respectful between keywords
+    # Keywords are searched in parallel on the shared session; results are
+    # gathered in input order
+    with ThreadPoolExecutor(max_workers=NITTER_MAX_WORKERS) as executor:
+        results = list(executor.map(lambda keyword: _collect_keyword(scraper, keyword, collection_timestamp), keywords))
     
-    # Analyze hashtags and mentions
-    from collections import Counter
-    all_hashtags = []
-    all_mentions = []
+    # Analyze hashtags and mentions by merging the per-keyword counts
+    all_hashtags = Counter()
+    all_mentions = Counter()
     
-    for tweet in all_tweets:
-        all_hashtags.extend(tweet.get('hashtags', []))
-        all_mentions.extend(tweet.get('mentions', []))
+    for keyword, (tweets, stats, hashtag_counts, mention_counts) in zip(keywords, results):
+        all_tweets.extend(tweet.to_dict() for tweet in tweets)
+        keyword_stats[keyword] = stats
+        all_hashtags.update(hashtag_counts)
+        all_mentions.update(mention_counts)
     
-    top_hashtags = Counter(all_hashtags).most_common(20)
-    top_mentions = Counter(all_mentions).most_common(20)
+    top_hashtags = all_hashtags.most_common(20)
+    top_mentions = all_mentions.most_common(20)
     
     # Compile data structure (similar to Twitter API format)
     twitter_data = {
         'collection_info': {
             'keywords': keywords,
             'total_keywords': len(keywords),
-            'collection_timestamp': datetime.now().isoformat(),
+            'collection_timestamp': collection_timestamp,
             'source': 'nitter_scraping',
             'note': 'Data collected via Nitter instances, may be less comprehensive than official API'
         },
         'tweets': all_tweets,
         'keyword_statistics': keyword_stats,
         'hashtag_analysis': {
-            'total_hashtags': len(all_hashtags),
-            'unique_hashtags': len(set(all_hashtags)),
+            'total_hashtags': sum(all_hashtags.values()),
+            'unique_hashtags': len(all_hashtags),
             'top_hashtags': [{'hashtag': tag, 'count': count} for tag, count in top_hashtags]
         },
         'mention_analysis': {
-            'total_mentions': len(all_mentions),
-            'unique_mentions': len(set(all_mentions)),
+            'total_mentions': sum(all_mentions.values()),
+            'unique_mentions': len(all_mentions),
             'top_mentions': [{'mention': mention, 'count': count} for mention, count in top_mentions]
         },
         'summary_stats': {
@@ -473,8 +819,9 @@ def save_nitter_data(data: Dict[str, Any], filepath: Optional[str] = None) -> bo
     try:
         ensure_data_directory()
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # orjson writes UTF-8 bytes, so non-ASCII text stays unescaped
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         logger.info(f"📁 Nitter data saved to: {filepath}")
         return True
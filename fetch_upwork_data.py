@@ -9,18 +9,39 @@ Author: Web Scraping Project
 """
 
 import requests
+from requests_cache import CachedSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import lxml.html
+from lxml.etree import XPath
 import json
+import hashlib
 import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Union
 import time
 import random
 from urllib.parse import urlencode, quote_plus
 import re
+import os
 import subprocess
 import sys
 
+# Local imports
+from config import (
+    API_DELAYS,
+    DATA_PATHS,
+    UPWORK_CACHE_MAX_AGE,
+    UPWORK_MAX_WORKERS,
+    UPWORK_PARSE_PROCESS_MIN_PAGES,
+    ensure_data_directory
+)
+from rate_limiter import RateLimiter
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -28,6 +49,95 @@ logger = logging.getLogger(__name__)
 # Data file path
 UPWORK_DATA_FILE = "data/raw_upwork_data.json"
 
+# Search pages are first fetched directly, in parallel; the browser is only
+# needed for keywords Cloudflare blocks
+UPWORK_SEARCH_URL = "https://www.upwork.com/nx/search/jobs/"
+UPWORK_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9'
+}
+# Shared by the fetch workers, so together they stay inside one request budget
+UPWORK_RATE_LIMITER = RateLimiter(
+    rate_per_sec=1 / API_DELAYS['upwork'],
+    burst=UPWORK_MAX_WORKERS,
+    min_delay=API_DELAYS['upwork'] / 2,
+    name='Upwork'
+)
+
+_upwork_session = None
+_upwork_session_lock = threading.Lock()
+
+# Compiled regex patterns for the per-card hot path
+WHITESPACE_PATTERN = re.compile(r'\s+')
+NUMBER_PATTERN = re.compile(r'\d+')
+# Rate range like "$10.00-$30.00"
+HOURLY_RATE_PATTERN = re.compile(r'\$(\d+(?:\.\d{2})?)-\$(\d+(?:\.\d{2})?)')
+# Fixed amount like "$500" or "$1,000"
+FIXED_AMOUNT_PATTERN = re.compile(r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)')
+# Upwork's job key in a job link, e.g. /jobs/Python-scraper_~01ab23cd45ef/
+JOB_KEY_PATTERN = re.compile(r'~(\w+)')
+
+def _has_class(name: str) -> str:
+    """XPath predicate for elements with name in their class list, like CSS .name"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+# Job card XPaths - Upwork uses various structures, tried in order
+JOB_CARD_XPATHS = (
+    '//article[@data-test="job-tile"]',    # Current structure
+    f'//*[{_has_class("job-tile")}]',      # Alternative
+    '//*[@data-test="JobTile"]',           # Another variant
+    '//section[@data-cy="job-tile"]'       # Yet another variant
+)
+
+# XPaths for each job card field, relative to the card, tried in order
+# until one matches
+JOB_FIELD_XPATHS = {
+    'title': (
+        './/h2//a',
+        './/h3//a',
+        f'.//*[{_has_class("job-title")}]//a',
+        './/*[@data-test="job-title"]//a'
+    ),
+    'description': (
+        './/*[@data-test="job-description"]',
+        f'.//*[{_has_class("job-description")}]',
+        './/p[@data-test="job-description-text"]'
+    ),
+    'budget': (
+        './/*[@data-test="budget"]',
+        f'.//*[{_has_class("budget")}]',
+        './/strong[@data-test="budget"]'
+    ),
+    'skills': (
+        './/*[@data-test="token"]//span',
+        f'.//*[{_has_class("skill-token")}]',
+        './/*[@data-cy="skill-token"]'
+    ),
+    'posted_time': (
+        './/*[@data-test="posted-on"]',
+        f'.//*[{_has_class("posted-on")}]',
+        './/small[@data-test="job-posted-date"]'
+    ),
+    'experience_level': (
+        './/*[@data-test="experience-level"]',
+        f'.//*[{_has_class("experience-level")}]'
+    ),
+    'proposals': (
+        './/*[@data-test="proposal-count"]',
+        f'.//*[{_has_class("proposal-count")}]'
+    )
+}
+
+# Compiled once, so each card only pays for the (C-level) tree walk
+JOB_CARD_PATTERNS = tuple((xpath, XPath(xpath)) for xpath in JOB_CARD_XPATHS)
+JOB_FIELD_PATTERNS = {
+    field: tuple(XPath(xpath) for xpath in xpaths)
+    for field, xpaths in JOB_FIELD_XPATHS.items()
+}
+# Bytes are declared UTF-8 so the encoding isn't sniffed
+UTF8_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
 def human_delay(min_seconds: float = 3.0, max_seconds: float = 8.0):
     """Human-like delay with random variation"""
     delay = random.uniform(min_seconds, max_seconds)
@@ -107,150 +217,172 @@ def clean_text(text: str) -> str:
         return ""
     
     # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = WHITESPACE_PATTERN.sub(' ', text.strip())
     return text
 
-def parse_upwork_html(soup: BeautifulSoup, keyword: str, page: int) -> List[Dict[str, Any]]:
+def select_job_field(card, field: str, select_all: bool = False,
+                     preferred: Optional[Dict[str, int]] = None):
+    """
+    Find a job card field with the first of its selectors that matches
+    
+    Cards on one page share a layout, so with a preferred dict the selector
+    that matched on the previous card is tried first, and the full list only
+    on a miss.
+    
+    Args:
+        card: Job card element
+        field: Key of JOB_FIELD_XPATHS
+        select_all: Return every match of the winning selector instead of the first
+        preferred: Index of the last winning selector per field, updated in place
+        
+    Returns:
+        The matching element (list of elements if select_all), None ([]) if no selector matched
+    """
+    patterns = JOB_FIELD_PATTERNS[field]
+    last = preferred.get(field) if preferred is not None else None
+    if last is not None:
+        found = patterns[last](card)
+        if found:
+            return found if select_all else found[0]
+    for index, pattern in enumerate(patterns):
+        if index == last:
+            continue
+        found = pattern(card)
+        if found:
+            if preferred is not None:
+                preferred[field] = index
+            return found if select_all else found[0]
+    return [] if select_all else None
+
+def upwork_job_id(href: str, title: str) -> str:
+    """
+    Stable ID for a scraped job, so persistence deduplicates the same job
+    across runs (and never merges two different jobs)
+    
+    Args:
+        href: Job link from the card
+        title: Job title
+        
+    Returns:
+        str: Upwork's own job key when the link carries one, otherwise a hash
+        of link and title
+    """
+    job_key = JOB_KEY_PATTERN.search(href)
+    if job_key:
+        return f"upwork_~{job_key.group(1)}"
+    digest = hashlib.blake2b(f"{href}\n{title}".encode('utf-8'), digest_size=8).hexdigest()
+    return f"upwork_real_{digest}"
+
+def parse_upwork_html(html: Union[str, bytes, BeautifulSoup], keyword: str, page: int) -> List[Dict[str, Any]]:
     """
     Parse real Upwork HTML to extract job listings
     Based on the current Upwork page structure as of 2024
+    
+    The page is parsed with lxml and every field is found with compiled
+    XPaths, so the per-card work stays in C.
+    
+    Args:
+        html: Raw page source (e.g. driver.page_source or response bytes);
+            an already parsed BeautifulSoup is accepted and re-serialized
+        keyword: Search keyword the page was fetched for
+        page: Result page number
     """
     jobs = []
     current_time = datetime.now()
     
     try:
-        # Look for job cards - Upwork uses various selectors, try multiple approaches
-        job_selectors = [
-            'article[data-test="job-tile"]',  # Current structure
-            '.job-tile',                     # Alternative
-            '[data-test="JobTile"]',         # Another variant
-            'section[data-cy="job-tile"]'    # Yet another variant
-        ]
+        if isinstance(html, BeautifulSoup):
+            html = str(html)
+        if not html.strip():
+            logger.warning("⚠️ Empty page, no job cards to parse")
+            return []
+        if isinstance(html, bytes):
+            root = lxml.html.document_fromstring(html, parser=UTF8_HTML_PARSER)
+        else:
+            root = lxml.html.document_fromstring(html)
         
+        # Look for job cards - Upwork uses various selectors, try multiple approaches
         job_cards = []
-        for selector in job_selectors:
-            job_cards = soup.select(selector)
+        for xpath, pattern in JOB_CARD_PATTERNS:
+            job_cards = pattern(root)
             if job_cards:
-                logger.info(f"✅ Found {len(job_cards)} job cards using selector: {selector}")
+                logger.info(f"✅ Found {len(job_cards)} job cards using XPath: {xpath}")
                 break
         
         if not job_cards:
             logger.warning("⚠️ No job cards found with known selectors")
             return []
         
+        # Winning field selectors so far, tried first on the next card
+        preferred = {}
+        
         for i, card in enumerate(job_cards):
             try:
-                job_data = {
-                    'id': f"upwork_real_{keyword}_{page}_{i}",
-                    'search_keyword': keyword,
-                    'scraped_at': current_time.isoformat(),
-                    'page_number': page
-                }
-                
                 # Extract job title
-                title_selectors = ['h2 a', 'h3 a', '.job-title a', '[data-test="job-title"] a']
                 title = None
-                for sel in title_selectors:
-                    title_elem = card.select_one(sel)
-                    if title_elem:
-                        title = clean_text(title_elem.get_text())
-                        href = title_elem.get('href', '')
-                        if isinstance(href, str):
-                            job_data['url'] = 'https://www.upwork.com' + href
-                        else:
-                            job_data['url'] = 'https://www.upwork.com'
-                        break
+                href = ''
+                title_elem = select_job_field(card, 'title', preferred=preferred)
+                if title_elem is not None:
+                    title = clean_text(title_elem.text_content())
+                    href = title_elem.get('href', '')
+                    if not isinstance(href, str):
+                        href = ''
                 
                 if not title:
                     continue  # Skip jobs without titles
-                    
-                job_data['title'] = title
+                
+                job_data = {
+                    'id': upwork_job_id(href, title),
+                    'search_keyword': keyword,
+                    'scraped_at': current_time.isoformat(),
+                    'page_number': page,
+                    'url': 'https://www.upwork.com' + href,
+                    'title': title
+                }
                 
                 # Extract job description
-                desc_selectors = [
-                    '[data-test="job-description"]',
-                    '.job-description', 
-                    'p[data-test="job-description-text"]'
-                ]
                 description = ""
-                for sel in desc_selectors:
-                    desc_elem = card.select_one(sel)
-                    if desc_elem:
-                        description = clean_text(desc_elem.get_text())
-                        break
+                desc_elem = select_job_field(card, 'description', preferred=preferred)
+                if desc_elem is not None:
+                    description = clean_text(desc_elem.text_content())
                 
                 job_data['description'] = description or "No description available"
                 
                 # Extract budget information
                 budget_text = ""
-                budget_selectors = [
-                    '[data-test="budget"]',
-                    '.budget',
-                    'strong[data-test="budget"]'
-                ]
-                for sel in budget_selectors:
-                    budget_elem = card.select_one(sel)
-                    if budget_elem:
-                        budget_text = clean_text(budget_elem.get_text())
-                        break
+                budget_elem = select_job_field(card, 'budget', preferred=preferred)
+                if budget_elem is not None:
+                    budget_text = clean_text(budget_elem.text_content())
                 
                 job_data['budget'] = extract_budget(budget_text)
                 
                 # Extract skills
-                skills = []
-                skill_selectors = [
-                    '[data-test="token"] span',
-                    '.skill-token',
-                    '[data-cy="skill-token"]'
-                ]
-                for sel in skill_selectors:
-                    skill_elems = card.select(sel)
-                    if skill_elems:
-                        skills = [clean_text(elem.get_text()) for elem in skill_elems]
-                        break
+                skill_elems = select_job_field(card, 'skills', select_all=True, preferred=preferred)
+                skills = [clean_text(elem.text_content()) for elem in skill_elems]
                 
                 job_data['skills_required'] = skills
                 
                 # Extract time posted
-                time_selectors = [
-                    '[data-test="posted-on"]',
-                    '.posted-on',
-                    'small[data-test="job-posted-date"]'
-                ]
                 posted_time = "Unknown"
-                for sel in time_selectors:
-                    time_elem = card.select_one(sel)
-                    if time_elem:
-                        posted_time = clean_text(time_elem.get_text())
-                        break
+                time_elem = select_job_field(card, 'posted_time', preferred=preferred)
+                if time_elem is not None:
+                    posted_time = clean_text(time_elem.text_content())
                 
                 # Extract experience level
                 exp_level = "Not specified"
-                exp_selectors = [
-                    '[data-test="experience-level"]',
-                    '.experience-level'
-                ]
-                for sel in exp_selectors:
-                    exp_elem = card.select_one(sel)
-                    if exp_elem:
-                        exp_level = clean_text(exp_elem.get_text())
-                        break
+                exp_elem = select_job_field(card, 'experience_level', preferred=preferred)
+                if exp_elem is not None:
+                    exp_level = clean_text(exp_elem.text_content())
                 
                 # Extract proposals count
                 proposals = 0
-                prop_selectors = [
-                    '[data-test="proposal-count"]',
-                    '.proposal-count'
-                ]
-                for sel in prop_selectors:
-                    prop_elem = card.select_one(sel)
-                    if prop_elem:
-                        prop_text = clean_text(prop_elem.get_text())
-                        # Extract number from text like "5 proposals"
-                        numbers = re.findall(r'\d+', prop_text)
-                        if numbers:
-                            proposals = int(numbers[0])
-                        break
+                prop_elem = select_job_field(card, 'proposals', preferred=preferred)
+                if prop_elem is not None:
+                    prop_text = clean_text(prop_elem.text_content())
+                    # Extract number from text like "5 proposals"
+                    number = NUMBER_PATTERN.search(prop_text)
+                    if number:
+                        proposals = int(number.group())
                 
                 # Build job details
                 job_data['job_details'] = {
@@ -300,7 +432,7 @@ def extract_budget(budget_text: str) -> Dict[str, Any]:
     if 'hourly' in budget_text or '/hr' in budget_text:
         budget_info['type'] = 'hourly'
         # Extract rate range like "$10.00-$30.00"
-        rate_match = re.search(r'\$(\d+(?:\.\d{2})?)-\$(\d+(?:\.\d{2})?)', budget_text)
+        rate_match = HOURLY_RATE_PATTERN.search(budget_text)
         if rate_match:
             budget_info['min_amount'] = float(rate_match.group(1))
             budget_info['max_amount'] = float(rate_match.group(2))
@@ -309,7 +441,7 @@ def extract_budget(budget_text: str) -> Dict[str, Any]:
     elif 'fixed' in budget_text or '$' in budget_text:
         budget_info['type'] = 'fixed'
         # Extract fixed amount like "$500" or "$1,000"
-        amount_match = re.search(r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)', budget_text)
+        amount_match = FIXED_AMOUNT_PATTERN.search(budget_text)
         if amount_match:
             amount_str = amount_match.group(1).replace(',', '')
             budget_info['min_amount'] = float(amount_str)
@@ -317,6 +449,174 @@ def extract_budget(budget_text: str) -> Dict[str, Any]:
     
     return budget_info
 
+def is_challenge_page(response: requests.Response) -> bool:
+    """Whether a response is Cloudflare's "Just a moment..." challenge instead of results"""
+    return 'just a moment' in response.text[:2048].lower()
+
+def get_upwork_session() -> CachedSession:
+    """
+    Get the shared HTTP session for direct Upwork requests
+    
+    Search pages are cached on disk (Cloudflare challenges excluded), so
+    repeated runs can skip the network; see fetch_upwork_search_page.
+    Connections are pooled and kept alive, sized so every fetch worker can
+    hold one, so the TLS handshake is paid once per connection rather than
+    once per search page. Transient failures are retried with backoff.
+    
+    Returns:
+        CachedSession: Session shared by the fetch workers
+    """
+    global _upwork_session
+    with _upwork_session_lock:
+        if _upwork_session is None:
+            ensure_data_directory()
+            _upwork_session = CachedSession(
+                DATA_PATHS['upwork_cache'],
+                backend='sqlite',
+                expire_after=UPWORK_CACHE_MAX_AGE,
+                filter_fn=lambda response: not is_challenge_page(response)
+            )
+            retry_strategy = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['GET'],
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=UPWORK_MAX_WORKERS,
+                max_retries=retry_strategy
+            )
+            _upwork_session.mount('https://', adapter)
+            _upwork_session.headers.update(UPWORK_HEADERS)
+            _upwork_session.headers['Connection'] = 'keep-alive'
+        return _upwork_session
+
+def fetch_upwork_search_page(keyword: str, page: int, max_age_s: int = UPWORK_CACHE_MAX_AGE) -> Optional[str]:
+    """
+    Fetch one Upwork search results page directly, without a browser
+    
+    Args:
+        keyword: Search keyword
+        page: Result page number
+        max_age_s: Reuse a cached copy of the page up to this many seconds old;
+            0 forces a fresh fetch
+        
+    Returns:
+        The page HTML, or None if the request failed or hit a Cloudflare challenge
+    """
+    url = f"{UPWORK_SEARCH_URL}?{urlencode({'q': keyword, 'page': page})}"
+    session = get_upwork_session()
+    
+    # A fresh enough cached copy needs no request, nor a rate limiter token
+    # (a cache miss answers 504 here)
+    if max_age_s > 0:
+        cached = session.get(url, only_if_cached=True)
+        if cached.status_code == 200 and not cached.is_older_than(max_age_s):
+            return cached.text
+    
+    UPWORK_RATE_LIMITER.acquire()
+    
+    try:
+        response = session.get(url, timeout=20, force_refresh=True)
+    except requests.RequestException as e:
+        logger.warning(f"⚠️ Request for '{keyword}' page {page} failed: {e}")
+        return None
+    
+    if response.status_code in (429, 503):
+        UPWORK_RATE_LIMITER.on_throttle()
+    if response.status_code != 200 or is_challenge_page(response):
+        logger.info(f"🛡️ '{keyword}' page {page} blocked (status {response.status_code})")
+        return None
+    
+    UPWORK_RATE_LIMITER.on_success()
+    return response.text
+
+def fetch_upwork_search_pages(keywords: List[str], pages: int = 1,
+                              max_age_s: int = UPWORK_CACHE_MAX_AGE) -> Dict[Tuple[str, int], str]:
+    """
+    Fetch the search pages of every keyword in parallel
+    
+    Args:
+        keywords: List of search keywords
+        pages: Result pages to fetch per keyword
+        max_age_s: Oldest cached page to reuse, in seconds; 0 forces fresh fetches
+        
+    Returns:
+        Page HTML keyed by (keyword, page); pages that could not be fetched are missing
+    """
+    targets = [(keyword, page) for keyword in keywords for page in range(1, pages + 1)]
+    
+    with ThreadPoolExecutor(max_workers=UPWORK_MAX_WORKERS) as executor:
+        results = executor.map(lambda target: fetch_upwork_search_page(*target, max_age_s), targets)
+        return {target: html for target, html in zip(targets, results) if html}
+
+def parse_upwork_pages(pages_html: Dict[Tuple[str, int], str]) -> Dict[Tuple[str, int], List[Dict[str, Any]]]:
+    """
+    Parse fetched search pages, in parallel processes when there are many
+    
+    Parsing is CPU-bound, so threads would contend for the GIL. Results are
+    gathered back in this process, which stays the only writer.
+    
+    Args:
+        pages_html: Page HTML keyed by (keyword, page)
+        
+    Returns:
+        Parsed jobs keyed by (keyword, page)
+    """
+    targets = list(pages_html)
+    htmls = [pages_html[target] for target in targets]
+    keywords = [keyword for keyword, page in targets]
+    page_numbers = [page for keyword, page in targets]
+    
+    workers = min(os.cpu_count() or 1, len(targets))
+    if len(targets) >= UPWORK_PARSE_PROCESS_MIN_PAGES and workers > 1:
+        try:
+            # Spawned, not forked: this process already runs fetch (and in the
+            # Flask app, logging) threads whose held locks a fork would copy
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+                results = list(executor.map(parse_upwork_html, htmls, keywords, page_numbers))
+            return dict(zip(targets, results))
+        except Exception as e:
+            logger.warning(f"⚠️ Parallel parsing failed ({e}), parsing pages in-process")
+    
+    return {target: parse_upwork_html(html, keyword, page)
+            for target, html, keyword, page in zip(targets, htmls, keywords, page_numbers)}
+
+def scrape_upwork_http(keywords: List[str], pages: int = 1,
+                       max_age_s: int = UPWORK_CACHE_MAX_AGE) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Scrape Upwork search pages over plain HTTP
+    
+    Args:
+        keywords: List of search keywords
+        pages: Result pages to fetch per keyword
+        max_age_s: Oldest cached page to reuse, in seconds; 0 forces fresh fetches
+        
+    Returns:
+        The parsed jobs, and the keywords that yielded none (blocked or no
+        recognizable job cards), left for the browser
+    """
+    logger.info(f"🌐 Fetching {len(keywords) * pages} search pages directly...")
+    pages_html = fetch_upwork_search_pages(keywords, pages, max_age_s)
+    pages_jobs = parse_upwork_pages(pages_html)
+    
+    all_jobs = []
+    missing_keywords = []
+    for keyword in keywords:
+        keyword_jobs = []
+        for page in range(1, pages + 1):
+            keyword_jobs.extend(pages_jobs.get((keyword, page), []))
+        
+        if keyword_jobs:
+            all_jobs.extend(keyword_jobs)
+        else:
+            missing_keywords.append(keyword)
+    
+    logger.info(f"🌐 Direct fetch: {len(all_jobs)} jobs, {len(missing_keywords)} keywords left for the browser")
+    return all_jobs, missing_keywords
+
 def scrape_upwork_guaranteed(keywords: List[str]) -> List[Dict[str, Any]]:
     """
     SLOW & TRACKED method - Uses proper delays and URL tracking
@@ -714,13 +1014,16 @@ def generate_simulated_upwork_jobs(keyword: str, page: int) -> List[Dict[str, An
     
     return jobs
 
-def collect_all_upwork_data(keywords: List[str], use_real_browser: bool = True) -> Dict[str, Any]:
+def collect_all_upwork_data(keywords: List[str], use_real_browser: bool = True, pages: int = 1,
+                            max_age_s: int = UPWORK_CACHE_MAX_AGE) -> Dict[str, Any]:
     """
     Collect Upwork job data for all specified keywords
     
     Args:
         keywords: List of search keywords
         use_real_browser: ALWAYS True - only real data is collected
+        pages: Result pages to fetch per keyword over plain HTTP
+        max_age_s: Oldest cached search page to reuse, in seconds; 0 forces a fresh scrape
         
     Returns:
         Dictionary containing all collected REAL job data
@@ -732,8 +1035,12 @@ def collect_all_upwork_data(keywords: List[str], use_real_browser: bool = True)
         logger.warning("⚠️ Forcing real browser mode - no simulated data allowed!")
         use_real_browser = True
     
-    logger.info("🎯 Using REAL browser automation (100% guaranteed)")
-    all_jobs = scrape_upwork_guaranteed(keywords)
+    # Fetch search pages directly in parallel first; only the keywords that
+    # yield nothing go through the slow browser
+    all_jobs, blocked_keywords = scrape_upwork_http(keywords, pages, max_age_s)
+    if blocked_keywords:
+        logger.info(f"🎯 Using REAL browser automation for {len(blocked_keywords)} keywords (100% guaranteed)")
+        all_jobs.extend(scrape_upwork_guaranteed(blocked_keywords))
     
     collection_stats = {
         'total_jobs': len(all_jobs),
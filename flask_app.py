@@ -25,6 +25,7 @@ from config import (
     CHART_COLORS,
     DASHBOARD_CONFIG
 )
+from data_persistence import iter_interest_records, load_google_trends_data
 
 def add_no_cache_headers(response):
     """Add cache control headers to prevent caching"""
@@ -245,7 +246,7 @@ def create_keyword_frequency_chart_data(data: dict) -> dict:
             
             # Count Twitter tweets
             twitter_tweets = data.get('twitter_data', [])
-            twitter_count = len([t for t in twitter_tweets if t.get('keyword') == keyword])
+            twitter_count = len([t for t in twitter_tweets if t.get('search_keyword', t.get('keyword')) == keyword])
             twitter_counts.append(twitter_count)
         
         return {
@@ -585,31 +586,30 @@ def load_data():
         
         # Load Google Trends data
         try:
-            with open(DATA_PATHS['raw_google_data'], 'r', encoding='utf-8') as f:
-                google_data = json.load(f)
+            google_data = load_google_trends_data()
+            
+            if 'interest_over_time' in google_data:
+                transformed_google = {
+                    'interest_data': [],
+                    'related_queries': []
+                }
+                
+                # Process interest over time data
+                for group_name, group_data in google_data['interest_over_time'].items():
+                    data_points = group_data.get('data', [])
+                    for point in iter_interest_records(data_points):
+                        date = point.get('date', '')
+                        values = {k: v for k, v in point.items() if k != 'date' and isinstance(v, (int, float))}
+                        if values:
+                            transformed_google['interest_data'].append({
+                                'date': date,
+                                'values': values
+                            })
+                
+                all_data['google_trends_data'] = transformed_google
+            else:
+                all_data['google_trends_data'] = google_data
                 
-                if 'interest_over_time' in google_data:
-                    transformed_google = {
-                        'interest_data': [],
-                        'related_queries': []
-                    }
-                    
-                    # Process interest over time data
-                    for group_name, group_data in google_data['interest_over_time'].items():
-                        data_points = group_data.get('data', [])
-                        for point in data_points:
-                            date = point.get('date', '')
-                            values = {k: v for k, v in point.items() if k != 'date' and isinstance(v, (int, float))}
-                            if values:
-                                transformed_google['interest_data'].append({
-                                    'date': date,
-                                    'values': values
-                                })
-                    
-                    all_data['google_trends_data'] = transformed_google
-                else:
-                    all_data['google_trends_data'] = google_data
-                    
         except FileNotFoundError:
             all_data['google_trends_data'] = {}
         
@@ -0,0 +1,89 @@
+"""
+Rate Limiting
+=============
+
+Thread-safe token bucket shared by the collectors, so parallel workers
+hitting the same API stay inside one request budget.
+
+Author: Web Scraping Project
+"""
+
+import time
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket for spacing out API requests
+    
+    Callers only sleep when the bucket is empty, so a request that follows
+    a slow one is not padded with a fixed delay on top. The delay between
+    requests adapts multiplicatively: each success shortens it by 10%,
+    each throttling response doubles it.
+    """
+    
+    def __init__(self, rate_per_sec: float, burst: int = 1,
+                 min_delay: float = 0.1, max_delay: float = 60.0, name: str = 'API'):
+        """
+        Args:
+            rate_per_sec (float): Initial number of requests per second
+            burst (int): Number of requests allowed back-to-back
+            min_delay (float): Shortest delay between requests, in seconds
+            max_delay (float): Longest delay between requests, in seconds
+            name (str): Service name used in log messages
+        """
+        self.rate = rate_per_sec
+        self.burst = burst
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.name = name
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            # A negative balance reserves a future slot for this caller
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        
+        if wait > 0:
+            time.sleep(wait)
+    
+    @property
+    def delay(self) -> float:
+        """Current delay between requests, in seconds"""
+        return 1 / self.rate
+    
+    def on_success(self) -> None:
+        """Gentle increase: shorten the delay by 10% after a successful request"""
+        with self._lock:
+            self.rate = 1 / max(self.min_delay, self.delay * 0.9)
+    
+    def on_throttle(self) -> None:
+        """Sharp decrease: halve the rate after a 429/503"""
+        with self._lock:
+            self.rate = 1 / min(self.max_delay, self.delay * 2)
+        logger.info(f"🐢 {self.name} throttled, request delay now {self.delay:.1f}s")
+    
+    def pace(self, remaining: float, reset_seconds: float) -> None:
+        """
+        Spread the remaining request budget evenly over the reset window
+        
+        For APIs that report their budget in response headers (e.g. Reddit's
+        X-Ratelimit-Remaining / X-Ratelimit-Reset).
+        
+        Args:
+            remaining (float): Requests left in the current window
+            reset_seconds (float): Seconds until the window resets
+        """
+        delay = reset_seconds / max(1.0, remaining)
+        with self._lock:
+            self.rate = 1 / min(self.max_delay, max(self.min_delay, delay))
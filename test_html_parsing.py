@@ -1,11 +1,36 @@
 #!/usr/bin/env python3
 """
-Test script to verify extraction functions work with actual Upwork HTML
+Test script to verify extraction functions work with actual Upwork and Nitter HTML
 """
 
 from bs4 import BeautifulSoup
 import re
 
+from fetch_twitter_nitter import NitterScraper
+
+# Nitter timeline item; {stats} is the body of its tweet-stats div
+SAMPLE_NITTER_TWEET = '''
+<div class="timeline-item">
+    <div class="tweet-header">
+        <a class="fullname" href="/pydev">Python Dev</a>
+        <a class="username" href="/pydev">@pydev</a>
+        <span class="tweet-date"><a href="/pydev/status/1">2h</a></span>
+    </div>
+    <div class="tweet-content media-body">Shipping a new #python scraper with @friend today</div>
+    <div class="tweet-stats">{stats}</div>
+</div>
+'''
+
+def nitter_stat(icon: str, count: str) -> str:
+    """One engagement counter as Nitter renders it"""
+    return (f'<span class="tweet-stat"><div class="icon-container">'
+            f'<span class="icon-{icon}" title=""></span> {count}</div></span>')
+
+def extract_nitter_tweet(html: str):
+    """Run the Nitter extractor on the first timeline item of a snippet"""
+    container = BeautifulSoup(html, 'lxml').select_one('.timeline-item')
+    return NitterScraper()._extract_tweet_from_nitter(container, 'python')
+
 def test_html_extraction():
     """Test extraction using the actual Upwork HTML structure"""
     
@@ -57,7 +82,7 @@ def test_html_extraction():
     </div>
     '''
     
-    soup = BeautifulSoup(sample_html, 'html.parser')
+    soup = BeautifulSoup(sample_html, 'lxml')
     
     print("🧪 Testing HTML Extraction Functions")
     print("=" * 50)
@@ -149,5 +174,63 @@ def test_html_extraction():
             else:
                 print(f"   Payment status: Unknown (new account)")
 
+def test_nitter_stats():
+    """Engagement counters are read by their icons, with thousands separators"""
+    stats = nitter_stat('comment', '1,204') + nitter_stat('retweet', '87') + nitter_stat('heart', '12,345')
+    tweet = extract_nitter_tweet(SAMPLE_NITTER_TWEET.format(stats=stats))
+    assert (tweet.reply_count, tweet.retweet_count, tweet.like_count) == (1204, 87, 12345)
+    assert tweet.hashtags == ['python']
+    assert tweet.mentions == ['friend']
+    
+    # A missing counter stays 0 instead of shifting the others
+    stats = nitter_stat('comment', '3') + nitter_stat('heart', '2,001')
+    tweet = extract_nitter_tweet(SAMPLE_NITTER_TWEET.format(stats=stats))
+    assert (tweet.reply_count, tweet.retweet_count, tweet.like_count) == (3, 0, 2001)
+    
+    # Icons in another order still land on the right fields
+    stats = nitter_stat('heart', '40') + nitter_stat('retweet', '5')
+    tweet = extract_nitter_tweet(SAMPLE_NITTER_TWEET.format(stats=stats))
+    assert (tweet.reply_count, tweet.retweet_count, tweet.like_count) == (0, 5, 40)
+    
+    # Without icons the numbers are taken in order
+    tweet = extract_nitter_tweet(SAMPLE_NITTER_TWEET.format(stats='<span>4</span> <span>5</span> <span>6</span>'))
+    assert (tweet.reply_count, tweet.retweet_count, tweet.like_count) == (4, 5, 6)
+    
+    # No stats at all
+    tweet = extract_nitter_tweet(SAMPLE_NITTER_TWEET.format(stats=''))
+    assert (tweet.reply_count, tweet.retweet_count, tweet.like_count) == (0, 0, 0)
+
+def test_nitter_field_ranking():
+    """Each tweet field comes from its best-ranked candidate, not the first element found"""
+    container = BeautifulSoup('''
+    <div class="timeline-item">
+        <strong id="bold-name">Bold name</strong>
+        <a id="profile-link" href="/pydev">pydev</a>
+        <span class="username" id="span-username">@span_user</span>
+        <a class="username" id="first-username" href="/pydev">@pydev</a>
+        <a class="username" id="second-username" href="/other">@other</a>
+        <time id="time-tag">2024-01-01</time>
+        <span class="tweet-date" id="tweet-date">Jan 1</span>
+        <p class="tweet-content" id="p-content">Paragraph text</p>
+        <div data-testid="tweetText" id="testid-content">Test id text</div>
+        <div class="tweet-text" id="div-text">Tweet text</div>
+    </div>
+    ''', 'lxml').select_one('.timeline-item')
+    
+    fields = NitterScraper()._find_tweet_fields(container)
+    found = {field: element.get('id') for field, element in fields.items()}
+    
+    assert found == {
+        # Best-ranked candidate, although lower-ranked ones come first
+        'username': 'first-username',
+        'time': 'tweet-date',
+        'content': 'div-text',
+        # Only the last candidate is present
+        'fullname': 'bold-name'
+        # No tweet-stats div: no 'stats' entry
+    }
+
 if __name__ == "__main__":
-    test_html_extraction() 
\ No newline at end of file
+    test_html_extraction()
+    test_nitter_stats()
+    test_nitter_field_ranking() 
\ No newline at end of file
@@ -8,6 +8,9 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from fetch_upwork_data_enhanced import collect_upwork_data_with_filters
+from fetch_upwork_data import JOB_CARD_XPATHS, JOB_FIELD_XPATHS, clean_text, parse_upwork_html, select_job_field
+from bs4 import BeautifulSoup
+import lxml.html
 import json
 import logging
 
@@ -15,6 +18,166 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# CSS selectors the XPaths replaced, in the same order
+CSS_JOB_CARD_SELECTORS = (
+    'article[data-test="job-tile"]',
+    '.job-tile',
+    '[data-test="JobTile"]',
+    'section[data-cy="job-tile"]'
+)
+CSS_JOB_FIELD_SELECTORS = {
+    'title': ('h2 a', 'h3 a', '.job-title a', '[data-test="job-title"] a'),
+    'description': (
+        '[data-test="job-description"]',
+        '.job-description',
+        'p[data-test="job-description-text"]'
+    ),
+    'budget': ('[data-test="budget"]', '.budget', 'strong[data-test="budget"]'),
+    'skills': ('[data-test="token"] span', '.skill-token', '[data-cy="skill-token"]'),
+    'posted_time': (
+        '[data-test="posted-on"]',
+        '.posted-on',
+        'small[data-test="job-posted-date"]'
+    ),
+    'experience_level': ('[data-test="experience-level"]', '.experience-level'),
+    'proposals': ('[data-test="proposal-count"]', '.proposal-count')
+}
+
+# One page per card structure, covering every field selector variant
+SAMPLE_UPWORK_PAGES = (
+    '''
+    <section class="results">
+        <article data-test="job-tile">
+            <div class="job-title"><a href="/jobs/decoy">Lower ranked title</a></div>
+            <h2 class="h5"><span><a href="/jobs/Python-scraper_~01abc123/">Python  web
+                scraper</a></span></h2>
+            <div data-test="job-description">Scrape <b>product</b> pages daily.</div>
+            <strong data-test="budget">Fixed-price - $1,500</strong>
+            <div data-test="token"><span>Python</span></div>
+            <div data-test="token"><span>Scrapy</span></div>
+            <small data-test="posted-on">Posted 2 hours ago</small>
+            <span data-test="experience-level">Expert</span>
+            <span data-test="proposal-count">Proposals: 10 to 15</span>
+        </article>
+        <article data-test="job-tile">
+            <h3><a href="/jobs/Data-entry_~02def456/">Data entry</a></h3>
+            <p class="job-description extra">Copy rows into a sheet.</p>
+            <div class="budget">Hourly: $10.00-$30.00</div>
+            <span class="skill-token">Excel</span>
+            <span class="skill-token">Data Entry</span>
+            <span class="posted-on">Posted 5 minutes ago</span>
+            <span class="experience-level">Entry level</span>
+            <span class="proposal-count">Less than 5</span>
+        </article>
+        <article data-test="job-tile">
+            <div class="job-title"><a href="/jobs/no-key">Logo design</a></div>
+            <p data-test="job-description-text">A logo for a bakery.</p>
+            <span class="budget-note">Budget to be agreed</span>
+            <span data-cy="skill-token">Illustrator</span>
+            <small data-test="job-posted-date">Posted yesterday</small>
+        </article>
+        <article data-test="job-tile">
+            <p>Card without a title</p>
+        </article>
+    </section>
+    ''',
+    '''
+    <div class="job-tile featured">
+        <div data-test="job-title"><a href="/jobs/Api_~03ghi789/">REST API</a></div>
+        <div class="job-description">Build a small API.</div>
+    </div>
+    ''',
+    '''
+    <div data-test="JobTile">
+        <h2><a href="/jobs/Bot_~04jkl012/">Discord bot</a></h2>
+    </div>
+    ''',
+    '''
+    <section data-cy="job-tile">
+        <h3><a href="/jobs/Etl_~05mno345/">ETL pipeline</a></h3>
+    </section>
+    '''
+)
+
+def css_field_text(card, field: str):
+    """Text of a job card field found with the CSS selectors, as the old parser read it"""
+    for selector in CSS_JOB_FIELD_SELECTORS[field]:
+        if field == 'skills':
+            found = card.select(selector)
+            if found:
+                return [clean_text(elem.get_text()) for elem in found]
+        else:
+            found = card.select_one(selector)
+            if found:
+                return clean_text(found.get_text())
+    return [] if field == 'skills' else None
+
+def xpath_field_text(card, field: str):
+    """Text of a job card field found with the compiled XPaths"""
+    if field == 'skills':
+        return [clean_text(elem.text_content()) for elem in select_job_field(card, field, select_all=True)]
+    found = select_job_field(card, field)
+    return clean_text(found.text_content()) if found is not None else None
+
+def test_job_card_xpaths():
+    """The lxml XPaths find the same cards and field text as the CSS selectors"""
+    assert set(JOB_FIELD_XPATHS) == set(CSS_JOB_FIELD_SELECTORS)
+    
+    for html in SAMPLE_UPWORK_PAGES:
+        soup = BeautifulSoup(html, 'lxml')
+        root = lxml.html.document_fromstring(html)
+        
+        css_cards = []
+        for selector in CSS_JOB_CARD_SELECTORS:
+            css_cards = soup.select(selector)
+            if css_cards:
+                break
+        xpath_cards = []
+        for xpath in JOB_CARD_XPATHS:
+            xpath_cards = root.xpath(xpath)
+            if xpath_cards:
+                break
+        assert len(css_cards) == len(xpath_cards) > 0
+        
+        for css_card, xpath_card in zip(css_cards, xpath_cards):
+            for field in CSS_JOB_FIELD_SELECTORS:
+                assert xpath_field_text(xpath_card, field) == css_field_text(css_card, field), field
+
+def test_parse_upwork_html():
+    """Parsed sample jobs keep their fields, with IDs that survive reordering"""
+    jobs = parse_upwork_html(SAMPLE_UPWORK_PAGES[0], 'python', 1)
+    
+    # The card without a title is skipped
+    assert [job['title'] for job in jobs] == ['Python web scraper', 'Data entry', 'Logo design']
+    
+    scraper, data_entry, logo = jobs
+    assert scraper['id'] == 'upwork_~01abc123'
+    assert scraper['url'] == 'https://www.upwork.com/jobs/Python-scraper_~01abc123/'
+    assert scraper['description'] == 'Scrape product pages daily.'
+    assert scraper['budget']['type'] == 'fixed'
+    assert scraper['budget']['min_amount'] == 1500.0
+    assert scraper['skills_required'] == ['Python', 'Scrapy']
+    assert scraper['job_details']['experience_level'] == 'Expert'
+    assert scraper['job_details']['proposals_count'] == 10
+    
+    assert data_entry['budget']['type'] == 'hourly'
+    assert (data_entry['budget']['min_amount'], data_entry['budget']['max_amount']) == (10.0, 30.0)
+    assert data_entry['skills_required'] == ['Excel', 'Data Entry']
+    assert data_entry['job_details']['proposals_count'] == 5
+    
+    # No job key in the link: hashed, and defaults for the missing fields
+    assert logo['id'].startswith('upwork_real_')
+    assert logo['budget']['type'] == 'unknown'
+    assert logo['job_details']['experience_level'] == 'Not specified'
+    assert logo['job_details']['proposals_count'] == 0
+    
+    # The same jobs at other positions (raw bytes this time) keep their IDs
+    page = lxml.html.fromstring(SAMPLE_UPWORK_PAGES[0])
+    first_card = page.xpath('//article')[0]
+    first_card.getparent().remove(first_card)
+    shifted = parse_upwork_html(lxml.html.tostring(page), 'python', 2)
+    assert [job['id'] for job in shifted] == [data_entry['id'], logo['id']]
+
 def test_upwork_extraction():
     """Test the enhanced Upwork data extraction"""
     print("🧪 Testing Enhanced Upwork Data Extraction")
@@ -139,4 +302,6 @@ def test_upwork_extraction():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    test_job_card_xpaths()
+    test_parse_upwork_html()
     test_upwork_extraction() 
\ No newline at end of file
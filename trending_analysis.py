@@ -73,6 +73,7 @@ except ImportError:
     }
 
 from config import TRENDING_CONFIG, DATA_PATHS, ensure_data_directory
+from data_persistence import load_google_trends_data
 
 # Set up logging with UTF-8 encoding to handle emojis
 logging.basicConfig(
@@ -554,11 +555,10 @@ def load_all_data_sources() -> Dict[str, Any]:
     
     # Load Google Trends data
     try:
-        with open(DATA_PATHS['raw_google_data'], 'r', encoding='utf-8') as f:
-            google_data = json.load(f)
-            all_data['google_trends_data'] = google_data
-            queries_count = len(google_data.get('related_queries', []))
-            logger.info(f"✅ Loaded Google Trends data: {queries_count} query groups")
+        google_data = load_google_trends_data()
+        all_data['google_trends_data'] = google_data
+        queries_count = len(google_data.get('related_queries', []))
+        logger.info(f"✅ Loaded Google Trends data: {queries_count} query groups")
     except FileNotFoundError:
         logger.warning("❌ Google Trends data not found")
         all_data['google_trends_data'] = {}